@@ -0,0 +1,43 @@
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.models import TokenUser as BaseTokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+
+class TokenUser(BaseTokenUser):
+    """
+    User built from the claims of a validated access token.
+
+    `id` and `type` are all our permissions need, and both travel in the
+    token (see `TokenObtainPairSerializer`), so authenticating a request
+    costs no query. Anything else is read from the `User` row, which is
+    loaded on first access only.
+    """
+
+    # simplejwt >= 5.5 issues the claim as a string, compared against the
+    # integer foreign keys of our models
+    @cached_property
+    def id(self):
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def type(self):
+        if 'type' in self.token:
+            return self.token['type']
+
+        # Tokens issued before the claim was added
+        return self.user.type
+
+    @cached_property
+    def user(self):
+        from authentication.models import User
+
+        return User.objects.get(pk=self.id)
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+
+        if attr in self.token:
+            return self.token[attr]
+
+        return getattr(self.user, attr)
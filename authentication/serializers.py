@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from rest_framework.exceptions import ValidationError
+from rest_framework_simplejwt import serializers as jwt_serializers
 from django.contrib.auth import password_validation
 from authentication.models import User
 
@@ -59,3 +60,14 @@ class UserSerializer(serializers.ModelSerializer):
         user.save()
 
         return user
+
+
+class TokenObtainPairSerializer(jwt_serializers.TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+
+        # Lets `authentication.authentication.TokenUser` skip the user lookup
+        token['type'] = user.type
+
+        return token
@@ -1,6 +1,9 @@
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+from authentication.authentication import TokenUser
+from authentication.contracts import UserTypes
 from authentication.models import User
 
 
@@ -33,3 +36,48 @@ class RegisterViewTest(APITestCase):
         self.assertEqual(User.objects.count(), 1)
         self.assertEqual(User.objects.get().email, 'admin@test.com')
         self.assertEqual(User.objects.get().username, 'john_doe')
+
+
+class StatelessTokenAuthenticationTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create(username='manager', type=UserTypes.MANAGER)
+        self.user.set_password('secret_1234_56')
+        self.user.save()
+
+    def obtain_access_token(self) -> str:
+        response = self.client.post(reverse('token-obtain-pair'), {
+            'username': 'manager',
+            'password': 'secret_1234_56'
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['access']
+
+    def test_access_tokens_carry_the_user_type(self) -> None:
+        token = AccessToken(self.obtain_access_token())
+
+        self.assertEqual(token['type'], UserTypes.MANAGER)
+
+    def test_authenticated_requests_do_not_load_the_user(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.obtain_access_token())
+
+        # Validators aggregate and the page of applications, no user lookup
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('application-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_tokens_without_the_type_claim_fall_back_to_the_database(self) -> None:
+        token = AccessToken.for_user(self.user)
+        user = TokenUser(token)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.type, UserTypes.MANAGER)
+            self.assertEqual(user.email, self.user.email)
+
+    def test_token_users_have_the_integer_id_of_the_user(self) -> None:
+        user = TokenUser(AccessToken.for_user(self.user))
+
+        self.assertEqual(user.id, self.user.id)
+        self.assertEqual(user.pk, self.user.pk)
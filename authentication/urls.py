@@ -1,9 +1,9 @@
 from django.urls import path
 from authentication import views
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenRefreshView
 
 urlpatterns = [
-    path('token', TokenObtainPairView.as_view(), name='token-obtain-pair'),
+    path('token', views.TokenObtainPairView.as_view(), name='token-obtain-pair'),
     path('token/refresh', TokenRefreshView.as_view(), name='token-refresh'),
     path('register', views.RegisterView.as_view(), name='auth-register'),
 ]
@@ -1,8 +1,13 @@
 from authentication.models import User
-from authentication.serializers import UserSerializer
+from authentication.serializers import TokenObtainPairSerializer, UserSerializer
 from rest_framework import generics
+from rest_framework_simplejwt import views as jwt_views
 
 
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
+
+
+class TokenObtainPairView(jwt_views.TokenObtainPairView):
+    serializer_class = TokenObtainPairSerializer
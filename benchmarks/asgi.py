@@ -0,0 +1,224 @@
+"""
+Compares the throughput of the read endpoints under WSGI (gunicorn, sync
+views) and ASGI (uvicorn, the async views routed under `async/`).
+
+    python -m benchmarks.asgi --connections 10 50 200 --duration 10
+
+Both servers run against the configured database, which must be shared by
+processes (not an in-memory SQLite database). The benchmark data is
+committed while the servers run and deleted at the end.
+"""
+import os
+import sys
+import time
+import json
+import socket
+import asyncio
+import argparse
+import subprocess
+from benchmarks.utils import percentile, print_table, setup
+
+PASSWORD = 'benchmark_1234_56'
+
+PATHS = ('jobs', 'jobs/{job}', 'companies', 'companies/{company}', 'applications')
+
+
+def seed(jobs, applications):
+    from django.utils import timezone
+    from authentication.contracts import UserTypes
+    from authentication.models import User
+    from workflow.counters import reconcile_job_counters
+    from workflow.models import Application, Company, Job
+
+    manager = User.objects.create(username='benchmark-manager', type=UserTypes.MANAGER)
+    manager.set_password(PASSWORD)
+    manager.save()
+    applicant = User.objects.create(username='benchmark-applicant', type=UserTypes.APPLICANT)
+
+    company = Company.objects.create(name='Benchmark')
+    created = Job.objects.bulk_create([
+        Job(company=company, title=f'Job {n}', category='Engineering', description='Description',
+            published_at=timezone.now())
+        for n in range(jobs)
+    ])
+    Application.objects.bulk_create([
+        Application(applicant=applicant, job=created[n % jobs], description='Description')
+        for n in range(applications)
+    ])
+    # Bulk inserts skip the signals maintaining the job counters
+    reconcile_job_counters([job.pk for job in created])
+
+    return company, created[0], [manager, applicant]
+
+
+def cleanup(company, users):
+    for user in users:
+        user.applications.all().delete()
+        user.delete()
+    company.delete()
+
+
+def server_command(kind, port, workers, threads):
+    if kind == 'wsgi':
+        return [
+            sys.executable, '-m', 'gunicorn', 'workflow_backend.wsgi:application',
+            '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--threads', str(threads),
+            '--log-level', 'warning',
+        ]
+
+    return [
+        sys.executable, '-m', 'uvicorn', 'workflow_backend.asgi:application',
+        '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers),
+        '--log-level', 'warning', '--no-access-log',
+    ]
+
+
+def server_env(kind):
+    if kind == 'wsgi':
+        return os.environ
+
+    # Persistent connections leak under ASGI, see `DATABASES` in settings
+    return {**os.environ, 'DB_CONN_MAX_AGE': '0'}
+
+
+def wait_for_server(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+
+    raise RuntimeError(f'Server not listening on port {port} after {timeout}s')
+
+
+async def request(reader, writer, method, path, headers, body=b''):
+    lines = [f'{method} {path} HTTP/1.1', 'Host: 127.0.0.1', f'Content-Length: {len(body)}']
+    lines += [f'{name}: {value}' for name, value in headers.items()]
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode() + body)
+
+    status_line = await reader.readline()
+    length = 0
+    keep_alive = True
+    while (line := await reader.readline()) not in (b'\r\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+        elif name.lower() == 'connection' and value.strip().lower() == 'close':
+            keep_alive = False
+
+    content = await reader.readexactly(length)
+
+    return int(status_line.split()[1]), content, keep_alive
+
+
+async def obtain_token(port, username):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps({'username': username, 'password': PASSWORD}).encode()
+    status, content, _ = await request(reader, writer, 'POST', '/authentication/token',
+                                       {'Content-Type': 'application/json'}, body)
+    writer.close()
+
+    if status != 200:
+        raise RuntimeError(f'Token request failed with status {status}')
+
+    return json.loads(content)['access']
+
+
+async def connection_loop(port, path, headers, deadline, latencies, errors):
+    reader = writer = None
+    while time.monotonic() < deadline:
+        if writer is None:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        start = time.perf_counter()
+        try:
+            status, _, keep_alive = await request(reader, writer, 'GET', path, headers)
+        except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+            errors.append(path)
+            writer.close()
+            writer = None
+            continue
+
+        latencies.append(time.perf_counter() - start)
+        if status != 200:
+            errors.append(path)
+        if not keep_alive:
+            writer.close()
+            writer = None
+
+    if writer is not None:
+        writer.close()
+
+
+async def load(port, path, headers, connections, duration):
+    latencies, errors = [], []
+    deadline = time.monotonic() + duration
+
+    await asyncio.gather(*(
+        connection_loop(port, path, headers, deadline, latencies, errors)
+        for _ in range(connections)
+    ))
+
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--connections', type=int, nargs='+', default=[10, 50, 200])
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=4, help='gunicorn threads per worker')
+    parser.add_argument('--jobs', type=int, default=1_000)
+    parser.add_argument('--applications', type=int, default=5_000)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--paths', nargs='+', default=PATHS, choices=PATHS)
+    args = parser.parse_args()
+
+    setup()
+
+    from django.db import connection
+
+    company, job, users = seed(args.jobs, args.applications)
+    # The servers open their own connections
+    connection.close()
+
+    print(f'{connection.vendor}: {args.jobs} jobs, {args.applications} applications, '
+          f'{args.workers} workers, {args.duration}s per run')
+
+    rows = []
+    try:
+        for kind in ('wsgi', 'asgi'):
+            server = subprocess.Popen(server_command(kind, args.port, args.workers, args.threads), env=server_env(kind))
+            try:
+                wait_for_server(args.port)
+                token = asyncio.run(obtain_token(args.port, users[0].username))
+                headers = {'Authorization': f'Bearer {token}'}
+
+                for template in args.paths:
+                    path = '/' + ('async/' if kind == 'asgi' else '') + template.format(job=job.pk, company=company.pk)
+                    for connections in args.connections:
+                        latencies, errors = asyncio.run(load(args.port, path, headers, connections, args.duration))
+                        rows.append({
+                            'server': kind,
+                            'path': template,
+                            'connections': connections,
+                            'requests': len(latencies),
+                            'errors': len(errors),
+                            'req_s': len(latencies) / args.duration,
+                            'p50_ms': percentile(latencies, 0.50) * 1000 if latencies else 0.0,
+                            'p95_ms': percentile(latencies, 0.95) * 1000 if latencies else 0.0,
+                            'p99_ms': percentile(latencies, 0.99) * 1000 if latencies else 0.0,
+                        })
+            finally:
+                server.terminate()
+                server.wait()
+    finally:
+        cleanup(company, users)
+
+    print_table(rows)
+
+
+if __name__ == '__main__':
+    main()
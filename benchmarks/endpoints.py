@@ -0,0 +1,357 @@
+"""
+Measures the latency, throughput and SQL query count of every route of
+`workflow/urls.py` and `authentication/urls.py` on a seeded database.
+
+    python -m benchmarks.endpoints run --scale 0.01 --output results.json
+    python -m benchmarks.endpoints compare baseline.json results.json
+
+Data is generated by `workflow.seeding`, like the `seed` command: its
+default volumes (10k companies, 500k jobs, 5M applications) are multiplied
+by `--scale`. Data is seeded inside a transaction rolled back at the end,
+unless `--keep` commits it for later runs with `--reuse`.
+Requests go through the whole Django stack in-process, one at a time,
+authenticated with JWT access tokens; writes are rolled back after each
+request. See `benchmarks.asgi` for concurrent load through real servers.
+"""
+import sys
+import json
+import time
+import argparse
+import datetime
+import platform
+import tempfile
+import subprocess
+from collections import namedtuple
+from contextlib import nullcontext
+from benchmarks.utils import print_table, rolled_back, setup, summarize
+
+PASSWORD = 'benchmark_1234_56'
+RESUME = b'Senior Python engineer, Django and PostgreSQL.\n'
+# Prefix of the seeded usernames
+PREFIX = 'bench'
+
+Scenario = namedtuple('Scenario', ['name', 'route', 'kwargs', 'method', 'user', 'data', 'format', 'status'])
+Fixtures = namedtuple('Fixtures', [
+    'manager', 'applicant', 'company', 'job', 'application', 'resume_application', 'transition_ids'
+])
+
+
+def scenario(name, route, method='get', user=None, kwargs=None, data=None, format=None, status=200):
+    return Scenario(name, route, kwargs or {}, method, user, data, format, status)
+
+
+# Seeding
+
+def seed_database(scale, seed):
+    from django.contrib.auth.hashers import make_password
+    from workflow.seeding import make_plan, seed as seed_plan, volumes
+
+    counts = volumes(scale)
+    print('Seeding ' + ', '.join(f'{count} {name}' for name, count in counts.items()))
+
+    seed_plan(make_plan(seed=seed, prefix=PREFIX, password=make_password(PASSWORD), **counts))
+
+
+def load_fixtures():
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from authentication.models import User
+    from workflow.models import Application, Company, Job
+    from workflow.resumes import acquire_resume
+
+    manager = User.objects.get(username=f'{PREFIX}-manager-0')
+    applicant = User.objects.filter(
+        username__startswith=f'{PREFIX}-applicant-', applications__status='applied'
+    ).order_by('pk').first()
+    job = Job.objects.open().order_by('-applications_count', 'pk').first()
+    company = Company.objects.get(pk=job.company_id)
+
+    applications = Application.objects.filter(applicant=applicant, status='applied').order_by('pk')
+    application, resume_application = applications[0], applications.last()
+
+    if resume_application.resume_id is None:
+        resume_application.resume = acquire_resume(SimpleUploadedFile('resume.txt', RESUME))
+        resume_application.save(update_fields=['resume'])
+
+    # Stored by an earlier `--keep` run, possibly in another MEDIA_ROOT
+    storage = resume_application.resume.file.storage
+    if not storage.exists(resume_application.resume.file.name):
+        storage.save(resume_application.resume.file.name, SimpleUploadedFile('resume.txt', RESUME))
+
+    transition_ids = list(
+        Application.objects.filter(job=job, status='applied').order_by('pk').values_list('pk', flat=True)[:100]
+    )
+
+    return Fixtures(manager, applicant, company, job, application, resume_application, transition_ids)
+
+
+# Scenarios
+
+def scenarios(fixtures):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    company, job, application = fixtures.company.pk, fixtures.job.pk, fixtures.application.pk
+    new_job = {
+        'company': company,
+        'title': 'Senior Python developer',
+        'description': 'Build and maintain our hiring platform.',
+    }
+
+    return [
+        scenario('companies', 'company-list'),
+        scenario('create company', 'company-list', 'post', 'manager', data={'name': 'New company'}, status=201),
+        scenario('company', 'company-detail', kwargs={'pk': company}),
+        scenario('update company', 'company-detail', 'patch', 'manager', kwargs={'pk': company},
+                 data={'address': '2 Main Street'}),
+        scenario('company stats', 'company-stats', user='manager', kwargs={'pk': company}),
+        scenario('company jobs', 'company-job-list', kwargs={'pk': company}),
+        scenario('jobs (cached)', 'job-list'),
+        scenario('jobs', 'job-list', user='manager'),
+        scenario('jobs filtered', 'job-list', user='manager', data={'category': 'Data', 'status': 'open'}),
+        scenario('jobs search', 'job-list', user='manager', data={'q': 'python engineer'}),
+        scenario('create job', 'job-list', 'post', 'manager', data=new_job, status=201),
+        scenario('bulk create 100 jobs', 'job-bulk', 'post', 'manager', data=[new_job] * 100, status=201),
+        scenario('job (cached)', 'job-detail', kwargs={'pk': job}),
+        scenario('job', 'job-detail', user='manager', kwargs={'pk': job}),
+        scenario('publish job', 'job-detail', 'patch', 'manager', kwargs={'pk': job}),
+        scenario('close job', 'job-close', 'patch', 'manager', kwargs={'pk': job}),
+        scenario('applications (manager)', 'application-list', user='manager'),
+        scenario('applications (applicant)', 'application-list', user='applicant'),
+        scenario('applications search', 'application-list', user='manager', data={'q': 'python'}),
+        scenario('apply', 'application-list', 'post', 'applicant', status=201, format='multipart',
+                 data=lambda: {'job': job, 'applicant': fixtures.applicant.pk, 'description': 'Hello',
+                               'resume': SimpleUploadedFile('resume.txt', RESUME)}),
+        scenario('transition 100 applications', 'application-transition', 'post', 'manager',
+                 data={'status': 'in_review', 'ids': fixtures.transition_ids}),
+        scenario('application', 'application-detail', user='applicant', kwargs={'pk': application}),
+        scenario('update application', 'application-detail', 'patch', 'manager', kwargs={'pk': application},
+                 data={'status': 'in_review'}),
+        scenario('resume', 'application-resume', user='manager', kwargs={'pk': fixtures.resume_application.pk}),
+        scenario('cache stats', 'monitoring-cache', user='manager'),
+        scenario('database stats', 'monitoring-db', user='manager'),
+        scenario('profile token', 'monitoring-profile-token', 'post', 'manager', status=201),
+        scenario('metrics', 'metrics'),
+        scenario('async companies', 'async-company-list'),
+        scenario('async company', 'async-company-detail', kwargs={'pk': company}),
+        scenario('async jobs', 'async-job-list', user='manager'),
+        scenario('async job', 'async-job-detail', user='manager', kwargs={'pk': job}),
+        scenario('async applications', 'async-application-list', user='manager'),
+        scenario('obtain token', 'token-obtain-pair', 'post',
+                 data={'username': fixtures.manager.username, 'password': PASSWORD}),
+        scenario('refresh token', 'token-refresh', 'post', data=lambda: {'refresh': str(refresh_token(fixtures.manager))}),
+        scenario('register', 'auth-register', 'post', status=201, data={
+            'email': 'new.user@example.com', 'first_name': 'New', 'last_name': 'User',
+            'password': PASSWORD, 'password_confirmation': PASSWORD,
+        }),
+    ]
+
+
+def route_names():
+    from authentication.urls import urlpatterns as authentication_urls
+    from workflow.urls import urlpatterns as workflow_urls
+
+    return {pattern.name for pattern in [*workflow_urls, *authentication_urls] if pattern.name}
+
+
+def refresh_token(user):
+    from authentication.serializers import TokenObtainPairSerializer
+
+    return TokenObtainPairSerializer.get_token(user)
+
+
+def make_client(fixtures, user):
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    if user is not None:
+        # Like real clients: authenticated through a JWT access token
+        token = refresh_token(getattr(fixtures, user)).access_token
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    return client
+
+
+def send(client, scenario, url):
+    data = scenario.data() if callable(scenario.data) else scenario.data
+
+    if scenario.method == 'get':
+        return client.get(url, data)
+
+    request = getattr(client, scenario.method)
+    if scenario.method in ('post', 'patch') and scenario.format != 'multipart':
+        return request(url, data, format='json')
+
+    return request(url, data, format=scenario.format)
+
+
+def measure_scenario(fixtures, scenario, repeat, warmup):
+    from django.db import connection
+    from django.urls import reverse
+
+    client = make_client(fixtures, scenario.user)
+    url = reverse(scenario.route, kwargs=scenario.kwargs)
+    # Writes are rolled back, so every request sees the same data
+    isolated = rolled_back if scenario.method != 'get' else nullcontext
+
+    for _ in range(warmup):
+        with isolated():
+            send(client, scenario, url)
+
+    queries = []
+
+    # Counted around the cursor: requests reset `connection.queries`
+    def count(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with isolated(), connection.execute_wrapper(count):
+        response = send(client, scenario, url)
+
+    if response.status_code != scenario.status:
+        content = getattr(response, 'content', b'')[:300]
+        raise AssertionError(f'{scenario.name}: expected {scenario.status}, got {response.status_code} {content!r}')
+
+    samples = []
+    for _ in range(repeat):
+        with isolated():
+            start = time.perf_counter()
+            send(client, scenario, url)
+            samples.append(time.perf_counter() - start)
+
+    return {
+        'name': scenario.name,
+        'route': scenario.route,
+        'method': scenario.method.upper(),
+        'status': response.status_code,
+        'queries': len(queries),
+        **summarize(samples),
+        'req_s': len(samples) / sum(samples),
+    }
+
+
+# Results
+
+def metadata(args):
+    import django
+    from django.db import connection
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    from workflow.seeding import volumes
+
+    return {
+        'commit': commit,
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'database': connection.vendor,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'volumes': volumes(args.scale),
+        'repeat': args.repeat,
+        'warmup': args.warmup,
+    }
+
+
+def run(args):
+    setup()
+
+    from django.conf import settings
+    from django.test.utils import override_settings, setup_test_environment
+
+    # Allows the test client's host, and keeps emails in memory
+    setup_test_environment(debug=False)
+
+    media_root = args.media_root or (settings.MEDIA_ROOT if args.keep or args.reuse else tempfile.mkdtemp())
+    overrides = override_settings(
+        MEDIA_ROOT=media_root,
+        # Extraction runs in the current process, on commit only
+        RESUME_EXTRACTION={**settings.RESUME_EXTRACTION, 'WORKERS': 0},
+        # Development checks, off in production
+        QUERY_INSPECTION={**settings.QUERY_INSPECTION, 'ENABLED': False},
+        # Only the cost of requests that are not profiled
+        PROFILING={**settings.PROFILING, 'ENABLED': True, 'SAMPLE_RATE': 0},
+        # Recorded as in production, scraped without a token
+        METRICS={'ENABLED': True, 'TOKEN': None},
+    )
+
+    with overrides, (nullcontext() if args.keep else rolled_back()):
+        if not args.reuse:
+            seed_database(args.scale, args.seed)
+
+        fixtures = load_fixtures()
+        selected = [item for item in scenarios(fixtures) if not args.only or item.name in args.only]
+
+        missing = route_names() - {item.route for item in scenarios(fixtures)}
+        if missing:
+            print(f'Routes without scenario: {", ".join(sorted(missing))}', file=sys.stderr)
+
+        results = []
+        for item in selected:
+            results.append(measure_scenario(fixtures, item, args.repeat, args.warmup))
+            print(f'  {item.name}: {results[-1]["p50_ms"]:.2f} ms, {results[-1]["queries"]} queries', file=sys.stderr)
+
+    report = {'meta': metadata(args), 'results': results}
+    print_table([{key: row[key] for key in ('name', 'method', 'status', 'queries', 'p50_ms', 'p95_ms', 'p99_ms', 'req_s')}
+                 for row in results])
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f'Results written to {args.output}')
+
+
+def compare(args):
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.results) as file:
+        results = json.load(file)
+
+    print(f'{baseline["meta"]["commit"]} -> {results["meta"]["commit"]}')
+
+    previous = {row['name']: row for row in baseline['results']}
+    rows = []
+    for row in results['results']:
+        before = previous.get(row['name'])
+        if before is None:
+            continue
+
+        rows.append({
+            'name': row['name'],
+            'p50_ms': row['p50_ms'],
+            'p50_change_%': (row['p50_ms'] / before['p50_ms'] - 1) * 100,
+            'p95_ms': row['p95_ms'],
+            'p95_change_%': (row['p95_ms'] / before['p95_ms'] - 1) * 100,
+            'queries': f'{before["queries"]} -> {row["queries"]}',
+        })
+
+    print_table(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Seed the database and measure every route')
+    run_parser.add_argument('--scale', type=float, default=1.0, help='multiplies the default volumes')
+    run_parser.add_argument('--repeat', type=int, default=50)
+    run_parser.add_argument('--warmup', type=int, default=5)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--only', nargs='+', help='names of the scenarios to run')
+    run_parser.add_argument('--output', help='JSON file receiving the results')
+    run_parser.add_argument('--media-root', help='where the resume files are stored')
+    run_parser.add_argument('--keep', action='store_true', help='commit the seeded data')
+    run_parser.add_argument('--reuse', action='store_true', help='use data seeded by an earlier --keep run')
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('results')
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares DRF's stdlib JSON renderer and parser with the orjson-based ones
+of `workflow.renderers` / `workflow.parsers`, on `CompanySerializer`
+output (with the embedded jobs) and on bulk job bodies.
+
+    python -m benchmarks.rendering --companies 1000 --repeat 50
+
+Companies are inserted inside a transaction that is rolled back at the end.
+"""
+import io
+import argparse
+from benchmarks.utils import measure, print_table, rolled_back, setup, summarize
+
+
+def seed(companies, jobs_per_company):
+    from django.utils import timezone
+    from workflow.models import Company, Job
+
+    created = Company.objects.bulk_create([
+        Company(name=f'Company {n}', address='1 Main Street, Springfield') for n in range(companies)
+    ])
+    Job.objects.bulk_create([
+        Job(company=company, title=f'Job {n} at {company.name}', category='Engineering',
+            description='Build and maintain our platform. ' * 10, published_at=timezone.now())
+        for company in created
+        for n in range(jobs_per_company)
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--companies', type=int, default=1_000)
+    parser.add_argument('--jobs-per-company', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    setup()
+
+    from rest_framework import parsers, renderers
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+    from workflow.models import Company
+    from workflow.parsers import JSONParser
+    from workflow.renderers import JSONRenderer, orjson
+    from workflow.serializers import CompanySerializer
+
+    with rolled_back():
+        seed(args.companies, args.jobs_per_company)
+
+        request = Request(APIRequestFactory().get('/', HTTP_HOST='localhost'))
+        data = CompanySerializer(Company.objects.with_jobs_summary(), many=True, context={'request': request}).data
+
+    body = renderers.JSONRenderer().render(data)
+    bulk_body = renderers.JSONRenderer().render([job for company in data for job in company['jobs']])
+
+    print(f'orjson {"installed" if orjson is not None else "not installed"}: {args.companies} companies, '
+          f'{len(body) // 1024} KiB of JSON')
+
+    rows = []
+    for name, stdlib, fast, payload in (
+        ('render companies', renderers.JSONRenderer().render, JSONRenderer().render, data),
+        ('parse companies', parsers.JSONParser().parse, JSONParser().parse, body),
+        ('parse bulk jobs', parsers.JSONParser().parse, JSONParser().parse, bulk_body),
+    ):
+        baseline = None
+        for method, function in (('stdlib', stdlib), ('orjson', fast)):
+            if name.startswith('parse'):
+                samples = measure(lambda: function(io.BytesIO(payload)), args.repeat)
+            else:
+                samples = measure(lambda: function(payload), args.repeat)
+
+            summary = summarize(samples)
+            baseline = baseline or summary['p50_ms']
+            rows.append({'case': name, 'method': method, **summary, 'speedup': baseline / summary['p50_ms']})
+
+    print_table(rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Compares the job search subsystem with naive `icontains` filtering.
+
+    python -m benchmarks.search --jobs 500000 --repeat 20
+
+Jobs are inserted inside a transaction that is rolled back at the end.
+"""
+import random
+import argparse
+from benchmarks.utils import measure, print_table, rolled_back, setup, summarize, format_cell
+
+WORDS = (
+    'python', 'django', 'backend', 'frontend', 'react', 'data', 'engineer',
+    'analyst', 'manager', 'sales', 'account', 'marketing', 'designer', 'product',
+    'senior', 'junior', 'lead', 'cloud', 'devops', 'security', 'mobile', 'android',
+    'ios', 'support', 'customer', 'finance', 'legal', 'operations', 'research',
+    'machine', 'learning', 'platform', 'infrastructure', 'quality', 'recruiter',
+)
+
+# Synthetic long tail, so that most terms are selective like in real postings.
+RARE_WORDS = tuple(f'skill{n}' for n in range(20_000))
+
+CATEGORIES = ('Engineering', 'Data', 'Sales', 'Marketing', 'Design', 'Operations')
+
+QUERIES = ('python', 'data engineer', 'skill42', 'senior skill1234', 'machine learning skill7')
+
+
+def seed(count, batch_size, rng):
+    from workflow.models import Company, Job
+
+    company = Company.objects.create(name='Benchmark')
+    for start in range(0, count, batch_size):
+        Job.objects.bulk_create([
+            Job(
+                company=company,
+                title=' '.join(rng.choices(WORDS, k=3)),
+                category=rng.choice(CATEGORIES),
+                description=' '.join(rng.choices(WORDS, k=30) + rng.choices(RARE_WORDS, k=10)),
+            )
+            for _ in range(min(batch_size, count - start))
+        ])
+
+
+def icontains(text):
+    from django.db.models import Q
+    from workflow.models import Job
+
+    condition = Q()
+    for term in text.split():
+        condition &= Q(title__icontains=term) | Q(category__icontains=term) | Q(description__icontains=term)
+
+    return Job.objects.filter(condition).order_by('-created_at', '-id')
+
+
+def search(text):
+    from workflow.models import Job
+    from workflow.search import get_job_search
+
+    return get_job_search().search(Job.objects.all(), text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--jobs', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--page-size', type=int, default=25)
+    parser.add_argument('--batch-size', type=int, default=5_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    setup()
+
+    from django.db import connection
+    from workflow.search import get_job_search
+
+    with rolled_back():
+        seed(args.jobs, args.batch_size, random.Random(args.seed))
+
+        # The Python fallback builds its index on first use; time it apart.
+        build_time = measure(lambda: search(QUERIES[0]).exists(), 1)[0]
+        print(f'{connection.vendor}: {args.jobs} jobs, {type(get_job_search()).__name__} '
+              f'ready in {format_cell(build_time * 1000)} ms')
+
+        rows = []
+        for text in QUERIES:
+            for name, build in (('icontains', icontains), ('search', search)):
+                samples = measure(lambda: list(build(text)[:args.page_size]), args.repeat)
+                rows.append({'query': text, 'method': name, **summarize(samples)})
+
+        print_table(rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Compares the list representations built by the model serializers with
+the `.values()` path of `workflow.representations`.
+
+    python -m benchmarks.serialization --rows 10000 --repeat 10
+
+Rows are inserted inside a transaction that is rolled back at the end.
+"""
+import argparse
+from benchmarks.utils import measure, print_table, rolled_back, setup, summarize
+
+
+def seed(count, batch_size):
+    from django.utils import timezone
+    from authentication.models import User
+    from workflow.models import Application, Company, Job
+
+    company = Company.objects.create(name='Benchmark')
+    applicant = User.objects.create(username='benchmark-applicant')
+
+    jobs = []
+    for start in range(0, count, batch_size):
+        jobs += Job.objects.bulk_create([
+            Job(company=company, title=f'Job {n}', category='Engineering', description='Description ' * 20,
+                published_at=timezone.now())
+            for n in range(start, min(start + batch_size, count))
+        ])
+    for start in range(0, count, batch_size):
+        Application.objects.bulk_create([
+            Application(applicant=applicant, job=jobs[n], description='Description ' * 20)
+            for n in range(start, min(start + batch_size, count))
+        ])
+
+
+def make_request(user_type):
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+    from authentication.models import User
+
+    request = Request(APIRequestFactory().get('/'))
+    request.user = User(type=user_type)
+    return request
+
+
+def model_serializer(serializer_class, queryset, context):
+    return serializer_class(list(queryset), many=True, context=context).data
+
+
+def values_representation(serializer_class, queryset, context):
+    from workflow.representations import ValuesRepresentation
+
+    representation = ValuesRepresentation(serializer_class(context=context))
+    return [representation.to_representation(row) for row in queryset.values(*representation.columns)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=5_000)
+    args = parser.parse_args()
+
+    setup()
+
+    from django.db import connection
+    from authentication.contracts import UserTypes
+    from workflow.models import Application, Job
+    from workflow.serializers import ApplicationSerializer, JobSerializer
+
+    with rolled_back():
+        seed(args.rows, args.batch_size)
+        print(f'{connection.vendor}: {args.rows} rows per list')
+
+        cases = (
+            ('jobs (applicant)', JobSerializer, Job, UserTypes.APPLICANT),
+            ('jobs (manager)', JobSerializer, Job, UserTypes.MANAGER),
+            ('applications', ApplicationSerializer, Application, UserTypes.MANAGER),
+        )
+
+        rows = []
+        for name, serializer_class, model, user_type in cases:
+            context = {'request': make_request(user_type)}
+            queryset = model.objects.order_by('-created_at', '-id')[:args.rows]
+
+            baseline = None
+            for method, build in (('serializer', model_serializer), ('values', values_representation)):
+                samples = measure(lambda: build(serializer_class, queryset, context), args.repeat)
+                summary = summarize(samples)
+                baseline = baseline or summary['p50_ms']
+                rows.append({'list': name, 'method': method, **summary, 'speedup': baseline / summary['p50_ms']})
+
+        print_table(rows)
+
+
+if __name__ == '__main__':
+    main()
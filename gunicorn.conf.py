@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration, read from the working directory.
+
+Workers share their Prometheus metrics through PROMETHEUS_MULTIPROC_DIR
+(see `workflow.metrics`), which must be set in the environment.
+"""
+import os
+
+
+def on_starting(server):
+    # Values left by a previous run would be added to the new workers'
+    path = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if path:
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.endswith('.db'):
+                os.remove(os.path.join(path, name))
+
+
+def child_exit(server, worker):
+    from workflow.metrics import worker_exited
+
+    worker_exited(worker.pid)
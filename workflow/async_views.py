@@ -0,0 +1,219 @@
+import asyncio
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework import generics, permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from workflow.cache import BaseCachedResponseMixin
+from workflow.conditional import BaseConditionalGetMixin
+from workflow.filters import JobFilter, JobSearchFilter, ResumeSearchFilter
+from workflow.instrumentation import timed_serialization
+from workflow.models import Application, Company, Job
+from workflow.representations import ValuesListMixin, ValuesRepresentation
+from workflow.permissions import CanApplyToJobs, IsManagerOrReadOnly
+from workflow.serializers import ApplicationSerializer, CompanySerializer, JobSerializer
+from authentication.contracts import UserTypes
+
+
+class AsyncAPIView(APIView):
+    """
+    `APIView` whose handlers are coroutines, so that Django runs it without
+    a worker thread under ASGI.
+
+    Authentication, permission and throttling checks (which may query the
+    database) run in a thread; handlers only use the async ORM.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        # Lazy queries are not allowed in the event loop: tokens issued
+        # before the `type` claim read it from the database, do it here.
+        getattr(request.user, 'type', None)
+
+
+class AsyncGenericAPIView(AsyncAPIView, generics.GenericAPIView):
+    async def aget_queryset(self):
+        return self.get_queryset()
+
+    async def afilter_queryset(self, queryset):
+        # Filter backends may load state from the database (e.g. the
+        # in-process search index)
+        return await sync_to_async(self.filter_queryset)(queryset)
+
+    async def aget_object(self):
+        queryset = await self.afilter_queryset(await self.aget_queryset())
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+
+        await sync_to_async(self.check_object_permissions)(self.request, obj)
+
+        return obj
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+
+        return await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+
+
+class AsyncListAPIView(AsyncGenericAPIView):
+    async def get(self, request, *args, **kwargs):
+        queryset = await self.afilter_queryset(await self.aget_queryset())
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+        return Response(self.get_serializer([obj async for obj in queryset], many=True).data)
+
+
+class AsyncValuesListAPIView(ValuesListMixin, AsyncGenericAPIView):
+    async def get(self, request, *args, **kwargs):
+        representation = ValuesRepresentation(self.get_serializer())
+        queryset = await self.afilter_queryset(await self.aget_queryset())
+        queryset = self.get_values_queryset(queryset, representation)
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            with timed_serialization():
+                data = [representation.to_representation(row) for row in page]
+            return self.get_paginated_response(data)
+
+        return Response([representation.to_representation(row) async for row in queryset])
+
+
+class AsyncRetrieveAPIView(AsyncGenericAPIView):
+    async def get(self, request, *args, **kwargs):
+        return Response(self.get_serializer(await self.aget_object()).data)
+
+
+class AsyncConditionalGetMixin(BaseConditionalGetMixin):
+    async def get(self, request, *args, **kwargs):
+        queryset = await sync_to_async(self.get_conditional_queryset)()
+        values = await queryset.order_by().aaggregate(**self.get_validator_aggregates())
+        self.validators = self.make_validators(values)
+
+        response = self.get_not_modified_response(request)
+        if response is None:
+            response = await super().get(request, *args, **kwargs)
+
+        return self.add_validators(response)
+
+
+class AsyncCachedResponseMixin(BaseCachedResponseMixin):
+    async def get(self, request, *args, **kwargs):
+        if not self.use_response_cache(request):
+            return await super().get(request, *args, **kwargs)
+
+        key, response = await sync_to_async(self.get_cached_response)(request)
+        if response is not None:
+            return response
+
+        response = await super().get(request, *args, **kwargs)
+        await sync_to_async(self.cache_response)(key, response)
+
+        return response
+
+
+# Read-only counterparts of the views of `workflow.views`, routed under `async/`
+
+class AsyncCompanyList(AsyncConditionalGetMixin, AsyncListAPIView):
+    serializer_class = CompanySerializer
+    permission_classes = [
+        permissions.IsAuthenticatedOrReadOnly,
+        IsManagerOrReadOnly
+    ]
+
+    conditional_related = ('jobs',)
+
+    def get_queryset(self):
+        return Company.objects.with_jobs_summary()
+
+
+class AsyncCompanyDetail(AsyncCachedResponseMixin, AsyncConditionalGetMixin, AsyncRetrieveAPIView):
+    serializer_class = CompanySerializer
+    permission_classes = [
+        permissions.IsAuthenticatedOrReadOnly,
+        IsManagerOrReadOnly
+    ]
+
+    conditional_related = ('jobs',)
+
+    def get_cache_scopes(self):
+        return [f'company:{self.kwargs["pk"]}']
+
+    def get_queryset(self):
+        return Company.objects.with_jobs_summary()
+
+
+class AsyncJobList(AsyncCachedResponseMixin, AsyncConditionalGetMixin, AsyncValuesListAPIView):
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    filter_backends = [JobFilter, JobSearchFilter]
+    permission_classes = [
+        permissions.IsAuthenticatedOrReadOnly,
+        IsManagerOrReadOnly
+    ]
+
+    def get_cache_scopes(self):
+        return ['jobs']
+
+
+class AsyncJobDetail(AsyncCachedResponseMixin, AsyncConditionalGetMixin, AsyncRetrieveAPIView):
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    permission_classes = [
+        permissions.IsAuthenticatedOrReadOnly,
+        IsManagerOrReadOnly
+    ]
+
+    def get_cache_scopes(self):
+        return [f'job:{self.kwargs["pk"]}']
+
+
+class AsyncApplicationList(AsyncConditionalGetMixin, AsyncValuesListAPIView):
+    queryset = Application.objects.all()
+    serializer_class = ApplicationSerializer
+    filter_backends = [ResumeSearchFilter]
+    permission_classes = [
+        permissions.IsAuthenticated,
+        CanApplyToJobs
+    ]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.request.user.type != UserTypes.MANAGER:
+            queryset = queryset.filter(applicant_id=self.request.user.id)
+
+        return queryset
@@ -0,0 +1,133 @@
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+from workflow.cache import response_cache
+from workflow.contracts import application_transition_sources
+from workflow.counters import counter_deltas, update_job_counters
+from workflow.models import Company, Job
+from workflow.rollups import record_status_changes
+from workflow.search import get_job_search
+from workflow.serializers import JobSerializer
+
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+
+def create_jobs(items, chunk_size, context=None):
+    """
+    Validates `items` with `JobSerializer` and inserts the valid ones with
+    one `bulk_create` per chunk, all inside a single transaction.
+
+    Returns the created jobs and a list of `{'index', 'errors'}` entries for
+    the rejected items; invalid items never abort the batch.
+    """
+    created = []
+    errors = []
+
+    with transaction.atomic():
+        for start, chunk in chunked(items, chunk_size):
+            company_ids = set()
+            for item in chunk:
+                if isinstance(item, dict):
+                    try:
+                        company_ids.add(int(item.get('company')))
+                    except (TypeError, ValueError):
+                        pass
+
+            # Like `ListSerializer`, one serializer validates every item of
+            # the chunk, so its fields are only built once.
+            serializer = JobSerializer(context={
+                **(context or {}),
+                'related': {'company': Company.objects.in_bulk(company_ids)},
+            })
+
+            jobs = []
+            for index, item in enumerate(chunk, start):
+                if not isinstance(item, dict):
+                    errors.append({'index': index, 'errors': {'non_field_errors': ['Expected a JSON object.']}})
+                    continue
+
+                try:
+                    jobs.append(Job(**serializer.run_validation(item)))
+                except ValidationError as exc:
+                    errors.append({'index': index, 'errors': as_serializer_error(exc)})
+
+            created.extend(Job.objects.bulk_create(jobs))
+
+        # bulk_create bypasses the model signals, see `workflow.signals`
+        transaction.on_commit(lambda: after_jobs_created(created))
+
+    return created, errors
+
+
+def after_jobs_created(jobs):
+    get_job_search().index(jobs)
+    response_cache.invalidate('jobs', *{f'company:{job.company_id}' for job in jobs})
+
+
+def transition_applications(queryset, status, ids=None, limit=None):
+    """
+    Moves the applications of `queryset` (restricted to `ids` if given) to
+    `status` with a single `UPDATE ... WHERE id IN (...)` over the rows that
+    were locked in a status allowed to transition to it.
+
+    Without `ids`, only the applications that can move are considered, at
+    most `limit` of them in id order.
+
+    Returns the ids of the updated applications, a list of `{'id',
+    'errors'}` entries for the rejected ones (including unknown ids), and
+    whether applications beyond `limit` are left to move.
+    """
+    sources = application_transition_sources(status)
+    if ids is not None:
+        queryset = queryset.filter(pk__in=ids)
+    else:
+        # Rows that cannot move would be read again by every following call
+        queryset = queryset.filter(status__in=sources)
+
+    with transaction.atomic():
+        rows = queryset.select_for_update().order_by('pk').values_list('pk', 'status', 'job_id', 'created_at')
+        if limit is not None:
+            # One more row tells whether others are left
+            rows = rows[:limit + 1]
+
+        current = {pk: row for pk, *row in rows}
+        has_more = limit is not None and len(current) > limit
+        if has_more:
+            current.popitem()
+
+        # Only the rows read above, locked in the status they were read
+        # with: rows committed since then are left for a following call, so
+        # the report, the counters and the rollups match what the UPDATE
+        # changed.
+        moved = [(pk, *row) for pk, row in current.items() if row[0] in sources]
+        if moved:
+            queryset.model._default_manager.filter(pk__in=[pk for pk, *_ in moved]).update(
+                status=status,
+                updated_at=timezone.now()
+            )
+
+        update_job_counters(counter_deltas(
+            removed=[(job_id, current_status) for _, current_status, job_id, _ in moved],
+            added=[(job_id, status) for _, _, job_id, _ in moved]
+        ))
+        record_status_changes([(pk, job_id, status, False, created_at) for pk, _, job_id, created_at in moved])
+
+    updated = []
+    rejected = []
+    for pk, (current_status, _, _) in current.items():
+        if current_status in sources:
+            updated.append(pk)
+        elif current_status == status:
+            rejected.append({'id': pk, 'errors': [f'The application is already "{status}".']})
+        else:
+            rejected.append({'id': pk, 'errors': [f'An application cannot move from "{current_status}" to "{status}".']})
+
+    for pk in dict.fromkeys(ids or ()):
+        if pk not in current:
+            rejected.append({'id': pk, 'errors': ['Not found.']})
+
+    return updated, rejected, has_more
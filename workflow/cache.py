@@ -0,0 +1,136 @@
+import time
+import hashlib
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+from workflow.conditional import set_validators
+from workflow.metrics import count_cache_lookup
+
+VERSION_KEY = 'workflow:version:%s'
+RESPONSE_KEY = 'workflow:response:%s:%s'
+STATS_KEY = 'workflow:stats:%s'
+
+
+class ResponseCache:
+    """
+    Versioned cache of anonymous read responses.
+
+    Every cached response depends on one or more scopes (e.g. `jobs`,
+    `job:12`, `company:3`). Each scope has a version number stored in the
+    cache and embedded in the response keys, so invalidating a scope is a
+    single `incr` that makes every dependent entry unreachable at once.
+    """
+
+    @property
+    def cache(self):
+        return caches[settings.RESPONSE_CACHE['ALIAS']]
+
+    @property
+    def enabled(self):
+        return settings.RESPONSE_CACHE['ENABLED']
+
+    def get_versions(self, scopes):
+        keys = {VERSION_KEY % scope: scope for scope in scopes}
+        versions = self.cache.get_many(keys)
+
+        for key in keys.keys() - versions.keys():
+            # A missing version (never set or evicted) must never collide
+            # with a version that was used before, hence the timestamp.
+            self.cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = self.cache.get(key)
+
+        return [f'{keys[key]}={versions[key]}' for key in sorted(keys)]
+
+    def invalidate(self, *scopes):
+        for scope in scopes:
+            key = VERSION_KEY % scope
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.add(key, time.time_ns(), timeout=None)
+
+    def get_key(self, request, scopes):
+        versions = ';'.join(self.get_versions(scopes))
+        url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+
+        return RESPONSE_KEY % (versions, url)
+
+    def get(self, key):
+        entry = self.cache.get(key)
+        self.count('hits' if entry is not None else 'misses')
+        count_cache_lookup(entry is not None)
+
+        return entry
+
+    def set(self, key, data):
+        self.cache.set(key, data, timeout=settings.RESPONSE_CACHE['TIMEOUT'])
+
+    def count(self, name):
+        key = STATS_KEY % name
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            if not self.cache.add(key, 1, timeout=None):
+                self.cache.incr(key)
+
+    def stats(self):
+        names = ('hits', 'misses')
+        values = self.cache.get_many([STATS_KEY % name for name in names])
+        stats = {name: values.get(STATS_KEY % name, 0) for name in names}
+
+        total = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / total if total else 0.0
+
+        return stats
+
+
+response_cache = ResponseCache()
+
+
+class BaseCachedResponseMixin:
+    """
+    Serves GET requests of anonymous users from the response cache.
+
+    Views declare the scopes their representation depends on through
+    `get_cache_scopes`; the scopes are invalidated by `workflow.signals`.
+    Validators computed by `ConditionalGetMixin` are cached along with the
+    data, so cached responses are revalidated without any query.
+    """
+
+    def get_cache_scopes(self):
+        raise NotImplementedError
+
+    def use_response_cache(self, request):
+        return response_cache.enabled and not request.user.is_authenticated
+
+    def get_cached_response(self, request):
+        key = response_cache.get_key(request, self.get_cache_scopes())
+        entry = response_cache.get(key)
+        if entry is None:
+            return key, None
+
+        data, etag, last_modified = entry
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+        return key, set_validators(response or Response(data), etag, last_modified)
+
+    def cache_response(self, key, response):
+        if response.status_code == 200:
+            etag, last_modified = getattr(self, 'validators', (None, None))
+            response_cache.set(key, (response.data, etag, last_modified))
+
+
+class CachedResponseMixin(BaseCachedResponseMixin):
+    def get(self, request, *args, **kwargs):
+        if not self.use_response_cache(request):
+            return super().get(request, *args, **kwargs)
+
+        key, response = self.get_cached_response(request)
+        if response is not None:
+            return response
+
+        response = super().get(request, *args, **kwargs)
+        self.cache_response(key, response)
+
+        return response
@@ -0,0 +1,49 @@
+import os
+import threading
+from collections import Counter
+from django.conf import settings
+from django.db import connections
+
+_lock = threading.Lock()
+_opened = Counter()
+
+
+def count_connection(alias):
+    with _lock:
+        _opened[alias] += 1
+
+
+def database_stats():
+    """
+    Connection reuse and pool utilization of the current worker process,
+    per database alias.
+    """
+    stats = {'pid': os.getpid(), 'pooling': settings.DB_POOLING or None, 'databases': {}}
+
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, 'pool', None)
+
+        database = {
+            'vendor': connection.vendor,
+            'conn_max_age': connection.settings_dict['CONN_MAX_AGE'],
+            'conn_health_checks': connection.settings_dict['CONN_HEALTH_CHECKS'],
+            'server_side_cursors': not connection.settings_dict.get('DISABLE_SERVER_SIDE_CURSORS', False),
+            'connections_opened': _opened[alias],
+            'pool': None,
+        }
+
+        if pool is not None:
+            values = pool.get_stats()
+            # Django sends `connection_created` on every checkout from the
+            # pool: the pool counts the server connections it opened
+            database['connections_opened'] = values.get('connections_num', 0)
+            database['pool'] = {
+                **values,
+                # Share of the maximum size currently lent to requests
+                'utilization': (values['pool_size'] - values['pool_available']) / values['pool_max'],
+            }
+
+        stats['databases'][alias] = database
+
+    return stats
@@ -24,3 +24,32 @@ class ApplicationStatuses(models.TextChoices):
     WAITING_FOR_ITW = 'waiting', 'Waiting for interview'
     OFFER = 'offer', 'Offer'
     DISQUALIFIED = 'disqualified', 'Disqualified'
+
+
+class ExtractionStatuses(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    DONE = 'done', 'Done'
+    FAILED = 'failed', 'Failed'
+
+
+# Statuses an application may move to from each status
+APPLICATION_TRANSITIONS = {
+    ApplicationStatuses.APPLIED: (ApplicationStatuses.IN_REVIEW, ApplicationStatuses.DISQUALIFIED),
+    ApplicationStatuses.IN_REVIEW: (ApplicationStatuses.WAITING_FOR_ITW, ApplicationStatuses.DISQUALIFIED),
+    ApplicationStatuses.WAITING_FOR_ITW: (ApplicationStatuses.OFFER, ApplicationStatuses.DISQUALIFIED),
+    ApplicationStatuses.OFFER: (),
+    ApplicationStatuses.DISQUALIFIED: (),
+}
+
+
+def application_transition_sources(status):
+    return [source for source, targets in APPLICATION_TRANSITIONS.items() if status in targets]
+
+
+# Stages of the hiring funnel, in order (disqualification ends it at any stage)
+APPLICATION_STAGES = (
+    ApplicationStatuses.APPLIED,
+    ApplicationStatuses.IN_REVIEW,
+    ApplicationStatuses.WAITING_FOR_ITW,
+    ApplicationStatuses.OFFER,
+)
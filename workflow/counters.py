@@ -0,0 +1,75 @@
+from collections import Counter
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+from workflow.models import APPLICATION_COUNTERS, Application, Job
+
+TOTAL_COUNTER = 'applications_count'
+
+
+def counter_deltas(removed=(), added=()):
+    """
+    Returns the counter changes of applications leaving (`removed`) and
+    entering (`added`) the counters, both given as `(job_id, status)` pairs.
+    """
+    deltas = Counter()
+    for sign, applications in ((-1, removed), (1, added)):
+        for job_id, status in applications:
+            deltas[job_id, TOTAL_COUNTER] += sign
+            deltas[job_id, APPLICATION_COUNTERS[status]] += sign
+
+    return deltas
+
+
+def update_job_counters(deltas):
+    """
+    Applies counter deltas with one `UPDATE ... SET counter = counter + n`
+    per job, so concurrent changes are never lost.
+    """
+    changes = {}
+    for (job_id, field), delta in deltas.items():
+        if delta:
+            changes.setdefault(job_id, {})[field] = F(field) + delta
+
+    # Sorted, so concurrent transactions lock the jobs in the same order
+    now = timezone.now()
+    for job_id in sorted(changes):
+        Job.objects.filter(pk=job_id).update(updated_at=now, **changes[job_id])
+
+
+def count_applications(job_ids):
+    """
+    Returns the actual counters of the given jobs, from `Application`.
+    """
+    counters = {job_id: dict.fromkeys([TOTAL_COUNTER, *APPLICATION_COUNTERS.values()], 0) for job_id in job_ids}
+
+    rows = Application.objects.filter(job_id__in=job_ids).order_by().values('job_id', 'status').annotate(
+        count=Count('pk')
+    )
+    for row in rows:
+        counters[row['job_id']][TOTAL_COUNTER] += row['count']
+        counters[row['job_id']][APPLICATION_COUNTERS[row['status']]] += row['count']
+
+    return counters
+
+
+def reconcile_job_counters(job_ids):
+    """
+    Recounts the applications of the given jobs and repairs the counters
+    that drifted. Returns the ids of the repaired jobs.
+    """
+    fields = [TOTAL_COUNTER, *APPLICATION_COUNTERS.values()]
+
+    with transaction.atomic():
+        # Locked first: changes committed meanwhile are either counted below
+        # or applied on top of the repaired counters.
+        stored = list(Job.objects.select_for_update().filter(pk__in=job_ids).order_by('pk').values_list('pk', *fields))
+        actual = count_applications(job_ids)
+
+        repaired = []
+        for job_id, *values in stored:
+            if dict(zip(fields, values)) != actual[job_id]:
+                Job.objects.filter(pk=job_id).update(updated_at=timezone.now(), **actual[job_id])
+                repaired.append(job_id)
+
+    return repaired
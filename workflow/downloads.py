@@ -0,0 +1,128 @@
+import re
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, quote_etag
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeFile:
+    """
+    Read-only view of `length` bytes of an open file from its current
+    position. It keeps `fileno`, so WSGI servers can still `sendfile` it
+    (bounded by the response Content-Length).
+    """
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = self.file.read(size)
+        self.remaining -= len(data)
+
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    Returns the `(start, end)` byte positions (inclusive) requested by a
+    single-range `Range` header, `None` when the header is absent or not
+    supported (e.g. multiple ranges), or raises `ValueError` when the range
+    cannot be satisfied.
+    """
+    match = RANGE_RE.match(header or '')
+    if match is None:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        return None
+
+    if not start:
+        # Suffix range: the last `end` bytes
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+
+    if start >= size or start > end:
+        raise ValueError('Range not satisfiable')
+
+    return start, end
+
+
+def serve_file(request, file, content_type, etag, last_modified, filename):
+    """
+    Responds with a stored file, honouring conditional requests and single
+    byte ranges. With `FILE_DOWNLOAD['OFFLOAD']` set, only the headers are
+    produced and the front proxy sends the file itself.
+    """
+    etag = quote_etag(etag)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return set_file_headers(response, etag, last_modified)
+
+    offload = settings.FILE_DOWNLOAD['OFFLOAD']
+    if offload is not None:
+        response = HttpResponse(content_type=content_type)
+        if offload == 'x-accel-redirect':
+            response['X-Accel-Redirect'] = settings.FILE_DOWNLOAD['ACCEL_REDIRECT_PREFIX'] + file.name
+        elif offload == 'x-sendfile':
+            response['X-Sendfile'] = file.path
+        else:
+            raise ImproperlyConfigured(f'Unknown FILE_DOWNLOAD offload mode: {offload}')
+
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+        return set_file_headers(response, etag, last_modified)
+
+    size = file.size
+    byte_range = None
+
+    # A stale If-Range asks for the whole (changed) file instead of a part
+    if_range = request.headers.get('If-Range')
+    if if_range is None or if_range in (etag, http_date(last_modified)):
+        try:
+            byte_range = parse_range(request.headers.get('Range'), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return set_file_headers(response, etag, last_modified)
+
+    file.open('rb')
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type, as_attachment=True, filename=filename)
+    else:
+        start, end = byte_range
+        file.seek(start)
+
+        response = FileResponse(
+            RangeFile(file, end - start + 1),
+            status=206,
+            content_type=content_type,
+            as_attachment=True,
+            filename=filename
+        )
+        response['Content-Length'] = end - start + 1
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+    return set_file_headers(response, etag, last_modified)
+
+
+def set_file_headers(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+
+    return response
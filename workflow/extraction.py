@@ -0,0 +1,123 @@
+import logging
+import threading
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from workflow.contracts import ExtractionStatuses
+from workflow.extractors import extract_text
+from workflow.models import ResumeBlob, ResumeToken
+from workflow.search import tokenize
+
+logger = logging.getLogger(__name__)
+
+TOKEN_MAX_LENGTH = ResumeToken._meta.get_field('token').max_length
+
+_lock = threading.Lock()
+_process_pool = None
+_dispatcher = None
+
+
+def create_process_pool(workers):
+    # Spawned rather than forked: the workers must not inherit the database
+    # connections of the web process.
+    return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def extract_resumes(blob_ids, executor=None):
+    """
+    Extracts the text of the given blobs in `executor` (a process pool, or
+    the current process if `None`), then stores it along with its token
+    index. Returns the number of blobs processed and failed.
+    """
+    blobs = list(ResumeBlob.objects.filter(pk__in=blob_ids).values_list('pk', 'file', 'content_type'))
+    if not blobs:
+        return 0, 0
+
+    storage = ResumeBlob._meta.get_field('file').storage
+    paths = [storage.path(name) for _, name, _ in blobs]
+    content_types = [content_type for _, _, content_type in blobs]
+
+    if executor is None:
+        results = map(extract_text, paths, content_types)
+    else:
+        results = executor.map(extract_text, paths, content_types)
+
+    failed = 0
+    for (blob_id, _, _), (ok, value) in zip(blobs, results):
+        if ok:
+            save_text(blob_id, value)
+        else:
+            save_error(blob_id, value)
+            failed += 1
+
+    return len(blobs), failed
+
+
+def save_text(blob_id, text):
+    with transaction.atomic():
+        updated = ResumeBlob.objects.filter(pk=blob_id).update(
+            text=text,
+            extraction_status=ExtractionStatuses.DONE,
+            extraction_attempts=F('extraction_attempts') + 1,
+            extraction_error=None
+        )
+        if not updated:
+            return
+
+        frequencies = Counter(token for token in tokenize(text) if len(token) <= TOKEN_MAX_LENGTH)
+
+        ResumeToken.objects.filter(blob_id=blob_id).delete()
+        ResumeToken.objects.bulk_create(
+            [ResumeToken(blob_id=blob_id, token=token, frequency=count) for token, count in frequencies.items()],
+            batch_size=1000
+        )
+
+
+def save_error(blob_id, error):
+    ResumeBlob.objects.filter(pk=blob_id).update(
+        extraction_status=ExtractionStatuses.FAILED,
+        extraction_attempts=F('extraction_attempts') + 1,
+        extraction_error=error
+    )
+
+
+def schedule_extraction(blob_ids):
+    """
+    Extracts the text of the given blobs in the background, outside the
+    request/response cycle. Failed blobs are retried by the
+    `extract_resumes` management command.
+    """
+    workers = settings.RESUME_EXTRACTION['WORKERS']
+    if not workers:
+        extract_resumes(blob_ids)
+        return
+
+    global _process_pool, _dispatcher
+    with _lock:
+        if _process_pool is None:
+            _process_pool = create_process_pool(workers)
+            # Waits for the results and stores them, one batch at a time
+            _dispatcher = ThreadPoolExecutor(1, thread_name_prefix='resume-extraction')
+
+    _dispatcher.submit(_extract_in_background, list(blob_ids))
+
+
+def _extract_in_background(blob_ids):
+    global _process_pool
+    try:
+        extract_resumes(blob_ids, _process_pool)
+    except BrokenProcessPool:
+        logger.exception('Resume extraction failed for blobs %s', blob_ids)
+        # Replaced by a new pool for the next batches
+        with _lock:
+            _process_pool.shutdown(wait=False)
+            _process_pool = create_process_pool(settings.RESUME_EXTRACTION['WORKERS'])
+    except Exception:
+        logger.exception('Resume extraction failed for blobs %s', blob_ids)
+    finally:
+        # Connections opened by this thread are never reused by requests
+        connections.close_all()
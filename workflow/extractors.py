@@ -0,0 +1,93 @@
+import unicodedata
+import zipfile
+from xml.etree import ElementTree
+
+try:
+    import pypdf
+except ImportError:  # PDF resumes are left unprocessed without it
+    pypdf = None
+
+# These functions run in the extraction worker processes: they only depend
+# on the standard library (and pypdf), never on Django.
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+MAX_TEXT_LENGTH = 1_000_000
+
+
+class ExtractionError(Exception):
+    pass
+
+
+def extract_txt(path):
+    with open(path, 'rb') as file:
+        return file.read(MAX_TEXT_LENGTH * 4).decode('utf-8', errors='replace')
+
+
+def extract_docx(path):
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise ExtractionError('Not a DOCX file.')
+
+    with archive:
+        try:
+            document = archive.open('word/document.xml')
+        except KeyError:
+            raise ExtractionError('Not a DOCX file.')
+
+        paragraphs = []
+        runs = []
+        for _, element in ElementTree.iterparse(document):
+            if element.tag == WORD_NAMESPACE + 't':
+                runs.append(element.text or '')
+            elif element.tag == WORD_NAMESPACE + 'tab':
+                runs.append('\t')
+            elif element.tag in (WORD_NAMESPACE + 'br', WORD_NAMESPACE + 'cr'):
+                runs.append('\n')
+            elif element.tag == WORD_NAMESPACE + 'p':
+                paragraphs.append(''.join(runs))
+                runs = []
+                element.clear()
+
+    return '\n'.join(paragraphs)
+
+
+def extract_pdf(path):
+    if pypdf is None:
+        raise ExtractionError('PDF extraction requires pypdf.')
+
+    try:
+        reader = pypdf.PdfReader(path)
+        return '\n'.join(page.extract_text() or '' for page in reader.pages)
+    except pypdf.errors.PdfReadError as exc:
+        raise ExtractionError(str(exc))
+
+
+EXTRACTORS = {
+    'application/pdf': extract_pdf,
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': extract_docx,
+    'text/plain': extract_txt,
+}
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKC', text)
+    lines = (' '.join(line.split()) for line in text.splitlines())
+
+    return '\n'.join(line for line in lines if line)[:MAX_TEXT_LENGTH]
+
+
+def extract_text(path, content_type):
+    """
+    Returns `(True, text)` with the normalized text of a file, or
+    `(False, error)` if it could not be extracted.
+    """
+    try:
+        extractor = EXTRACTORS.get(content_type)
+        if extractor is None:
+            raise ExtractionError(f'Unsupported content type: {content_type}.')
+
+        return True, normalize(extractor(path))
+    except Exception as exc:
+        return False, f'{type(exc).__name__}: {exc}'
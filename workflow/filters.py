@@ -0,0 +1,132 @@
+import datetime
+from django.db.models import Count
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from workflow.contracts import JobContracts, JobModalities, JobTypes
+from workflow.models import ResumeToken
+from workflow.search import get_job_search, tokenize
+
+
+class JobFilter(BaseFilterBackend):
+    """
+    Translates the job board query parameters into SQL predicates.
+
+    Every predicate is backed by one of the `Job` indexes. Choice filters
+    accept a comma separated list of values (`?contract=permanent,fixed`).
+    """
+    statuses = ('open', 'published', 'closed')
+
+    choice_params = {
+        'contract': JobContracts,
+        'type': JobTypes,
+        'modalities': JobModalities,
+    }
+
+    date_params = {
+        'created_after': 'created_at__gte',
+        'created_before': 'created_at__lt',
+        'published_after': 'published_at__gte',
+        'published_before': 'published_at__lt',
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        errors = {}
+
+        status = params.get('status')
+        if status is not None:
+            if status in self.statuses:
+                queryset = getattr(queryset, status)()
+            else:
+                errors['status'] = [f'Must be one of: {", ".join(self.statuses)}.']
+
+        for param, choices in self.choice_params.items():
+            if param not in params:
+                continue
+
+            values = [value for value in params[param].split(',') if value]
+            invalid = [value for value in values if value not in choices.values]
+            if invalid or not values:
+                errors[param] = [f'Must be one of: {", ".join(choices.values)}.']
+            else:
+                queryset = queryset.filter(**{f'{param}__in': values})
+
+        if 'category' in params:
+            queryset = queryset.filter(category=params['category'])
+
+        if 'company' in params:
+            try:
+                queryset = queryset.filter(company_id=int(params['company']))
+            except ValueError:
+                errors['company'] = ['A valid integer is required.']
+
+        for param, lookup in self.date_params.items():
+            if param not in params:
+                continue
+
+            value = self.parse_datetime(params[param])
+            if value is None:
+                errors[param] = ['Must be an ISO 8601 date or datetime.']
+            else:
+                queryset = queryset.filter(**{lookup: value})
+
+        if errors:
+            raise ValidationError(errors)
+
+        return queryset
+
+    @staticmethod
+    def parse_datetime(value):
+        try:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                date = parse_date(value)
+                parsed = date and datetime.datetime.combine(date, datetime.time.min)
+        except ValueError:
+            return None
+
+        if parsed is not None and timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+
+        return parsed
+
+
+class JobSearchFilter(BaseFilterBackend):
+    """
+    Full-text search over title, category and description (`?q=...`).
+
+    Results are ordered by relevance, which the keyset pagination picks up
+    from the queryset ordering. The in-process index of databases without
+    full-text search only ranks its `max_results` best matches: pages of
+    searches then tell whether matches were left out (`truncated`).
+    """
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, '').strip()
+        if not text:
+            return queryset
+
+        queryset, request.search_truncated = get_job_search().search(queryset, text)
+        return queryset
+
+
+class ResumeSearchFilter(BaseFilterBackend):
+    """
+    Applications whose resume contains every word of `?q=...`, looked up in
+    the resume token index.
+    """
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        tokens = set(tokenize(request.query_params.get(self.search_param, '')))
+        if not tokens:
+            return queryset
+
+        blobs = ResumeToken.objects.filter(token__in=tokens).values('blob').annotate(
+            matches=Count('token')
+        ).filter(matches=len(tokens)).values('blob')
+
+        return queryset.filter(resume__in=blobs)
@@ -0,0 +1,155 @@
+import os
+import re
+import sys
+import json
+import logging
+import warnings
+import threading
+from collections import Counter
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_report_lock = threading.Lock()
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+IN_LISTS = re.compile(r'\bIN \((?:\s*(?:%s|\?)\s*,?)+\)', re.IGNORECASE)
+SPACES = re.compile(r'\s+')
+
+# Transaction control, and inserts (batched writes insert chunk by chunk),
+# repeated by design
+IGNORED = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT', 'BEGIN', 'COMMIT', 'ROLLBACK', 'INSERT')
+
+
+class NPlusOneQueries(Exception):
+    pass
+
+
+class NPlusOneWarning(UserWarning):
+    pass
+
+
+def normalize_sql(sql):
+    """
+    Template of a query: literals and IN lists of any length are replaced,
+    so that queries differing only by their values compare equal.
+    """
+    sql = IN_LISTS.sub('IN (...)', sql)
+    sql = LITERALS.sub('?', sql)
+
+    return SPACES.sub(' ', sql).strip()
+
+
+class QueryInspector:
+    """
+    Groups the queries of a request by template, to find N+1 patterns, and
+    captures the plan of slow queries. Enabled by `QUERY_INSPECTION`; views
+    processing their input in batches opt out with `query_inspection = False`.
+    """
+
+    def __init__(self, request):
+        options = settings.QUERY_INSPECTION
+        self.request = request
+        self.threshold = options['N_PLUS_ONE_THRESHOLD']
+        self.slow_query_time = options['SLOW_QUERY_MS'] / 1000
+        self.report_path = options['REPORT']
+        self.templates = Counter()
+        # Where the first repetition over the threshold came from, by template
+        self.origins = {}
+        self.explaining = False
+
+    def record(self, sql, params, many, duration, context):
+        if self.explaining or many or sql.lstrip().upper().startswith(IGNORED):
+            return
+
+        template = normalize_sql(sql)
+        self.templates[template] += 1
+        if self.templates[template] == self.threshold + 1:
+            self.origins[template] = find_origin()
+
+        if duration >= self.slow_query_time and sql.lstrip()[:6].upper() in ('SELECT', 'WITH'):
+            self.explain(sql, params, duration, context['connection'])
+
+    def explain(self, sql, params, duration, connection):
+        # The plan is read from another cursor: the query's results are
+        # still to be fetched
+        self.explaining = True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+                plan = '\n'.join(str(row[-1]) for row in cursor.fetchall())
+        except Exception:
+            logger.exception('Could not explain a slow query')
+            return
+        finally:
+            self.explaining = False
+
+        self.write_report({
+            'time': timezone.now().isoformat(),
+            'method': self.request.method,
+            'path': self.request.path,
+            'database': connection.alias,
+            'duration_ms': round(duration * 1000, 3),
+            'sql': sql,
+            'params': params,
+            'origin': find_origin(),
+            'plan': plan,
+        })
+
+    def write_report(self, entry):
+        line = json.dumps(entry, default=str)
+
+        with _report_lock:
+            with open(self.report_path, 'a') as file:
+                file.write(line + '\n')
+
+    def check(self):
+        repeated = {template: count for template, count in self.templates.items() if count > self.threshold}
+        if not repeated:
+            return
+
+        message = '\n'.join([
+            f'{self.request.method} {self.request.path} repeated queries (more than {self.threshold} times):',
+            *(f'  {count}x {template}\n    from {self.origins[template]}' for template, count in repeated.items()),
+        ])
+
+        if settings.QUERY_INSPECTION['ACTION'] == 'raise':
+            raise NPlusOneQueries(message)
+
+        warnings.warn(message, NPlusOneWarning)
+        logger.warning(message)
+
+
+def find_origin():
+    """
+    Describes the code running the current query: the serializer field and
+    the view being processed, and the innermost line of the project.
+    """
+    location = field = view = None
+    frame = sys._getframe(1)
+
+    while frame is not None:
+        code = frame.f_code
+        instance = frame.f_locals.get('self')
+
+        if location is None and is_project_file(code.co_filename):
+            location = f'{os.path.relpath(code.co_filename, settings.BASE_DIR)}:{frame.f_lineno} in {code.co_name}'
+
+        if field is None and code.co_name == 'to_representation' and 'field' in frame.f_locals:
+            field = f'{type(instance).__name__}.{frame.f_locals["field"].field_name}'
+
+        if view is None and hasattr(instance, 'as_view') and hasattr(instance, 'request'):
+            view = type(instance).__name__
+
+        frame = frame.f_back
+
+    return ', '.join(part for part in (field and f'field {field}', view and f'view {view}', location) if part)
+
+
+def is_project_file(filename):
+    return (
+        filename.startswith(str(settings.BASE_DIR))
+        and 'site-packages' not in filename
+        and not filename.endswith(('inspection.py', 'instrumentation.py'))
+    )
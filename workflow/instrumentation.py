@@ -0,0 +1,251 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.dispatch import Signal
+from workflow.inspection import QueryInspector
+from workflow.metrics import REQUESTS_IN_FLIGHT, observe_request
+
+logger = logging.getLogger(__name__)
+
+# Metrics of the request being handled, None outside instrumented requests.
+# Context variables follow requests into `sync_to_async` threads.
+current_metrics = ContextVar('current_metrics', default=None)
+
+# Sent with the `request` and its `metrics` once the response is ready
+request_instrumented = Signal()
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.view_time = 0.0
+        self.total_time = 0.0
+        self.serializing = False
+        self.view_start = None
+        self.inspector = None
+
+    def as_dict(self):
+        return {
+            'queries': self.queries,
+            'db_ms': round(self.db_time * 1000, 3),
+            'serializer_ms': round(self.serializer_time * 1000, 3),
+            'view_ms': round(self.view_time * 1000, 3),
+            'total_ms': round(self.total_time * 1000, 3),
+        }
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper (see `workflow.signals`) adding every query of
+    an instrumented request to its metrics.
+    """
+    metrics = current_metrics.get()
+    # Plans of slow queries are not part of the request
+    if metrics is None or (metrics.inspector is not None and metrics.inspector.explaining):
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        result = execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        metrics.queries += 1
+        metrics.db_time += duration
+
+    if metrics.inspector is not None:
+        metrics.inspector.record(sql, params, many, duration, context)
+
+    return result
+
+
+class TimedSerializerMixin:
+    """
+    Adds the time spent representing instances to the serializer time of the
+    request. Nested serializers and list items are counted once, as part of
+    the outermost representation.
+    """
+
+    def to_representation(self, instance):
+        metrics = current_metrics.get()
+        if metrics is None or metrics.serializing:
+            return super().to_representation(instance)
+
+        metrics.serializing = True
+        start = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_time += time.perf_counter() - start
+            metrics.serializing = False
+
+
+@contextmanager
+def timed_serialization():
+    """
+    Counts the block as serializer time of the request, for representations
+    built outside serializers (e.g. from `.values()` rows).
+    """
+    metrics = current_metrics.get()
+    if metrics is None or metrics.serializing:
+        yield
+        return
+
+    metrics.serializing = True
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serializer_time += time.perf_counter() - start
+        metrics.serializing = False
+
+
+class InstrumentationMiddleware:
+    """
+    Records the SQL query count and time, serializer time, view time and
+    total time of every request, then reports them in a `Server-Timing`
+    header and a log line of the `workflow.instrumentation` logger, and
+    sends them with `request_instrumented`. With `METRICS['ENABLED']`, they
+    are also recorded in the Prometheus metrics of `workflow.metrics`. With
+    `QUERY_INSPECTION['ENABLED']`, queries are inspected for N+1 patterns
+    and slow plans (see `workflow.inspection`).
+
+    Header and log line are disabled unless
+    `REQUEST_INSTRUMENTATION['ENABLED']`. Should come first in `MIDDLEWARE`
+    to measure the other middlewares as well.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = settings.REQUEST_INSTRUMENTATION
+        self.metrics = settings.METRICS['ENABLED']
+        self.inspection = settings.QUERY_INSPECTION['ENABLED']
+        if not options['ENABLED'] and not self.metrics and not self.inspection:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.server_timing = options['ENABLED'] and options['SERVER_TIMING']
+        self.log = options['ENABLED'] and options['LOG']
+        self.async_mode = iscoroutinefunction(get_response)
+
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # Hooks matching the handler's mode are called without a thread hop
+            self.process_view = self.aprocess_view
+            self.process_template_response = self.aprocess_template_response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        metrics = self.start_metrics(request)
+        token = current_metrics.set(metrics)
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            current_metrics.reset(token)
+
+        return self.report(request, response, metrics, start)
+
+    async def __acall__(self, request):
+        metrics = self.start_metrics(request)
+        token = current_metrics.set(metrics)
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            current_metrics.reset(token)
+
+        return self.report(request, response, metrics, start)
+
+    def start_metrics(self, request):
+        metrics = RequestMetrics()
+        if self.inspection:
+            metrics.inspector = QueryInspector(request)
+
+        return metrics
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_started(current_metrics.get(), view_func)
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        view_started(current_metrics.get(), view_func)
+
+    # Called when the view returns a response still to be rendered (all
+    # REST framework responses): the view time excludes rendering.
+    def process_template_response(self, request, response):
+        view_finished(current_metrics.get())
+        return response
+
+    async def aprocess_template_response(self, request, response):
+        view_finished(current_metrics.get())
+        return response
+
+    def report(self, request, response, metrics, start):
+        # Views returning plain responses (e.g. file downloads)
+        view_finished(metrics)
+        metrics.total_time = time.perf_counter() - start
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        route = resolver_match.url_name if resolver_match is not None else None
+
+        if self.metrics:
+            observe_request(
+                route, request.method, response.status_code, metrics.total_time, metrics.queries, metrics.db_time
+            )
+
+        if self.server_timing:
+            response['Server-Timing'] = server_timing(metrics)
+
+        if self.log and logger.isEnabledFor(logging.INFO):
+            values = {
+                'method': request.method,
+                'path': request.path,
+                'route': route,
+                'status': response.status_code,
+                **metrics.as_dict(),
+            }
+            # key=value pairs, also attached to the record for JSON formatters
+            logger.info(' '.join(f'{key}={value}' for key, value in values.items()), extra={'request_metrics': values})
+
+        request_instrumented.send(sender=self.__class__, request=request, metrics=metrics)
+
+        if metrics.inspector is not None:
+            metrics.inspector.check()
+
+        return response
+
+
+def view_started(metrics, view_func):
+    # Class-based views are reached through the function of `as_view()`
+    view = getattr(view_func, 'view_class', view_func)
+    if not getattr(view, 'query_inspection', True):
+        metrics.inspector = None
+
+    metrics.view_start = time.perf_counter()
+
+
+def view_finished(metrics):
+    if metrics.view_start is not None:
+        metrics.view_time = time.perf_counter() - metrics.view_start
+        metrics.view_start = None
+
+
+def server_timing(metrics):
+    return ', '.join([
+        f'db;desc="{metrics.queries} queries";dur={metrics.db_time * 1000:.3f}',
+        f'serializer;dur={metrics.serializer_time * 1000:.3f}',
+        f'view;dur={metrics.view_time * 1000:.3f}',
+        f'total;dur={metrics.total_time * 1000:.3f}',
+    ])
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from workflow.bulk import chunked
+from workflow.contracts import ExtractionStatuses
+from workflow.extraction import create_process_pool, extract_resumes
+from workflow.models import ResumeBlob
+
+
+class Command(BaseCommand):
+    help = 'Extracts and indexes the text of resumes that are pending or failed before.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--workers', type=int, default=settings.RESUME_EXTRACTION['WORKERS'])
+        parser.add_argument('--all', action='store_true', help='Reprocess every resume, e.g. after an extractor change.')
+
+    def handle(self, *args, **options):
+        queryset = ResumeBlob.objects.order_by('pk')
+        if not options['all']:
+            queryset = queryset.filter(
+                Q(extraction_status=ExtractionStatuses.PENDING) |
+                Q(extraction_status=ExtractionStatuses.FAILED,
+                  extraction_attempts__lt=settings.RESUME_EXTRACTION['MAX_ATTEMPTS'])
+            )
+
+        blob_ids = list(queryset.values_list('pk', flat=True))
+        executor = create_process_pool(options['workers']) if options['workers'] else None
+
+        processed = failed = 0
+        try:
+            for _, batch in chunked(blob_ids, options['batch_size']):
+                batch_processed, batch_failed = extract_resumes(batch, executor)
+                processed += batch_processed
+                failed += batch_failed
+                self.stdout.write(f'{processed}/{len(blob_ids)} resumes processed, {failed} failed')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f'Extracted {processed - failed} resumes, {failed} failed.'))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+from workflow.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the application rollups from the status changes, for a range of days.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', help='First day to rebuild (YYYY-MM-DD), the beginning if omitted.')
+        parser.add_argument('--until', help='Last day to rebuild (YYYY-MM-DD), the end if omitted.')
+
+    def handle(self, *args, **options):
+        since, until = (self.parse_day(options[name], name) for name in ('since', 'until'))
+        if since and until and since > until:
+            raise CommandError('--since must not be after --until.')
+
+        count = rebuild_rollups(since, until)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} rollups.'))
+
+    @staticmethod
+    def parse_day(value, name):
+        if value is None:
+            return None
+
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+
+        if day is None:
+            raise CommandError(f'--{name} must be a date (YYYY-MM-DD).')
+
+        return day
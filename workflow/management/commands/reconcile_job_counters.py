@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from workflow.bulk import chunked
+from workflow.counters import reconcile_job_counters
+from workflow.models import Job
+
+
+class Command(BaseCommand):
+    help = 'Recounts the applications of every job and repairs the counters that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        job_ids = list(Job.objects.order_by('pk').values_list('pk', flat=True))
+
+        repaired = 0
+        for start, batch in chunked(job_ids, options['batch_size']):
+            repaired += len(reconcile_job_counters(batch))
+            self.stdout.write(f'{start + len(batch)}/{len(job_ids)} jobs checked, {repaired} repaired')
+
+        self.stdout.write(self.style.SUCCESS(f'Repaired the counters of {repaired} jobs.'))
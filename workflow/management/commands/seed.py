@@ -0,0 +1,104 @@
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils.dateparse import parse_date
+from authentication.models import User
+from workflow.seeding import STATUS_WEIGHTS, make_plan, published_jobs, seed, volumes
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates companies, users, jobs and applications, with their status history and rollups, at the default '
+        'volumes (10k companies, 500k jobs, 5M applications) multiplied by --scale. The same options and --seed '
+        'always generate the same data. Meant for development and benchmark databases: nothing else should write '
+        'to the database meanwhile.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0, help='Multiplies the default volumes.')
+        for name in ('companies', 'jobs', 'managers', 'applicants', 'applications'):
+            parser.add_argument(f'--{name}', type=int, help=f'Number of {name}, instead of the scaled default.')
+        parser.add_argument('--skew', type=float, default=2.0,
+                            help='Popularity exponent of the companies and jobs, 1 being uniform.')
+        parser.add_argument('--statuses', default=','.join(f'{status}={weight}' for status, weight in STATUS_WEIGHTS.items()),
+                            help='Weights of the application statuses, as status=weight pairs.')
+        parser.add_argument('--history-days', type=int, default=365, help='Days of activity to spread the data over.')
+        parser.add_argument('--until', help='Last day of activity (YYYY-MM-DD), today if omitted.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--workers', type=int, default=0, help='Writing processes, the current one if 0.')
+        parser.add_argument('--prefix', default='seed', help='Prefix of the usernames.')
+        parser.add_argument('--password', default='seed_1234_56', help='Password of every user.')
+
+    def handle(self, *args, **options):
+        counts = volumes(options['scale'])
+        for name in counts:
+            if options[name] is not None:
+                counts[name] = options[name]
+        if any(count < 0 for count in counts.values()):
+            raise CommandError('Volumes must not be negative.')
+        if counts['applications'] and not counts['applicants']:
+            raise CommandError('Applications need applicants.')
+        if options['skew'] <= 0:
+            raise CommandError('--skew must be positive.')
+
+        if User.objects.filter(username__startswith=f'{options["prefix"]}-').exists():
+            raise CommandError(f'Users prefixed with "{options["prefix"]}-" exist already, choose another --prefix.')
+
+        workers = options['workers']
+        if workers and connection.vendor == 'sqlite':
+            # A single writer at a time, the others would fail with "database is locked"
+            self.stderr.write('SQLite allows a single writer, seeding from the current process.')
+            workers = 0
+
+        plan = make_plan(
+            seed=options['seed'],
+            skew=options['skew'],
+            status_weights=self.parse_statuses(options['statuses']),
+            history_days=options['history_days'],
+            until=self.parse_day(options['until']),
+            prefix=options['prefix'],
+            password=make_password(options['password']),
+            **counts
+        )
+        if plan.applications and not len(published_jobs(plan)[0]):
+            raise CommandError('Applications need published jobs, seed more jobs.')
+
+        self.stdout.write(', '.join(f'{count} {name}' for name, count in counts.items()))
+        seed(plan, workers, self.progress)
+
+        self.stdout.write(self.style.SUCCESS(f'Seeded {sum(counts.values())} rows with seed {plan.seed}.'))
+
+    def progress(self, kind, written, count):
+        self.stdout.write(f'{written}/{count} {kind} written')
+
+    @staticmethod
+    def parse_statuses(value):
+        weights = {}
+        for pair in value.split(','):
+            status, _, weight = pair.partition('=')
+            if status.strip() not in STATUS_WEIGHTS:
+                raise CommandError(f'Unknown status "{status.strip()}", expected one of {", ".join(STATUS_WEIGHTS)}.')
+            try:
+                weights[status.strip()] = float(weight)
+            except ValueError:
+                raise CommandError(f'The weight of "{status.strip()}" must be a number.')
+
+        if any(weight < 0 for weight in weights.values()) or not sum(weights.values()):
+            raise CommandError('Status weights must not be negative, and not all zero.')
+
+        return weights
+
+    @staticmethod
+    def parse_day(value):
+        if value is None:
+            return None
+
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+
+        if day is None:
+            raise CommandError('--until must be a date (YYYY-MM-DD).')
+
+        return day
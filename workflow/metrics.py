@@ -0,0 +1,128 @@
+import os
+from prometheus_client import (
+    CONTENT_TYPE_LATEST as CONTENT_TYPE, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest,
+    multiprocess
+)
+from prometheus_client.core import GaugeMetricFamily
+
+# With several worker processes (gunicorn, uvicorn workers), values live
+# in memory-mapped files of PROMETHEUS_MULTIPROC_DIR, shared by the workers
+# and aggregated when scraped. The variable must be set before the workers
+# start, see `gunicorn.conf.py`.
+
+REQUEST_DURATION = Histogram(
+    'workflow_http_request_duration_seconds',
+    'Time spent handling requests, by route.',
+    ['route', 'method'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+REQUESTS = Counter(
+    'workflow_http_requests',
+    'Requests handled, by route and status code.',
+    ['route', 'method', 'status']
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'workflow_http_requests_in_flight',
+    'Requests being handled, by worker process.',
+    multiprocess_mode='liveall'
+)
+DB_QUERIES = Histogram(
+    'workflow_db_queries_per_request',
+    'SQL queries run by requests, by route.',
+    ['route'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+DB_DURATION = Histogram(
+    'workflow_db_duration_seconds',
+    'Time spent in SQL queries by requests, by route.',
+    ['route'],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+)
+CACHE_LOOKUPS = Counter(
+    'workflow_response_cache_lookups',
+    'Response cache lookups, by result.',
+    ['result']
+)
+
+# Methods recorded as such, any other token sent by a client is recorded as
+# 'other': every label value adds series to every worker's files
+METHODS = frozenset(('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'))
+
+# Children of labelled metrics, resolved once: `labels()` costs as much as
+# the observation itself. Routes (url names), methods (see `METHODS`) and
+# statuses are bounded sets.
+CACHE_HITS = CACHE_LOOKUPS.labels('hit')
+CACHE_MISSES = CACHE_LOOKUPS.labels('miss')
+_request_children = {}
+
+
+def get_request_children(route, method, status):
+    key = (route, method, status)
+    children = _request_children.get(key)
+
+    if children is None:
+        children = _request_children[key] = (
+            REQUEST_DURATION.labels(route, method),
+            REQUESTS.labels(route, method, status),
+            DB_QUERIES.labels(route),
+            DB_DURATION.labels(route),
+        )
+
+    return children
+
+
+def observe_request(route, method, status, duration, queries, db_time):
+    if method not in METHODS:
+        method = 'other'
+
+    request_duration, requests, db_queries, db_duration = get_request_children(route or 'unmatched', method, status)
+
+    request_duration.observe(duration)
+    requests.inc()
+    db_queries.observe(queries)
+    db_duration.observe(db_time)
+
+
+def count_cache_lookup(hit):
+    (CACHE_HITS if hit else CACHE_MISSES).inc()
+
+
+class CacheHitRatioCollector:
+    """
+    Hit ratio of the response cache, computed from the lookups aggregated
+    by `registry`.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def collect(self):
+        hits = self.registry.get_sample_value('workflow_response_cache_lookups_total', {'result': 'hit'}) or 0
+        misses = self.registry.get_sample_value('workflow_response_cache_lookups_total', {'result': 'miss'}) or 0
+
+        ratio = GaugeMetricFamily('workflow_response_cache_hit_ratio', 'Share of response cache lookups that hit.')
+        ratio.add_metric([], hits / (hits + misses) if hits + misses else 0.0)
+        yield ratio
+
+
+def render_metrics():
+    """
+    Metrics of every worker process in the text exposition format.
+    """
+    path = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if path:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=path)
+    else:
+        registry = REGISTRY
+
+    derived = CollectorRegistry()
+    derived.register(CacheHitRatioCollector(registry))
+
+    return generate_latest(registry) + generate_latest(derived)
+
+
+def worker_exited(pid):
+    # Live gauges of the worker are dropped, its counters are kept
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:43
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The search document is maintained by the database itself so that every
+# write path (ORM saves, bulk_create, queryset updates, raw SQL) keeps it
+# in sync. Weights match `workflow.search.FIELD_WEIGHTS`.
+CREATE_TRIGGER = """
+CREATE FUNCTION workflow_job_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.category, '')), 'B') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.description, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER workflow_job_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, category, description ON workflow_job
+    FOR EACH ROW EXECUTE FUNCTION workflow_job_search_vector_update();
+
+UPDATE workflow_job SET title = title;
+
+CREATE INDEX job_search_vector_idx ON workflow_job USING gin (search_vector);
+"""
+
+DROP_TRIGGER = """
+DROP INDEX IF EXISTS job_search_vector_idx;
+DROP TRIGGER IF EXISTS workflow_job_search_vector_trigger ON workflow_job;
+DROP FUNCTION IF EXISTS workflow_job_search_vector_update();
+"""
+
+
+def create_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_TRIGGER, params=None)
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TRIGGER, params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0003_job_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
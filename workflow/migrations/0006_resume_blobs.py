@@ -0,0 +1,106 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:56
+
+import codecs
+import hashlib
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Frozen copies of the helpers of `workflow.resumes` at the time of this
+# migration: it must keep working whatever happens to them.
+SIGNATURES = [
+    (b'%PDF-', 'application/pdf', 'pdf'),
+    (b'PK\x03\x04', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', 'docx'),
+]
+
+EXTENSIONS = {content_type: extension for _, content_type, extension in SIGNATURES}
+EXTENSIONS['text/plain'] = 'txt'
+
+
+def detect_content_type(head):
+    for signature, content_type, _ in SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+
+    return 'text/plain' if b'\x00' not in head else None
+
+
+def blob_name(sha256, content_type):
+    return f'resumes/{sha256[:2]}/{sha256[2:4]}/{sha256}.{EXTENSIONS.get(content_type, "bin")}'
+
+
+def move_resumes_to_blobs(apps, schema_editor):
+    # Existing resumes are hashed and copied under their content address.
+    # The original files are left in place and can be removed afterwards.
+    Application = apps.get_model('workflow', 'Application')
+    ResumeBlob = apps.get_model('workflow', 'ResumeBlob')
+
+    applications = Application.objects.exclude(resume='').exclude(resume__isnull=True)
+    for application in applications.iterator():
+        name = application.resume.name
+        if not default_storage.exists(name):
+            continue
+
+        digest = hashlib.sha256()
+        content_type = None
+        with default_storage.open(name) as file:
+            for chunk in file.chunks():
+                content_type = content_type or detect_content_type(chunk) or 'application/octet-stream'
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+        blob = ResumeBlob.objects.filter(sha256=sha256).first()
+        if blob is None:
+            with default_storage.open(name) as file:
+                blob = ResumeBlob.objects.create(
+                    sha256=sha256,
+                    file=default_storage.save(blob_name(sha256, content_type), file),
+                    size=default_storage.size(name),
+                    content_type=content_type
+                )
+
+        ResumeBlob.objects.filter(pk=blob.pk).update(references=models.F('references') + 1)
+        Application.objects.filter(pk=application.pk).update(resume_blob=blob)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0005_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('file', models.FileField(max_length=255, upload_to='resumes/')),
+                ('size', models.PositiveBigIntegerField()),
+                ('content_type', models.CharField(max_length=100)),
+                ('references', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='resume_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='applications', to='workflow.resumeblob'),
+        ),
+        migrations.RunPython(move_resumes_to_blobs, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='application',
+            name='resume',
+        ),
+        migrations.RenameField(
+            model_name='application',
+            old_name='resume_blob',
+            new_name='resume',
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.30 on 2026-10-18 09:02
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+STATUSES = ('applied', 'in_review', 'waiting', 'offer', 'disqualified')
+
+
+def count_applications(apps, schema_editor):
+    Application = apps.get_model('workflow', 'Application')
+    Job = apps.get_model('workflow', 'Job')
+
+    def count(**filters):
+        applications = Application.objects.filter(job=OuterRef('pk'), **filters).order_by().values('job')
+        return Coalesce(Subquery(applications.annotate(count=Count('pk')).values('count')), 0)
+
+    Job.objects.update(
+        applications_count=count(),
+        **{f'applications_{status}_count': count(status=status) for status in STATUSES}
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0007_resume_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='applications_applied_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_disqualified_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_in_review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_offer_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_waiting_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_applications, migrations.RunPython.noop),
+    ]
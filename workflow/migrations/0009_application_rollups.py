@@ -0,0 +1,95 @@
+# Generated by Django 4.2.30 on 2026-10-18 09:03
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+import django.db.models.deletion
+
+STAGES = ('applied', 'in_review', 'waiting', 'offer')
+
+
+def backfill_status_changes(apps, schema_editor):
+    # The history of existing applications is unknown: each one is created
+    # as applied, then assumed to have gone through the stages leading to
+    # its current status at its last update.
+    Application = apps.get_model('workflow', 'Application')
+    ApplicationStatusChange = apps.get_model('workflow', 'ApplicationStatusChange')
+    ApplicationRollup = apps.get_model('workflow', 'ApplicationRollup')
+
+    events = []
+    for application in Application.objects.order_by('pk').iterator(chunk_size=2000):
+        events.append(ApplicationStatusChange(
+            application_id=application.pk,
+            job_id=application.job_id,
+            status='applied',
+            created=True,
+            changed_at=application.created_at
+        ))
+
+        path = STAGES[1:STAGES.index(application.status) + 1] if application.status in STAGES else ('disqualified',)
+        elapsed_seconds = max(int((application.updated_at - application.created_at).total_seconds()), 0)
+        for status in path:
+            events.append(ApplicationStatusChange(
+                application_id=application.pk,
+                job_id=application.job_id,
+                status=status,
+                elapsed_seconds=elapsed_seconds,
+                changed_at=application.updated_at
+            ))
+
+        if len(events) >= 5000:
+            ApplicationStatusChange.objects.bulk_create(events)
+            events = []
+
+    ApplicationStatusChange.objects.bulk_create(events)
+
+    rows = ApplicationStatusChange.objects.annotate(day=TruncDate('changed_at')).order_by().values(
+        'job_id', 'day', 'status'
+    ).annotate(
+        created=Count('pk', filter=Q(created=True)),
+        entered=Count('pk'),
+        elapsed_seconds=Sum('elapsed_seconds')
+    )
+    ApplicationRollup.objects.bulk_create([ApplicationRollup(**row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0008_job_application_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('applied', 'Applied'), ('in_review', 'In review'), ('waiting', 'Waiting for interview'), ('offer', 'Offer'), ('disqualified', 'Disqualified')], max_length=30)),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('entered', models.PositiveIntegerField(default=0)),
+                ('elapsed_seconds', models.PositiveBigIntegerField(default=0)),
+                ('job', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='application_rollups', to='workflow.job')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ApplicationStatusChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('applied', 'Applied'), ('in_review', 'In review'), ('waiting', 'Waiting for interview'), ('offer', 'Offer'), ('disqualified', 'Disqualified')], max_length=30)),
+                ('created', models.BooleanField(default=False)),
+                ('elapsed_seconds', models.PositiveBigIntegerField(default=0)),
+                ('changed_at', models.DateTimeField()),
+                ('application', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='status_changes', to='workflow.application')),
+                ('job', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='application_status_changes', to='workflow.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['changed_at'], name='status_change_changed_idx'), models.Index(fields=['job', 'changed_at'], name='status_change_job_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='applicationrollup',
+            constraint=models.UniqueConstraint(fields=('job', 'day', 'status'), name='application_rollup_unique'),
+        ),
+        migrations.RunPython(backfill_status_changes, migrations.RunPython.noop),
+    ]
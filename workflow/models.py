@@ -1,5 +1,37 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from workflow.contracts import JobTypes, JobContracts, JobModalities, ApplicationStatuses
+from django.db.models import Count, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+from workflow.contracts import JobTypes, JobContracts, JobModalities, ApplicationStatuses, ExtractionStatuses
+
+
+# Application counters of a job, per status (see `workflow.counters`)
+APPLICATION_COUNTERS = {status: f'applications_{status}_count' for status in ApplicationStatuses.values}
+
+
+class CompanyQuerySet(models.QuerySet):
+    def with_jobs_summary(self):
+        jobs_count = Job.objects.filter(company=OuterRef('pk')).order_by().values('company').annotate(
+            count=Count('pk')
+        ).values('count')
+
+        recent_jobs = Job.objects.open().order_by('-created_at', '-id')[:settings.COMPANY_EMBEDDED_JOBS]
+
+        return self.annotate(jobs_count=Coalesce(Subquery(jobs_count), 0)).prefetch_related(
+            Prefetch('jobs', queryset=recent_jobs, to_attr='recent_jobs')
+        )
+
+
+class JobQuerySet(models.QuerySet):
+    def open(self):
+        return self.filter(published_at__isnull=False, closed_at__isnull=True)
+
+    def published(self):
+        return self.filter(published_at__isnull=False)
+
+    def closed(self):
+        return self.filter(closed_at__isnull=False)
 
 
 # Company model
@@ -7,14 +39,24 @@ class Company(models.Model):
     name = models.CharField(max_length=100)
     address = models.TextField(null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = CompanyQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='company_created_idx'),
+        ]
 
 
 # Job model
 class Job(models.Model):
+    # Indexed through the composite indexes below
     company = models.ForeignKey(
         'Company',
         related_name='jobs',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False
     )
 
     title = models.CharField(max_length=255)
@@ -41,26 +83,99 @@ class Job(models.Model):
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(default=None, blank=True, null=True)
     closed_at = models.DateTimeField(default=None, blank=True, null=True)
 
+    # Full-text search document, maintained by a trigger on PostgreSQL
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Application counters, only ever written through `F()` updates
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
+    applications_applied_count = models.PositiveIntegerField(default=0, editable=False)
+    applications_in_review_count = models.PositiveIntegerField(default=0, editable=False)
+    applications_waiting_count = models.PositiveIntegerField(default=0, editable=False)
+    applications_offer_count = models.PositiveIntegerField(default=0, editable=False)
+    applications_disqualified_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = JobQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Kept to detect which values a save actually changed
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Saving a loaded job must not overwrite counters updated since then
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            excluded = {'applications_count', *APPLICATION_COUNTERS.values(), *self.get_deferred_fields()}
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in excluded
+            ]
+
+        super().save(*args, **kwargs)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='job_created_idx'),
+            models.Index(fields=['company', '-created_at', '-id'], name='job_company_created_idx'),
+            # Partial indexes covering only open jobs, i.e. `Job.objects.open()`
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='job_open_created_idx',
+                condition=Q(published_at__isnull=False, closed_at__isnull=True)
+            ),
+            models.Index(
+                fields=['company', '-created_at', '-id'],
+                name='job_open_company_idx',
+                condition=Q(published_at__isnull=False, closed_at__isnull=True)
+            ),
+            # Job board filters, each usable on its own or combined through bitmap scans
+            models.Index(fields=['category', '-created_at', '-id'], name='job_category_idx'),
+            models.Index(fields=['contract', '-created_at', '-id'], name='job_contract_idx'),
+            models.Index(fields=['type', '-created_at', '-id'], name='job_type_idx'),
+            models.Index(fields=['modalities', '-created_at', '-id'], name='job_modalities_idx'),
+            models.Index(
+                fields=['-published_at'],
+                name='job_published_idx',
+                condition=Q(published_at__isnull=False)
+            ),
+            models.Index(
+                fields=['-closed_at'],
+                name='job_closed_idx',
+                condition=Q(closed_at__isnull=False)
+            ),
+        ]
+
 
 # Application model
 class Application(models.Model):
+    # Both foreign keys are indexed through the composite indexes below
     applicant = models.ForeignKey(
         'authentication.User',
         related_name='applications',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False
     )
 
     job = models.ForeignKey(
         'Job',
         related_name='applications',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False
     )
 
     description = models.TextField(null=True)
-    resume = models.FileField(upload_to='documents/', null=True, blank=True)
+    resume = models.ForeignKey(
+        'ResumeBlob',
+        related_name='applications',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True
+    )
     status = models.CharField(
         max_length=30,
         choices=ApplicationStatuses.choices,
@@ -69,3 +184,121 @@ class Application(models.Model):
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Kept to move the job counters when the status or job changes
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='application_created_idx'),
+            models.Index(fields=['applicant', '-created_at', '-id'], name='application_applicant_idx'),
+            models.Index(fields=['job', 'status', '-created_at', '-id'], name='application_job_status_idx'),
+        ]
+
+
+# Statuses entered by applications, source of the rollups (see `workflow.rollups`)
+class ApplicationStatusChange(models.Model):
+    # Kept when the application is deleted, the history still happened
+    application = models.ForeignKey(
+        'Application',
+        related_name='status_changes',
+        on_delete=models.SET_NULL,
+        null=True
+    )
+
+    # Indexed through the composite index below
+    job = models.ForeignKey(
+        'Job',
+        related_name='application_status_changes',
+        on_delete=models.CASCADE,
+        db_index=False
+    )
+
+    status = models.CharField(max_length=30, choices=ApplicationStatuses.choices)
+
+    # Whether the application was created in this status
+    created = models.BooleanField(default=False)
+
+    # Time elapsed since the application was created
+    elapsed_seconds = models.PositiveBigIntegerField(default=0)
+
+    changed_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['changed_at'], name='status_change_changed_idx'),
+            models.Index(fields=['job', 'changed_at'], name='status_change_job_idx'),
+        ]
+
+
+# Daily totals of the status changes, per job and status
+class ApplicationRollup(models.Model):
+    # Indexed through the unique constraint below
+    job = models.ForeignKey(
+        'Job',
+        related_name='application_rollups',
+        on_delete=models.CASCADE,
+        db_index=False
+    )
+
+    day = models.DateField()
+    status = models.CharField(max_length=30, choices=ApplicationStatuses.choices)
+
+    # Applications created in the status, and entering it (including creations)
+    created = models.PositiveIntegerField(default=0)
+    entered = models.PositiveIntegerField(default=0)
+
+    # Total time elapsed since the creation of the applications entering it
+    elapsed_seconds = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'day', 'status'], name='application_rollup_unique'),
+        ]
+
+
+# Resume files, stored once per distinct content (see `workflow.resumes`)
+class ResumeBlob(models.Model):
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to='resumes/', max_length=255)
+    size = models.PositiveBigIntegerField()
+    content_type = models.CharField(max_length=100)
+
+    # Number of applications referencing the blob
+    references = models.PositiveIntegerField(default=0)
+
+    # Normalized plain text (see `workflow.extraction`)
+    text = models.TextField(null=True, blank=True)
+    extraction_status = models.CharField(
+        max_length=20,
+        choices=ExtractionStatuses.choices,
+        default=ExtractionStatuses.PENDING
+    )
+    extraction_attempts = models.PositiveSmallIntegerField(default=0)
+    extraction_error = models.TextField(null=True, blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+# Token index of the resume texts
+class ResumeToken(models.Model):
+    blob = models.ForeignKey(
+        'ResumeBlob',
+        related_name='tokens',
+        on_delete=models.CASCADE
+    )
+
+    token = models.CharField(max_length=100)
+    frequency = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['token', 'blob'], name='resume_token_unique'),
+        ]
@@ -0,0 +1,182 @@
+import json
+import datetime
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import namedtuple
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+Cursor = namedtuple('Cursor', ['reverse', 'position'])
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination over a composite, unique ordering key.
+
+    The cursor stores the full key of the boundary row, so every page is a
+    single index range scan no matter how deep the client has paginated.
+    The last ordering field must be unique (the primary key by default).
+    """
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = settings.PAGINATION_MAX_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+
+        return self.set_page([item async for item in page_queryset])
+
+    def set_page(self, results):
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        return self.page
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """
+        Returns the unevaluated queryset of the requested page, including one
+        extra row that tells whether there is a following page.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (self.reverse, self.position) = (False, None)
+        else:
+            (self.reverse, self.position) = self.cursor
+
+        ordering = self._reverse_ordering(self.ordering) if self.reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+
+        if self.position is not None:
+            try:
+                queryset = queryset.filter(self._position_filter(ordering, self.position))
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        return queryset[:self.page_size + 1]
+
+    def get_ordering(self, request, queryset, view):
+        # An explicit ordering on the queryset (e.g. by search rank) takes
+        # precedence over the default (created_at, id) key.
+        if queryset.query.order_by:
+            return tuple(queryset.query.order_by)
+
+        return self.ordering
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+
+        # Set by `JobSearchFilter`, only on searches
+        truncated = getattr(self.request, 'search_truncated', None)
+        if truncated is not None:
+            response.data['truncated'] = truncated
+
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema['properties']['truncated'] = {
+            'type': 'boolean',
+            'description': 'Searches only: whether matches beyond the ranked ones were left out.',
+        }
+
+        return schema
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(Cursor(reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(Cursor(reverse=True, position=position))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            tokens = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            reverse = bool(tokens.get('r', False))
+            position = tokens['p']
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(reverse=reverse, position=position)
+
+    def encode_cursor(self, cursor):
+        tokens = {'p': cursor.position}
+        if cursor.reverse:
+            tokens['r'] = 1
+
+        encoded = urlsafe_b64encode(json.dumps(tokens, separators=(',', ':')).encode('ascii'))
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded.decode('ascii'))
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = []
+        for field in ordering:
+            name = field.lstrip('-')
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            if isinstance(value, datetime.datetime):
+                value = value.isoformat()
+            position.append(value)
+
+        return position
+
+    @staticmethod
+    def _reverse_ordering(ordering):
+        return tuple(field[1:] if field.startswith('-') else '-' + field for field in ordering)
+
+    @staticmethod
+    def _position_filter(ordering, position):
+        # Expands (a, b, c) > (x, y, z) into
+        #   a >= x AND (a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z))
+        # The leading range predicate lets the database seek into the index.
+        lookups = []
+        for field in ordering:
+            lookups.append((field.lstrip('-'), 'lt' if field.startswith('-') else 'gt'))
+
+        condition = Q()
+        equal = Q()
+        for (name, operator), value in zip(lookups, position):
+            condition |= equal & Q(**{f'{name}__{operator}': value})
+            equal &= Q(**{name: value})
+
+        (name, operator), value = lookups[0], position[0]
+        return Q(**{f'{name}__{operator}e': value}) & condition
@@ -0,0 +1,82 @@
+import io
+import codecs
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.utils import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(text):
+    """
+    Parses strict JSON (NaN and Infinity are rejected, like DRF's parser),
+    through orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+
+    return json.loads(text, parse_constant=json.strict_constant)
+
+
+class JSONParser(parsers.JSONParser):
+    """
+    `JSONParser` decoding UTF-8 bodies through orjson, when installed.
+    Bodies orjson rejects go through the stdlib parser, so errors are
+    reported exactly as before.
+
+    Unlike the stdlib, orjson reads integers beyond 64 bits as floats; no
+    field of the API accepts such values either way.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(data), media_type, parser_context)
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline delimited JSON into a list, one item per non-blank line.
+
+    The body is read line by line from the request stream. Lines that are
+    not valid JSON are kept as raw strings so that callers can report them
+    per item instead of rejecting the whole document.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if stream is None:
+            raise ParseError('Empty request body.')
+
+        items = []
+        for line in stream:
+            try:
+                line = line.decode(encoding).strip()
+            except UnicodeDecodeError as exc:
+                raise ParseError(f'NDJSON parse error - {exc}')
+
+            if not line:
+                continue
+
+            try:
+                items.append(loads(line))
+            except ValueError:
+                items.append(line)
+
+        return items
@@ -2,6 +2,11 @@ from rest_framework import permissions
 from authentication.contracts import UserTypes
 
 
+class IsManager(permissions.BasePermission):
+    def has_permission(self, request, view) -> bool:
+        return request.user.type == UserTypes.MANAGER
+
+
 class IsManagerOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view) -> bool:
         if request.method in permissions.SAFE_METHODS:
@@ -15,9 +20,12 @@ class IsManagerOrOwnerOfApplication(permissions.BasePermission):
         if request.method in ('PUT', 'PATCH', 'DELETE'):
             return request.user.type == UserTypes.MANAGER
 
-        return request.user == obj.applicant or request.user.type == UserTypes.MANAGER
+        return obj.applicant_id == request.user.id or request.user.type == UserTypes.MANAGER
 
 
 class CanApplyToJobs(permissions.BasePermission):
     def has_permission(self, request, view):
+        if request.method in permissions.SAFE_METHODS:
+            return True
+
         return request.user.type == UserTypes.APPLICANT
\ No newline at end of file
@@ -0,0 +1,182 @@
+import os
+import sys
+import time
+import random
+import logging
+import threading
+from collections import Counter
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+
+logger = logging.getLogger(__name__)
+
+HEADER = 'X-Profile'
+META_KEY = 'HTTP_X_PROFILE'
+SALT = 'workflow.profiling'
+
+_rotation_lock = threading.Lock()
+_labels = {}
+
+
+def make_profile_token(user):
+    return signing.dumps({'user': user.pk}, salt=SALT)
+
+
+def is_valid_profile_token(token):
+    try:
+        signing.loads(token, salt=SALT, max_age=settings.PROFILING['TOKEN_MAX_AGE'])
+    except signing.BadSignature:
+        return False
+
+    return True
+
+
+class StackSampler:
+    """
+    Statistical profiler: samples the stack of one thread at a fixed
+    interval from a background thread, and counts the collapsed stacks.
+
+    Samples are taken when the sampler gets the GIL, so CPU-bound code is
+    sampled at most every `sys.getswitchinterval()` (5ms by default).
+    """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='stack-sampler', daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame)] += 1
+
+
+def collapse(frame):
+    labels = []
+    while frame is not None:
+        labels.append(label(frame.f_code))
+        frame = frame.f_back
+
+    return ';'.join(reversed(labels))
+
+
+def label(code):
+    text = _labels.get(code)
+    if text is None:
+        filename = code.co_filename
+        if 'site-packages' in filename:
+            filename = filename.rsplit('site-packages' + os.sep, 1)[-1]
+        elif filename.startswith(str(settings.BASE_DIR)):
+            filename = os.path.relpath(filename, settings.BASE_DIR)
+
+        text = _labels[code] = f'{code.co_qualname} ({filename}:{code.co_firstlineno})'
+
+    return text
+
+
+class ProfilingMiddleware:
+    """
+    Runs a share of live requests (`PROFILING['SAMPLE_RATE']`), and requests
+    carrying an `X-Profile` token signed for a manager (see `ProfileToken`),
+    under `StackSampler`. The collapsed stacks of each request are written to
+    `<DIRECTORY>/<url name>.<timestamp>.<pid>.folded`, keeping the latest
+    `MAX_FILES` files, ready for `flamegraph.pl` or speedscope.
+
+    Requests that are not sampled only cost a random draw and a header
+    lookup. In async mode, the sampler follows synchronous views into the
+    thread running them (see `process_view`); async views are sampled on the
+    event loop thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = settings.PROFILING
+        if not options['ENABLED']:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.sample_rate = options['SAMPLE_RATE']
+        self.interval = options['INTERVAL_MS'] / 1000
+        self.directory = options['DIRECTORY']
+        self.max_files = options['MAX_FILES']
+        self.async_mode = iscoroutinefunction(get_response)
+
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        if not self.is_sampled(request):
+            return self.get_response(request)
+
+        with StackSampler(threading.get_ident(), self.interval) as sampler:
+            response = self.get_response(request)
+
+        self.write(request, sampler.stacks)
+        return response
+
+    async def __acall__(self, request):
+        if not self.is_sampled(request):
+            return await self.get_response(request)
+
+        with StackSampler(threading.get_ident(), self.interval) as sampler:
+            request.stack_sampler = sampler
+            response = await self.get_response(request)
+
+        self.write(request, sampler.stacks)
+        return response
+
+    # Synchronous on purpose: in async mode, Django runs it in the thread
+    # that then runs synchronous views.
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        sampler = getattr(request, 'stack_sampler', None)
+        if sampler is not None and not iscoroutinefunction(view_func):
+            sampler.thread_id = threading.get_ident()
+
+    def is_sampled(self, request):
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+
+        token = request.META.get(META_KEY)
+        return token is not None and is_valid_profile_token(token)
+
+    def write(self, request, stacks):
+        resolver_match = getattr(request, 'resolver_match', None)
+        route = resolver_match.url_name if resolver_match is not None else 'unmatched'
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f'{route}.{time.time_ns()}.{os.getpid()}.folded')
+        with open(path, 'w') as file:
+            file.writelines(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+        self.rotate()
+        logger.info('Profiled %s %s into %s (%d samples)', request.method, request.path, path, stacks.total())
+
+    def rotate(self):
+        with _rotation_lock:
+            names = sorted(
+                (name for name in os.listdir(self.directory) if name.endswith('.folded')),
+                key=lambda name: int(name.rsplit('.', 3)[1])
+            )
+            for name in names[:max(0, len(names) - self.max_files)]:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    # Rotated by another worker
+                    pass
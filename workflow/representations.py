@@ -0,0 +1,147 @@
+from operator import attrgetter
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields as drf_fields, relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from workflow.instrumentation import timed_serialization
+
+# Fields whose representation of a database value is the value itself
+IDENTITY_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.IntegerField,
+)
+
+
+class Row:
+    """
+    `.values()` row readable through attributes (without copying it), for
+    the methods written against model instances (e.g. `SerializerMethodField`
+    getters).
+    """
+
+    def __init__(self, values):
+        self.__dict__ = values
+
+    @property
+    def pk(self):
+        return self.id
+
+
+class ValuesRepresentation:
+    """
+    Produces the representation of a `ModelSerializer` from `.values()`
+    rows, without building model instances or going through the fields'
+    `get_attribute` / `to_representation` for every value.
+
+    Each readable field of `serializer` (as configured for the current
+    request) is compiled once into a converter reading the row. Fields
+    computed from the instance declare the columns they need: serializer
+    methods through `Meta.values_columns`, custom fields through a
+    `values_columns` attribute and a `row_to_representation(row)` method.
+    """
+
+    def __init__(self, serializer):
+        self.model = serializer.Meta.model
+        self.columns = ['id']
+        self.converters = []
+
+        for field in serializer._readable_fields:
+            self.converters.append((field.field_name, self.compile(serializer, field)))
+
+    def add_columns(self, *columns):
+        for column in columns:
+            if column not in self.columns:
+                self.columns.append(column)
+
+    def compile(self, serializer, field):
+        if isinstance(field, serializers.SerializerMethodField):
+            method = getattr(serializer, field.method_name)
+            self.add_columns(*getattr(serializer.Meta, 'values_columns', {}).get(field.field_name, ()))
+            return method
+
+        if hasattr(field, 'row_to_representation'):
+            self.add_columns(*field.values_columns)
+            return field.row_to_representation
+
+        if '.' in field.source or field.source == '*':
+            raise TypeError(f'Field "{field.field_name}" cannot be represented from values.')
+
+        try:
+            column = self.model._meta.get_field(field.source).attname
+        except FieldDoesNotExist:
+            raise TypeError(f'Field "{field.field_name}" cannot be represented from values.')
+        self.add_columns(column)
+
+        get = attrgetter(column)
+
+        if isinstance(field, relations.PrimaryKeyRelatedField) and field.pk_field is None:
+            return get
+
+        if isinstance(field, drf_fields.ChoiceField) and all(isinstance(key, str) for key in field.choices):
+            return get
+
+        if isinstance(field, IDENTITY_FIELDS):
+            return get
+
+        if isinstance(field, drf_fields.DateTimeField):
+            convert = compile_datetime(field)
+        else:
+            convert = field.to_representation
+
+        def converter(row):
+            value = get(row)
+            return None if value is None else convert(value)
+
+        return converter
+
+    def to_representation(self, values):
+        row = Row(values)
+        return {name: converter(row) for name, converter in self.converters}
+
+
+def compile_datetime(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != drf_fields.ISO_8601:
+        return field.to_representation
+
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if field_timezone is None:
+        return field.to_representation
+
+    # ISO 8601 output of aware database values, as `DateTimeField.to_representation`
+    def convert(value):
+        value = value.astimezone(field_timezone).isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+    return convert
+
+
+class ValuesListMixin:
+    """
+    Serves list responses from `.values()` rows, through a
+    `ValuesRepresentation` of the view's serializer. Rows carry the
+    paginator's ordering columns, so cursors are built from them as well.
+    """
+
+    def get_values_queryset(self, queryset, representation):
+        columns = list(representation.columns)
+        if self.paginator is not None:
+            ordering = self.paginator.get_ordering(self.request, queryset, self)
+            columns += [field.lstrip('-') for field in ordering if field.lstrip('-') not in columns]
+
+        return queryset.values(*columns)
+
+    def list(self, request, *args, **kwargs):
+        representation = ValuesRepresentation(self.get_serializer())
+        queryset = self.get_values_queryset(self.filter_queryset(self.get_queryset()), representation)
+
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        with timed_serialization():
+            data = [representation.to_representation(row) for row in rows]
+
+        if page is not None:
+            return self.get_paginated_response(data)
+
+        return Response(data)
@@ -0,0 +1,126 @@
+import codecs
+import hashlib
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from workflow.models import ResumeBlob
+
+# Leading bytes of the accepted resume formats (DOCX files are ZIP archives)
+SIGNATURES = [
+    (b'%PDF-', 'application/pdf', 'pdf'),
+    (b'PK\x03\x04', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', 'docx'),
+]
+
+EXTENSIONS = {content_type: extension for _, content_type, extension in SIGNATURES}
+EXTENSIONS['text/plain'] = 'txt'
+
+
+class InvalidResume(ValueError):
+    pass
+
+
+def detect_content_type(head):
+    """
+    Returns the content type of a file from its first bytes, regardless of
+    the name and content type claimed by the client.
+    """
+    for signature, content_type, _ in SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+
+    # Plain text: valid UTF-8 (possibly cut in the middle of a character)
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+
+    return 'text/plain' if b'\x00' not in head else None
+
+
+def check_content_type(content_type):
+    if content_type not in settings.RESUME_UPLOAD['CONTENT_TYPES']:
+        raise InvalidResume('Resumes must be PDF, DOCX or plain text files.')
+
+
+def check_size(size):
+    max_size = settings.RESUME_UPLOAD['MAX_SIZE']
+    if size > max_size:
+        raise InvalidResume(f'Resumes cannot exceed {max_size} bytes.')
+
+
+def fingerprint(upload):
+    """
+    Sets `sha256` and the detected `content_type` on an uploaded file.
+
+    Uploads received through `workflow.uploads.ResumeUploadHandler` were
+    fingerprinted while being streamed; others are read once here.
+    """
+    if getattr(upload, 'sha256', None):
+        return upload
+
+    check_size(upload.size)
+    if not upload.size:
+        raise InvalidResume('The submitted file is empty.')
+
+    digest = hashlib.sha256()
+    content_type = None
+    for chunk in upload.chunks():
+        if content_type is None:
+            content_type = detect_content_type(chunk)
+            check_content_type(content_type)
+        digest.update(chunk)
+
+    upload.seek(0)
+    upload.sha256 = digest.hexdigest()
+    upload.content_type = content_type
+
+    return upload
+
+
+def blob_name(sha256, content_type):
+    # Two levels of 256 directories keep every directory small
+    return f'resumes/{sha256[:2]}/{sha256[2:4]}/{sha256}.{EXTENSIONS.get(content_type, "bin")}'
+
+
+def acquire_resume(upload):
+    """
+    Returns the blob holding the content of `upload`, storing it first if no
+    application referenced that content yet, and takes a reference on it.
+    """
+    upload = fingerprint(upload)
+    storage = ResumeBlob._meta.get_field('file').storage
+
+    with transaction.atomic():
+        blob = ResumeBlob.objects.select_for_update().filter(sha256=upload.sha256).first()
+        if blob is not None:
+            ResumeBlob.objects.filter(pk=blob.pk).update(references=F('references') + 1)
+            return blob
+
+        name = storage.save(blob_name(upload.sha256, upload.content_type), upload)
+        try:
+            with transaction.atomic():
+                return ResumeBlob.objects.create(
+                    sha256=upload.sha256,
+                    file=name,
+                    size=upload.size,
+                    content_type=upload.content_type,
+                    references=1
+                )
+        except IntegrityError:
+            # Stored concurrently by another request
+            storage.delete(name)
+
+        blob = ResumeBlob.objects.select_for_update().get(sha256=upload.sha256)
+        ResumeBlob.objects.filter(pk=blob.pk).update(references=F('references') + 1)
+
+        return blob
+
+
+def release_resume(blob_id):
+    """
+    Drops a reference on a blob, deleting it (and its file, see
+    `workflow.signals`) once no application references it anymore.
+    """
+    with transaction.atomic():
+        ResumeBlob.objects.filter(pk=blob_id).update(references=F('references') - 1)
+        ResumeBlob.objects.filter(pk=blob_id, references=0).delete()
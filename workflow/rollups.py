@@ -0,0 +1,145 @@
+import datetime
+from collections import Counter, defaultdict
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from workflow.contracts import APPLICATION_STAGES, ApplicationStatuses
+from workflow.models import ApplicationRollup, ApplicationStatusChange
+
+ROLLUP_FIELDS = ('created', 'entered', 'elapsed_seconds')
+
+
+def record_status_changes(changes):
+    """
+    Logs the statuses just entered by applications and adds them to the
+    rollups. `changes` holds `(application_id, job_id, status, created,
+    application_created_at)` tuples, `created` telling whether the
+    application was created in that status.
+    """
+    now = timezone.now()
+
+    events = [
+        ApplicationStatusChange(
+            application_id=application_id,
+            job_id=job_id,
+            status=status,
+            created=created,
+            elapsed_seconds=max(int((now - created_at).total_seconds()), 0),
+            changed_at=now
+        )
+        for application_id, job_id, status, created, created_at in changes
+    ]
+
+    ApplicationStatusChange.objects.bulk_create(events, batch_size=1000)
+    add_to_rollups(events)
+
+
+def add_to_rollups(events):
+    totals = defaultdict(Counter)
+    for event in events:
+        key = (event.job_id, timezone.localdate(event.changed_at), event.status)
+        totals[key]['created'] += int(event.created)
+        totals[key]['entered'] += 1
+        totals[key]['elapsed_seconds'] += event.elapsed_seconds
+
+    # Sorted, so concurrent transactions lock the rows in the same order
+    for job_id, day, status in sorted(totals):
+        values = {field: value for field, value in totals[job_id, day, status].items() if value}
+        rollups = ApplicationRollup.objects.filter(job_id=job_id, day=day, status=status)
+
+        if rollups.update(**{field: F(field) + value for field, value in values.items()}):
+            continue
+
+        try:
+            with transaction.atomic():
+                ApplicationRollup.objects.create(job_id=job_id, day=day, status=status, **values)
+        except IntegrityError:
+            # Created concurrently
+            rollups.update(**{field: F(field) + value for field, value in values.items()})
+
+
+def rebuild_rollups(since=None, until=None):
+    """
+    Recomputes the rollups of the days between `since` and `until`
+    (inclusive, both optional) from the status changes. Returns the number
+    of rollup rows written.
+    """
+    events = ApplicationStatusChange.objects.all()
+    rollups = ApplicationRollup.objects.all()
+
+    if since is not None:
+        events = events.filter(changed_at__gte=start_of_day(since))
+        rollups = rollups.filter(day__gte=since)
+    if until is not None:
+        events = events.filter(changed_at__lt=start_of_day(until + datetime.timedelta(days=1)))
+        rollups = rollups.filter(day__lte=until)
+
+    rows = events.annotate(day=TruncDate('changed_at')).order_by().values('job_id', 'day', 'status').annotate(
+        created=Count('pk', filter=Q(created=True)),
+        entered=Count('pk'),
+        elapsed_seconds=Sum('elapsed_seconds')
+    )
+
+    with transaction.atomic():
+        rollups.delete()
+        created = ApplicationRollup.objects.bulk_create(
+            [ApplicationRollup(**row) for row in rows.iterator()],
+            batch_size=1000
+        )
+
+    return len(created)
+
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def company_stats(company_id, since, until):
+    """
+    Hiring funnel of a company between `since` and `until` (inclusive),
+    answered from the rollups only.
+    """
+    rollups = ApplicationRollup.objects.filter(job__company_id=company_id, day__gte=since, day__lte=until).order_by()
+
+    per_day = dict(rollups.values('day').annotate(count=Sum('created')).values_list('day', 'count'))
+    entered = dict(rollups.values('status').annotate(count=Sum('entered')).values_list('status', 'count'))
+    offers = rollups.filter(status=ApplicationStatuses.OFFER).values('job_id', 'job__title').annotate(
+        count=Sum('entered'),
+        elapsed_seconds=Sum('elapsed_seconds')
+    ).order_by('job_id')
+
+    days = (until - since).days + 1
+    applications_per_day = [
+        {'day': day, 'applications': per_day.get(day, 0)}
+        for day in (since + datetime.timedelta(days=n) for n in range(days))
+    ]
+
+    funnel = []
+    previous = None
+    for stage in APPLICATION_STAGES:
+        count = entered.get(stage, 0)
+        funnel.append({
+            'status': stage,
+            'count': count,
+            # Share of the applications of the previous stage reaching this one
+            'conversion': round(count / previous, 4) if previous else None,
+        })
+        previous = count
+
+    return {
+        'since': since,
+        'until': until,
+        'applications_per_day': applications_per_day,
+        'funnel': funnel,
+        'disqualified': entered.get(ApplicationStatuses.DISQUALIFIED, 0),
+        'time_to_offer': [
+            {
+                'job': row['job_id'],
+                'title': row['job__title'],
+                'offers': row['count'],
+                'average_seconds': round(row['elapsed_seconds'] / row['count']),
+            }
+            for row in offers
+        ],
+    }
@@ -0,0 +1,177 @@
+import re
+import math
+import heapq
+import threading
+from collections import Counter, defaultdict
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import Case, F, FloatField, Value, When
+
+# Weights applied to the searchable fields. They mirror the `setweight`
+# labels used by the PostgreSQL trigger (A, B and C respectively).
+FIELD_WEIGHTS = {
+    'title': 1.0,
+    'category': 0.4,
+    'description': 0.2,
+}
+
+SEARCH_CONFIG = 'english'
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+STOP_WORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in',
+    'is', 'it', 'of', 'on', 'or', 'the', 'to', 'with',
+))
+
+
+def tokenize(text):
+    if not text:
+        return []
+
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+class PostgresJobSearch:
+    """
+    Ranked search over the `Job.search_vector` column.
+
+    The column is maintained by a database trigger (see migration
+    0004_job_search_vector), which also covers bulk inserts and updates.
+    """
+
+    def search(self, queryset, text):
+        """
+        Returns the matching jobs ordered by rank, and whether matches were
+        left out (never, every match is ranked).
+        """
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+
+        return queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query)
+        ).order_by('-rank', '-id'), False
+
+    def index(self, jobs):
+        pass
+
+    def remove(self, job_ids):
+        pass
+
+
+class InvertedIndexJobSearch:
+    """
+    Pure Python fallback used on databases without full-text search.
+
+    The index lives in the memory of the current process and is built from
+    the database on first use, then kept up to date through `index` and
+    `remove`. It is meant for SQLite development and test runs; the ids it
+    returns are always re-checked against the database. Only the
+    `max_results` best matches are ranked and returned: `search` tells when
+    others were left out, so that the API can report it.
+    """
+    max_results = 1000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.postings = defaultdict(dict)
+        self.documents = {}
+        self.built = False
+
+    def search(self, queryset, text):
+        self.build()
+        scores, total = self.score(tokenize(text))
+
+        # One WHEN per distinct score keeps the CASE short for large result sets.
+        ids_by_score = defaultdict(list)
+        for job_id, score in scores.items():
+            ids_by_score[score].append(job_id)
+
+        ranks = [When(pk__in=ids, then=Value(score)) for score, ids in ids_by_score.items()]
+        return queryset.filter(pk__in=scores.keys()).annotate(
+            rank=Case(*ranks, default=Value(0.0), output_field=FloatField())
+        ).order_by('-rank', '-id'), total > len(scores)
+
+    def score(self, tokens):
+        # Returns the best scores by job id, and the number of matches
+        # tf-idf over the weighted term frequencies; every token must match.
+        with self.lock:
+            if not tokens or not self.documents:
+                return {}, 0
+
+            matches = None
+            for token in set(tokens):
+                postings = self.postings.get(token, {})
+                matches = set(postings) if matches is None else matches & set(postings)
+
+            if not matches:
+                return {}, 0
+
+            scores = {}
+            for token in set(tokens):
+                postings = self.postings[token]
+                idf = math.log(1 + len(self.documents) / len(postings))
+                for job_id in matches:
+                    scores[job_id] = scores.get(job_id, 0.0) + postings[job_id] * idf
+
+        best = heapq.nlargest(self.max_results, scores.items(), key=lambda item: (item[1], item[0]))
+        return {job_id: round(score, 6) for job_id, score in best}, len(scores)
+
+    def build(self):
+        if self.built:
+            return
+
+        from workflow.models import Job
+
+        with self.lock:
+            if self.built:
+                return
+
+            for job in Job.objects.values('id', *FIELD_WEIGHTS).iterator(chunk_size=2000):
+                self._add(job)
+
+            self.built = True
+
+    def index(self, jobs):
+        if not self.built:
+            return
+
+        with self.lock:
+            for job in jobs:
+                self._remove(job.id)
+                self._add({'id': job.id, **{field: getattr(job, field) for field in FIELD_WEIGHTS}})
+
+    def remove(self, job_ids):
+        if not self.built:
+            return
+
+        with self.lock:
+            for job_id in job_ids:
+                self._remove(job_id)
+
+    def _add(self, job):
+        frequencies = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(job[field]):
+                frequencies[token] += weight
+
+        for token, frequency in frequencies.items():
+            self.postings[token][job['id']] = frequency
+
+        self.documents[job['id']] = tuple(frequencies)
+
+    def _remove(self, job_id):
+        for token in self.documents.pop(job_id, ()):
+            postings = self.postings[token]
+            postings.pop(job_id, None)
+            if not postings:
+                del self.postings[token]
+
+
+_inverted_index = InvertedIndexJobSearch()
+
+
+def get_job_search():
+    if connection.vendor == 'postgresql':
+        return PostgresJobSearch()
+
+    return _inverted_index
@@ -0,0 +1,421 @@
+import random
+import datetime
+import functools
+import itertools
+import multiprocessing
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import django
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from authentication.contracts import UserTypes
+from authentication.models import User
+from workflow.cache import response_cache
+from workflow.contracts import APPLICATION_STAGES, ApplicationStatuses, JobContracts, JobModalities, JobTypes
+from workflow.models import APPLICATION_COUNTERS, Application, ApplicationStatusChange, Company, Job
+from workflow.rollups import rebuild_rollups, start_of_day
+
+# Rows generated from one random stream and written in one transaction.
+# The data only depends on the seed and the volumes, not on the number of
+# workers nor on the order the chunks are written in.
+CHUNK_SIZE = 10_000
+
+# Share of the applications in each status
+STATUS_WEIGHTS = {
+    ApplicationStatuses.APPLIED.value: 50,
+    ApplicationStatuses.IN_REVIEW.value: 25,
+    ApplicationStatuses.WAITING_FOR_ITW.value: 10,
+    ApplicationStatuses.OFFER.value: 5,
+    ApplicationStatuses.DISQUALIFIED.value: 10,
+}
+
+PUBLISHED_SHARE = 0.9
+CLOSED_SHARE = 0.15
+
+CONTRACT_WEIGHTS = {JobContracts.PERMANENT.value: 75, JobContracts.FIXED.value: 20, JobContracts.INTERNSHIP.value: 5}
+TYPE_WEIGHTS = {JobTypes.FULL_TIME.value: 85, JobTypes.PART_TIME.value: 15}
+MODALITY_WEIGHTS = {JobModalities.HYBRID.value: 50, JobModalities.ON_SITE.value: 30, JobModalities.REMOTE.value: 20}
+
+ROLES = {
+    'Engineering': ('Backend Engineer', 'Frontend Engineer', 'Mobile Developer', 'DevOps Engineer', 'QA Engineer'),
+    'Data': ('Data Analyst', 'Data Engineer', 'Data Scientist', 'Machine Learning Engineer'),
+    'Design': ('Product Designer', 'UX Researcher', 'Graphic Designer'),
+    'Product': ('Product Manager', 'Product Owner', 'Business Analyst'),
+    'Marketing': ('Growth Marketer', 'Content Writer', 'SEO Specialist', 'Brand Manager'),
+    'Sales': ('Account Executive', 'Sales Development Representative', 'Account Manager'),
+    'Customer Success': ('Support Specialist', 'Customer Success Manager', 'Onboarding Specialist'),
+    'Finance': ('Accountant', 'Financial Controller', 'Payroll Specialist'),
+    'Human Resources': ('Recruiter', 'HR Business Partner', 'Talent Acquisition Lead'),
+    'Operations': ('Office Manager', 'Operations Analyst', 'Supply Chain Coordinator'),
+}
+CATEGORIES = tuple(ROLES)
+LEVELS = ('Junior', '', '', 'Senior', 'Senior', 'Lead', 'Principal')
+SKILLS = (
+    'Python', 'Django', 'PostgreSQL', 'React', 'TypeScript', 'Kubernetes', 'SQL', 'Excel', 'Figma', 'Salesforce',
+    'communication', 'negotiation', 'leadership', 'analytics', 'writing', 'planning', 'budgeting', 'hiring'
+)
+COMPANY_WORDS = (
+    'Blue', 'North', 'Bright', 'Green', 'Atlas', 'Summit', 'River', 'Nova', 'Pixel', 'Quantum', 'Urban', 'Harbor'
+)
+COMPANY_SUFFIXES = ('Labs', 'Systems', 'Group', 'Solutions', 'Studio', 'Partners', 'Logistics', 'Health', 'Bank')
+STREETS = ('Main', 'Oak', 'Maple', 'Cedar', 'Park', 'Lake', 'Hill', 'Station', 'Market', 'Church')
+CITIES = ('Paris', 'Lyon', 'Berlin', 'Madrid', 'Lisbon', 'London', 'Amsterdam', 'Brussels', 'Milan', 'Dublin')
+FIRST_NAMES = (
+    'Alice', 'Bruno', 'Chloe', 'David', 'Emma', 'Farid', 'Grace', 'Hugo', 'Ines', 'Jules', 'Karim', 'Lea', 'Marc',
+    'Nora', 'Omar', 'Paula', 'Quentin', 'Rose', 'Sami', 'Theo', 'Una', 'Victor', 'Wendy', 'Yanis', 'Zoe'
+)
+LAST_NAMES = (
+    'Martin', 'Bernard', 'Dubois', 'Garcia', 'Muller', 'Rossi', 'Silva', 'Smith', 'Jones', 'Kowalski', 'Novak',
+    'Petit', 'Moreau', 'Laurent', 'Fischer', 'Lopez', 'Costa', 'Brown', 'Nielsen', 'Horvat'
+)
+
+Plan = namedtuple('Plan', [
+    'seed', 'companies', 'jobs', 'managers', 'applicants', 'applications',
+    # Popularity exponent: 1 is uniform, higher values concentrate the
+    # jobs on a few companies and the applications on a few jobs
+    'skew',
+    # `(status, weight)` pairs
+    'status_weights',
+    'history_days', 'until', 'prefix', 'password',
+    # Ids given to the first rows, the following ones are consecutive
+    'first_company_id', 'first_job_id', 'first_user_id', 'first_application_id',
+])
+
+
+def volumes(scale):
+    companies = max(1, round(10_000 * scale))
+    jobs = max(companies, round(500_000 * scale))
+    applications = round(5_000_000 * scale)
+
+    return {
+        'companies': companies,
+        'jobs': jobs,
+        'managers': max(1, companies // 100),
+        'applicants': max(1, applications // 20),
+        'applications': applications,
+    }
+
+
+def make_plan(seed, companies, jobs, managers, applicants, applications, skew=2.0, status_weights=None,
+              history_days=365, until=None, prefix='seed', password='!'):
+    """
+    Describes the data to seed. The ids following the largest existing ones
+    are reserved, and every date falls before the end of `until` (today by
+    default).
+    """
+    def next_id(model):
+        return (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+
+    return Plan(
+        seed=seed,
+        companies=companies,
+        jobs=jobs,
+        managers=managers,
+        applicants=applicants,
+        applications=applications,
+        skew=skew,
+        status_weights=tuple((status_weights or STATUS_WEIGHTS).items()),
+        history_days=history_days,
+        until=start_of_day((until or timezone.localdate()) + datetime.timedelta(days=1)),
+        prefix=prefix,
+        password=password,
+        first_company_id=next_id(Company),
+        first_job_id=next_id(Job),
+        first_user_id=next_id(User),
+        first_application_id=next_id(Application),
+    )
+
+
+def seed(plan, workers=0, progress=None):
+    """
+    Writes the companies, users, jobs and applications of `plan`, chunk by
+    chunk, in `workers` spawned processes (the current process if 0), then
+    fills in the job counters and the rollups.
+    """
+    phases = [
+        ('companies', plan.companies),
+        ('users', plan.managers + plan.applicants),
+        ('jobs', plan.jobs),
+        ('applications', plan.applications),
+    ]
+
+    if workers:
+        # Spawned: the workers open their own database connections
+        executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'), initializer=django.setup)
+        run = executor.map
+    else:
+        executor = None
+        run = map
+
+    try:
+        for kind, count in phases:
+            chunks = range(chunk_count(count))
+            written = 0
+            for rows in run(seed_chunk, itertools.repeat(plan), itertools.repeat(kind), chunks):
+                written += rows
+                if progress is not None:
+                    progress(kind, written, count)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    finish(plan)
+
+
+def finish(plan):
+    with transaction.atomic():
+        fill_job_counters(plan.first_job_id, plan.first_job_id + plan.jobs - 1)
+
+        # The ids were given explicitly, the sequences are moved past them
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Company, User, Job, Application]):
+                cursor.execute(sql)
+
+    rebuild_rollups(since=(plan.until - datetime.timedelta(days=plan.history_days + 1)).date())
+    response_cache.invalidate('jobs')
+
+
+def fill_job_counters(first_id, last_id):
+    # One statement: the seeded jobs are counted from the application index
+    applications = Application.objects.filter(job=OuterRef('pk')).order_by().values('job')
+
+    def count(queryset):
+        return Coalesce(Subquery(queryset.annotate(count=Count('pk')).values('count')), 0)
+
+    Job.objects.filter(pk__range=(first_id, last_id)).update(
+        applications_count=count(applications),
+        **{field: count(applications.filter(status=status)) for status, field in APPLICATION_COUNTERS.items()}
+    )
+
+
+def seed_chunk(plan, kind, chunk):
+    generate = GENERATORS[kind]
+
+    with transaction.atomic():
+        tables = generate(plan, chunk)
+        for objects in tables:
+            insert_objects(objects)
+
+    return len(tables[0])
+
+
+def insert_objects(objects):
+    """
+    Writes model instances with a single `COPY` on PostgreSQL, and a single
+    `executemany` elsewhere. Unlike `bulk_create`, the dates are written as
+    given (`auto_now_add` would replace them).
+    """
+    if not objects:
+        return
+
+    # Resolved once, rather than through the proxy for every value
+    database = connections[DEFAULT_DB_ALIAS]
+    meta = objects[0]._meta
+    fields = [field for field in meta.concrete_fields if not (field.primary_key and objects[0].pk is None)]
+    prepare = [(field.attname, field.get_db_prep_save) for field in fields]
+    quote = database.ops.quote_name
+    table = quote(meta.db_table)
+    columns = ', '.join(quote(field.column) for field in fields)
+    rows = ([get_db_prep_save(getattr(obj, attname), database) for attname, get_db_prep_save in prepare] for obj in objects)
+
+    with database.cursor() as cursor:
+        if database.vendor == 'postgresql':
+            with cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:
+            placeholders = ', '.join(['%s'] * len(fields))
+            cursor.executemany(f'INSERT INTO {table} ({columns}) VALUES ({placeholders})', list(rows))
+
+
+def chunk_count(count):
+    return -(-count // CHUNK_SIZE)
+
+
+def chunk_range(count, chunk):
+    return range(chunk * CHUNK_SIZE, min((chunk + 1) * CHUNK_SIZE, count))
+
+
+def chunk_random(plan, kind, chunk):
+    return random.Random(f'{plan.seed}:{kind}:{chunk}')
+
+
+def weighted(rng, weights):
+    return rng.choices(tuple(weights), tuple(weights.values()))[0]
+
+
+def skewed(rng, count, skew):
+    # Index in `range(count)`, the first ones being the most likely
+    return int(count * rng.random() ** skew)
+
+
+# Generators, returning the instances of a chunk, by table
+
+def generate_companies(plan, chunk):
+    rng = chunk_random(plan, 'companies', chunk)
+    companies = []
+
+    for index in chunk_range(plan.companies, chunk):
+        created_at = plan.until - datetime.timedelta(days=plan.history_days * (1 + rng.random()))
+        companies.append(Company(
+            id=plan.first_company_id + index,
+            name=f'{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}',
+            address=f'{rng.randint(1, 200)} {rng.choice(STREETS)} Street, {rng.choice(CITIES)}',
+            created_at=created_at,
+            updated_at=created_at,
+        ))
+
+    return [companies]
+
+
+def generate_users(plan, chunk):
+    rng = chunk_random(plan, 'users', chunk)
+    users = []
+
+    for index in chunk_range(plan.managers + plan.applicants, chunk):
+        is_manager = index < plan.managers
+        username = f'{plan.prefix}-manager-{index}' if is_manager else f'{plan.prefix}-applicant-{index - plan.managers}'
+        users.append(User(
+            id=plan.first_user_id + index,
+            username=username,
+            password=plan.password,
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            email=f'{username}@example.com',
+            phone=f'06{rng.randrange(10 ** 8):08d}',
+            type=(UserTypes.MANAGER if is_manager else UserTypes.APPLICANT).value,
+            date_joined=plan.until - datetime.timedelta(days=plan.history_days * (1 + rng.random())),
+        ))
+
+    return [users]
+
+
+def job_dates(plan, chunk):
+    """
+    Creation, publication and closing dates of the jobs of a chunk, drawn
+    from their own stream so that `published_jobs` can replay it alone.
+    """
+    rng = chunk_random(plan, 'job-dates', chunk)
+    history = datetime.timedelta(days=plan.history_days)
+
+    for _ in chunk_range(plan.jobs, chunk):
+        created_at = plan.until - history * rng.random()
+        published_at = closed_at = None
+        if rng.random() < PUBLISHED_SHARE:
+            published_at = created_at + (plan.until - created_at) * rng.random() * 0.1
+            if rng.random() < CLOSED_SHARE:
+                closed_at = published_at + (plan.until - published_at) * rng.random()
+
+        yield created_at, published_at, closed_at
+
+
+@functools.lru_cache(maxsize=1)
+def published_jobs(plan):
+    """
+    Indexes of the published jobs, and the span during which each accepted
+    applications, in seconds before `plan.until`. Kept once per process.
+    """
+    indexes, starts, ends = array('q'), array('d'), array('d')
+
+    for chunk in range(chunk_count(plan.jobs)):
+        for index, (_, published_at, closed_at) in zip(chunk_range(plan.jobs, chunk), job_dates(plan, chunk)):
+            if published_at is not None:
+                indexes.append(index)
+                starts.append((plan.until - published_at).total_seconds())
+                ends.append((plan.until - closed_at).total_seconds() if closed_at else 0.0)
+
+    return indexes, starts, ends
+
+
+def generate_jobs(plan, chunk):
+    rng = chunk_random(plan, 'jobs', chunk)
+    jobs = []
+
+    for index, (created_at, published_at, closed_at) in zip(chunk_range(plan.jobs, chunk), job_dates(plan, chunk)):
+        category = rng.choice(CATEGORIES)
+        role = rng.choice(ROLES[category])
+        skills = ', '.join(rng.sample(SKILLS, 3))
+        jobs.append(Job(
+            id=plan.first_job_id + index,
+            company_id=plan.first_company_id + skewed(rng, plan.companies, plan.skew),
+            title=f'{rng.choice(LEVELS)} {role}'.strip(),
+            category=category,
+            description=f'We are looking for a {role.lower()} to join our {category.lower()} team. Skills: {skills}.',
+            contract=weighted(rng, CONTRACT_WEIGHTS),
+            type=weighted(rng, TYPE_WEIGHTS),
+            modalities=weighted(rng, MODALITY_WEIGHTS),
+            created_at=created_at,
+            updated_at=closed_at or published_at or created_at,
+            published_at=published_at,
+            closed_at=closed_at,
+        ))
+
+    return [jobs]
+
+
+def status_path(rng, status):
+    # Statuses entered by an application until `status`, see `APPLICATION_TRANSITIONS`
+    # (plain strings, database drivers may adapt enums by name)
+    if status == ApplicationStatuses.DISQUALIFIED:
+        stages = APPLICATION_STAGES[:rng.randint(1, len(APPLICATION_STAGES) - 1)]
+    else:
+        stages = APPLICATION_STAGES[:APPLICATION_STAGES.index(status) + 1]
+        status = None
+
+    return [stage.value for stage in stages] + ([status] if status else [])
+
+
+def generate_applications(plan, chunk):
+    rng = chunk_random(plan, 'applications', chunk)
+    indexes, starts, ends = published_jobs(plan)
+    statuses, weights = zip(*plan.status_weights)
+    cum_weights = list(itertools.accumulate(weights))
+    first_applicant_id = plan.first_user_id + plan.managers
+    applications = []
+    changes = []
+
+    for index in chunk_range(plan.applications, chunk):
+        position = skewed(rng, len(indexes), plan.skew)
+        job_id = plan.first_job_id + indexes[position]
+
+        # Seconds before `plan.until`, decreasing along the path
+        created = starts[position] - (starts[position] - ends[position]) * rng.random()
+        changed = created
+        path = status_path(rng, rng.choices(statuses, cum_weights=cum_weights)[0])
+        application_id = plan.first_application_id + index
+
+        for stage, status in enumerate(path):
+            if stage:
+                changed -= changed * rng.random() * 0.3
+            changes.append(ApplicationStatusChange(
+                application_id=application_id,
+                job_id=job_id,
+                status=status,
+                created=not stage,
+                elapsed_seconds=int(created - changed),
+                changed_at=plan.until - datetime.timedelta(seconds=changed),
+            ))
+
+        applications.append(Application(
+            id=application_id,
+            job_id=job_id,
+            applicant_id=first_applicant_id + rng.randrange(plan.applicants),
+            status=path[-1],
+            description='I would love to join your team.',
+            created_at=plan.until - datetime.timedelta(seconds=created),
+            updated_at=plan.until - datetime.timedelta(seconds=changed),
+        ))
+
+    return [applications, changes]
+
+
+GENERATORS = {
+    'companies': generate_companies,
+    'users': generate_users,
+    'jobs': generate_jobs,
+    'applications': generate_applications,
+}
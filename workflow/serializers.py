@@ -1,34 +1,133 @@
+from django.conf import settings
+from django.db import transaction
+from django.urls import reverse
 from rest_framework import serializers
-from workflow.models import Application, Company, Job
+from workflow.contracts import APPLICATION_TRANSITIONS, ApplicationStatuses
+from workflow.instrumentation import TimedSerializerMixin
+from workflow.models import APPLICATION_COUNTERS, Application, Company, Job
+from workflow.resumes import InvalidResume, acquire_resume, fingerprint, release_resume
+from authentication.contracts import UserTypes
 from authentication.models import User
 
 
-class JobSerializer(serializers.ModelSerializer):
-    company = serializers.PrimaryKeyRelatedField(queryset=Company.objects.all())
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Looks up related objects in `context['related'][field_name]` when the
+    caller prefetched them (e.g. once per batch), instead of one query per
+    value.
+    """
+
+    def to_internal_value(self, data):
+        related = self.context.get('related', {}).get(self.field_name)
+        if related is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        try:
+            return related[int(data)]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+
+class JobSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    company = PrefetchedPrimaryKeyRelatedField(queryset=Company.objects.all())
+    application_counts = serializers.SerializerMethodField()
 
     class Meta:
         model = Job
         fields = [
             'id', 'company', 'title', 'description',
             'contract', 'type', 'modalities',
-            'created_at', 'published_at', 'closed_at'
+            'created_at', 'published_at', 'closed_at',
+            'applications_count', 'application_counts'
         ]
         read_only_fields = ['created_at']
+        # Columns read by the methods, see `workflow.representations`
+        values_columns = {'application_counts': list(APPLICATION_COUNTERS.values())}
+
+    # Application counters are only shown to managers
+    def get_fields(self):
+        fields = super().get_fields()
 
+        request = self.context.get('request')
+        if request is None or getattr(request.user, 'type', None) != UserTypes.MANAGER:
+            del fields['applications_count']
+            del fields['application_counts']
 
-class CompanySerializer(serializers.ModelSerializer):
-    jobs = JobSerializer(many=True, read_only=True)
+        return fields
+
+    def get_application_counts(self, job):
+        return {status: getattr(job, field) for status, field in APPLICATION_COUNTERS.items()}
+
+
+class CompanySerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    jobs = serializers.SerializerMethodField()
+    jobs_count = serializers.SerializerMethodField()
+    jobs_url = serializers.HyperlinkedIdentityField(view_name='company-job-list')
 
     class Meta:
         model = Company
-        fields = ['id', 'name', 'address', 'jobs', 'created_at']
+        fields = ['id', 'name', 'address', 'jobs', 'jobs_count', 'jobs_url', 'created_at']
         read_only_fields = ['created_at']
 
+    # Companies fetched through `Company.objects.with_jobs_summary()` carry
+    # their recent jobs and job count; others (e.g. freshly created) query them.
+    def get_jobs(self, company):
+        jobs = getattr(company, 'recent_jobs', None)
+
+        if jobs is None:
+            jobs = company.jobs.open().order_by('-created_at', '-id')[:settings.COMPANY_EMBEDDED_JOBS]
+
+        return JobSerializer(jobs, many=True, context=self.context).data
+
+    def get_jobs_count(self, company):
+        jobs_count = getattr(company, 'jobs_count', None)
+
+        if jobs_count is None:
+            jobs_count = company.jobs.count()
+
+        return jobs_count
+
+
+class ResumeField(serializers.FileField):
+    """
+    Accepts an uploaded resume and represents the application's resume by
+    the URL of its download endpoint.
+    """
+    values_columns = ('id', 'resume_id')
+
+    def to_internal_value(self, data):
+        upload = super().to_internal_value(data)
+
+        try:
+            return fingerprint(upload)
+        except InvalidResume as exc:
+            raise serializers.ValidationError(str(exc))
+
+    def get_attribute(self, instance):
+        return instance if instance.resume_id is not None else None
+
+    def to_representation(self, application):
+        if application is None:
+            return None
+
+        url = reverse('application-resume', kwargs={'pk': application.pk})
+        request = self.context.get('request')
 
-class ApplicationSerializer(serializers.ModelSerializer):
+        return request.build_absolute_uri(url) if request is not None else url
+
+    def row_to_representation(self, row):
+        return self.to_representation(row) if row.resume_id is not None else None
+
+
+class ApplicationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     applicant = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
     job = serializers.PrimaryKeyRelatedField(queryset=Job.objects.all())
-    resume = serializers.FileField(
+    resume = ResumeField(
         max_length=None,
         allow_null=True,
         required=False,
@@ -52,3 +151,66 @@ class ApplicationSerializer(serializers.ModelSerializer):
             })
 
         return attrs
+
+    # Uploaded resumes are swapped for the deduplicated blob of their content
+    def create(self, validated_data):
+        with transaction.atomic():
+            if validated_data.get('resume') is not None:
+                validated_data['resume'] = acquire_resume(validated_data['resume'])
+
+            return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        if 'resume' not in validated_data:
+            return super().update(instance, validated_data)
+
+        with transaction.atomic():
+            previous_id = instance.resume_id
+            if validated_data['resume'] is not None:
+                validated_data['resume'] = acquire_resume(validated_data['resume'])
+
+            instance = super().update(instance, validated_data)
+
+            if previous_id is not None:
+                release_resume(previous_id)
+
+        return instance
+
+    def validate_status(self, value):
+        if self.instance is None or value == self.instance.status:
+            return value
+
+        if value not in APPLICATION_TRANSITIONS[self.instance.status]:
+            raise serializers.ValidationError(
+                f'An application cannot move from "{self.instance.status}" to "{value}".'
+            )
+
+        return value
+
+
+class ApplicationTransitionSerializer(serializers.Serializer):
+    """
+    Target status of a bulk transition, and the applications to move: either
+    explicit `ids`, or the applications of a `job` (optionally only those
+    currently in `from_status`). Both are capped by
+    `APPLICATION_TRANSITION_MAX_ITEMS`: the applications of a job left to
+    move are reported by `has_more`, for another call.
+    """
+    status = serializers.ChoiceField(choices=ApplicationStatuses.choices)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=settings.APPLICATION_TRANSITION_MAX_ITEMS,
+        required=False
+    )
+    job = serializers.PrimaryKeyRelatedField(queryset=Job.objects.only('pk'), required=False)
+    from_status = serializers.ChoiceField(choices=ApplicationStatuses.choices, required=False)
+
+    def validate(self, attrs):
+        if ('ids' in attrs) == ('job' in attrs):
+            raise serializers.ValidationError('Provide either a list of ids or a job.')
+
+        if 'from_status' in attrs and 'job' not in attrs:
+            raise serializers.ValidationError({'from_status': 'Can only be used along with a job.'})
+
+        return attrs
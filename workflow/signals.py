@@ -0,0 +1,107 @@
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from workflow.cache import response_cache
+from workflow.connections import count_connection
+from workflow.counters import counter_deltas, update_job_counters
+from workflow.extraction import schedule_extraction
+from workflow.instrumentation import record_query
+from workflow.rollups import record_status_changes
+from workflow.models import Application, Company, Job, ResumeBlob
+from workflow.resumes import release_resume
+from workflow.search import get_job_search
+
+
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, **kwargs):
+    get_job_search().index([instance])
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    get_job_search().remove([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job(sender, instance, **kwargs):
+    scopes = {'jobs', f'job:{instance.pk}', f'company:{instance.company_id}'}
+
+    # A job moved to another company also leaves the previous one
+    loaded_company_id = getattr(instance, '_loaded_values', {}).get('company_id')
+    if loaded_company_id is not None:
+        scopes.add(f'company:{loaded_company_id}')
+
+    response_cache.invalidate(*scopes)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_company(sender, instance, **kwargs):
+    response_cache.invalidate(f'company:{instance.pk}')
+
+
+@receiver(post_save, sender=Application)
+def track_saved_application(sender, instance, created, **kwargs):
+    current = (instance.job_id, instance.status)
+
+    if created:
+        update_job_counters(counter_deltas(added=[current]))
+        record_status_changes([(instance.pk, instance.job_id, instance.status, True, instance.created_at)])
+    else:
+        loaded = getattr(instance, '_loaded_values', {})
+        previous = (loaded.get('job_id', instance.job_id), loaded.get('status', instance.status))
+        if previous != current:
+            update_job_counters(counter_deltas(removed=[previous], added=[current]))
+        if previous[1] != current[1]:
+            record_status_changes([(instance.pk, instance.job_id, instance.status, False, instance.created_at)])
+
+    instance._loaded_values = {**getattr(instance, '_loaded_values', {}), 'job_id': current[0], 'status': current[1]}
+
+
+@receiver(post_delete, sender=Application)
+def count_deleted_application(sender, instance, origin=None, **kwargs):
+    # Cascaded from the deletion of its job (or of the company of the job):
+    # the counters are deleted along with the job
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model in (Job, Company):
+        return
+
+    loaded = getattr(instance, '_loaded_values', {})
+    previous = (loaded.get('job_id', instance.job_id), loaded.get('status', instance.status))
+
+    update_job_counters(counter_deltas(removed=[previous]))
+
+
+@receiver(post_delete, sender=Application)
+def release_application_resume(sender, instance, **kwargs):
+    if instance.resume_id is not None:
+        release_resume(instance.resume_id)
+
+
+@receiver(post_save, sender=ResumeBlob)
+def extract_resume_text(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: schedule_extraction([instance.pk]))
+
+
+@receiver(post_delete, sender=ResumeBlob)
+def delete_resume_file(sender, instance, **kwargs):
+    # Only once the deletion is committed, the blob could still be rolled back
+    transaction.on_commit(lambda: instance.file.delete(save=False))
+
+
+@receiver(connection_created)
+def track_connection(sender, connection, **kwargs):
+    # A new server connection, unless DB_POOLING=pool: then a checkout from
+    # the pool, once per request (see `database_stats`)
+    count_connection(connection.alias)
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs):
+    # Wrappers outlive reconnections of the same connection object
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.test import override_settings
+from workflow.instrumentation import request_instrumented
+
+
+class QueryBudgetMixin:
+    """
+    Fails a test when one of its requests runs more SQL queries than the
+    budget of its endpoint, declared in `query_budgets` by method and route
+    name, e.g. `{'GET job-list': 2}`. Requests are measured by the
+    instrumentation middleware, enabled for the test case.
+    """
+    query_budgets = {}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.enterClassContext(override_settings(
+            REQUEST_INSTRUMENTATION={**settings.REQUEST_INSTRUMENTATION, 'ENABLED': True, 'LOG': False}
+        ))
+
+        request_instrumented.connect(cls.check_query_budget)
+        cls.addClassCleanup(request_instrumented.disconnect, cls.check_query_budget)
+
+    @classmethod
+    def check_query_budget(cls, sender, request, metrics, **kwargs):
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            return
+
+        endpoint = f'{request.method} {resolver_match.url_name}'
+        budget = cls.query_budgets.get(endpoint)
+
+        # Raised from the middleware, then re-raised by the test client
+        if budget is not None and metrics.queries > budget:
+            raise cls.failureException(f'{endpoint} ran {metrics.queries} queries, over its budget of {budget}.')
@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs the tests with the query inspection on, N+1 patterns failing the
+    requests that run them.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.query_inspection = settings.QUERY_INSPECTION
+        settings.QUERY_INSPECTION = {**settings.QUERY_INSPECTION, 'ENABLED': True, 'ACTION': 'raise'}
+
+    def teardown_test_environment(self, **kwargs):
+        settings.QUERY_INSPECTION = self.query_inspection
+        super().teardown_test_environment(**kwargs)
@@ -1,6 +1,7 @@
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
 from workflow.models import Application
 from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
 from workflow.contracts import ApplicationStatuses
@@ -38,6 +39,17 @@ class ApplicationDetailViewTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_applicants_authenticated_by_access_token_can_retrieve_their_application(self):
+        # A real token, whose user is built from the claims (`TokenUser`)
+        other = ApplicationFactory(applicant=UserFactory(username='other'), job=self.job)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.applicant)}')
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('application-detail', kwargs={'pk': other.id}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_applicants_can_only_retrieve_their_application(self):
         # Creating an application that belongs to another applicant
         application = ApplicationFactory(
@@ -76,6 +88,15 @@ class ApplicationDetailViewTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Application.objects.get().status, ApplicationStatuses.IN_REVIEW)
 
+    def test_managers_cannot_skip_application_statuses(self):
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.patch(self.url, {'status': ApplicationStatuses.OFFER})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('status', response.data)
+        self.assertEqual(Application.objects.get().status, ApplicationStatuses.APPLIED)
+
     def test_applicants_cannot_delete_their_application(self):
         self.client.force_authenticate(user=self.applicant)
 
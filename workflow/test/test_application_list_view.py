@@ -7,9 +7,12 @@ from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
 from workflow.contracts import ApplicationStatuses
 from authentication.contracts import UserTypes
 from authentication.factories import UserFactory
+from workflow.test.budgets import QueryBudgetMixin
 
 
-class ApplicationListViewTest(APITestCase):
+class ApplicationListViewTest(QueryBudgetMixin, APITestCase):
+    query_budgets = {'GET application-list': 2, 'POST application-list': 11}
+
     def setUp(self) -> None:
         self.client = APIClient()
         self.url = reverse('application-list')
@@ -95,7 +98,7 @@ class ApplicationListViewTest(APITestCase):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
     def test_applicants_can_only_view_their_own_applications(self):
         # Creating an application for a different candidate and for the same job
@@ -105,4 +108,14 @@ class ApplicationListViewTest(APITestCase):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
\ No newline at end of file
+        self.assertEqual(response.data['results'], [])
+
+    def test_managers_can_view_all_applications(self):
+        ApplicationFactory(applicant=self.applicant, job=self.job)
+        ApplicationFactory(job=self.job)
+
+        self.client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
@@ -0,0 +1,111 @@
+import shutil
+import tempfile
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from workflow.resumes import acquire_resume
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+PDF = b'%PDF-1.4\n' + bytes(range(256)) * 4
+
+
+class ApplicationResumeViewTest(APITestCase):
+    def setUp(self) -> None:
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.client = APIClient()
+
+        self.applicant = UserFactory(username='applicant', type=UserTypes.APPLICANT)
+        self.application = ApplicationFactory(
+            applicant=self.applicant,
+            job=JobFactory(company=CompanyFactory(jobs=None), applications=None),
+            resume=acquire_resume(SimpleUploadedFile('resume.pdf', PDF))
+        )
+
+        self.url = reverse('application-resume', kwargs={'pk': self.application.id})
+        self.client.force_authenticate(user=self.applicant)
+
+    def test_applicants_can_download_their_resume(self) -> None:
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), PDF)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['Content-Length'], str(len(PDF)))
+        self.assertEqual(response['ETag'], f'"{self.application.resume.sha256}"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+    def test_managers_can_download_any_resume(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_applicants_cannot_download_the_resume_of_others(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='other', type=UserTypes.APPLICANT))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_applications_without_resume_have_nothing_to_download(self) -> None:
+        application = ApplicationFactory(applicant=self.applicant, job=self.application.job)
+
+        response = self.client.get(reverse('application-resume', kwargs={'pk': application.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_byte_ranges_are_served_partially(self) -> None:
+        for header, expected, content_range in (
+            ('bytes=10-19', PDF[10:20], f'bytes 10-19/{len(PDF)}'),
+            ('bytes=1000-', PDF[1000:], f'bytes 1000-{len(PDF) - 1}/{len(PDF)}'),
+            ('bytes=-5', PDF[-5:], f'bytes {len(PDF) - 5}-{len(PDF) - 1}/{len(PDF)}'),
+        ):
+            response = self.client.get(self.url, HTTP_RANGE=header)
+
+            self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+            self.assertEqual(b''.join(response.streaming_content), expected)
+            self.assertEqual(response['Content-Range'], content_range)
+            self.assertEqual(response['Content-Length'], str(len(expected)))
+
+    def test_unsatisfiable_ranges_are_rejected(self) -> None:
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(PDF)}-')
+
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(PDF)}')
+
+    def test_stale_if_range_serves_the_whole_file(self) -> None:
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), PDF)
+
+    def test_unchanged_resumes_are_not_sent_again(self) -> None:
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @override_settings(FILE_DOWNLOAD={'OFFLOAD': 'x-accel-redirect', 'ACCEL_REDIRECT_PREFIX': '/protected/'})
+    def test_transfers_can_be_offloaded_to_the_proxy(self) -> None:
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected/{self.application.resume.file.name}')
+        self.assertEqual(response.content, b'')
+
+    @override_settings(FILE_DOWNLOAD={'OFFLOAD': 'nginx', 'ACCEL_REDIRECT_PREFIX': '/protected/'})
+    def test_unknown_offload_modes_are_rejected(self) -> None:
+        with self.assertRaisesMessage(ImproperlyConfigured, 'Unknown FILE_DOWNLOAD offload mode: nginx'):
+            self.client.get(self.url)
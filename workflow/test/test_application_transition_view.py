@@ -0,0 +1,127 @@
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from workflow.counters import reconcile_job_counters
+from workflow.models import Application
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from workflow.contracts import ApplicationStatuses
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class ApplicationTransitionViewTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('application-transition')
+
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+        self.job = JobFactory(company=CompanyFactory(jobs=None), applications=None)
+
+        self.applied = [ApplicationFactory(job=self.job) for _ in range(3)]
+        self.offer = ApplicationFactory(job=self.job, status=ApplicationStatuses.OFFER)
+
+    def statuses(self) -> dict:
+        return dict(Application.objects.values_list('id', 'status'))
+
+    def test_applicants_cannot_transition_applications(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='applicant', type=UserTypes.APPLICANT))
+
+        response = self.client.post(
+            self.url,
+            {'status': ApplicationStatuses.IN_REVIEW, 'ids': [self.offer.id]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_managers_can_transition_applications_by_ids(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+        ids = [application.id for application in self.applied]
+
+        response = self.client.post(
+            self.url,
+            {'status': ApplicationStatuses.IN_REVIEW, 'ids': ids + [self.offer.id, 0]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], ids)
+        self.assertEqual([entry['id'] for entry in response.data['rejected']], [self.offer.id, 0])
+
+        statuses = self.statuses()
+        self.assertTrue(all(statuses[pk] == ApplicationStatuses.IN_REVIEW for pk in ids))
+        self.assertEqual(statuses[self.offer.id], ApplicationStatuses.OFFER)
+
+    def test_managers_can_transition_the_applications_of_a_job(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.post(
+            self.url,
+            {'status': ApplicationStatuses.DISQUALIFIED, 'job': self.job.id, 'from_status': ApplicationStatuses.APPLIED},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['updated']), 3)
+        self.assertEqual(response.data['rejected'], [])
+        self.assertEqual(self.statuses()[self.offer.id], ApplicationStatuses.OFFER)
+
+    def test_transitions_are_applied_with_a_single_update(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, {'status': ApplicationStatuses.IN_REVIEW, 'job': self.job.id}, format='json')
+
+        updates = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('UPDATE "workflow_application"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"id" IN', updates[0])
+
+    def test_applications_arriving_after_the_rows_are_read_are_left_alone(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+        late = []
+
+        def insert_after_read(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            if not late and sql.startswith('SELECT "workflow_application"."id", "workflow_application"."status"'):
+                late.append(ApplicationFactory(job=self.job))
+            return result
+
+        with connection.execute_wrapper(insert_after_read):
+            response = self.client.post(
+                self.url,
+                {'status': ApplicationStatuses.IN_REVIEW, 'job': self.job.id},
+                format='json'
+            )
+
+        self.assertEqual(len(response.data['updated']), 3)
+        self.assertEqual(self.statuses()[late[0].id], ApplicationStatuses.APPLIED)
+        self.assertEqual(reconcile_job_counters([self.job.id]), [])
+
+    @override_settings(APPLICATION_TRANSITION_MAX_ITEMS=2)
+    def test_the_applications_of_a_job_are_moved_in_capped_calls(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+        data = {'status': ApplicationStatuses.IN_REVIEW, 'job': self.job.id}
+
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.data['updated'], [application.id for application in self.applied[:2]])
+        self.assertTrue(response.data['has_more'])
+
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.data['updated'], [self.applied[2].id])
+        self.assertEqual(response.data['rejected'], [])
+        self.assertFalse(response.data['has_more'])
+
+    def test_either_ids_or_a_job_is_required(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+
+        for data in ({'status': ApplicationStatuses.IN_REVIEW},
+                     {'status': ApplicationStatuses.IN_REVIEW, 'ids': [self.offer.id], 'job': self.job.id}):
+            response = self.client.post(self.url, data, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,118 @@
+import asyncio
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.test import AsyncClient
+from django.urls import resolve, reverse
+from django.utils import timezone
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+from authentication.models import User
+
+
+class AsyncReadViewsTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+
+        self.company = CompanyFactory(jobs=None)
+        self.job = JobFactory(company=self.company, applications=None, published_at=timezone.now())
+        JobFactory.create_batch(3, company=self.company, applications=None)
+
+        self.applicant = UserFactory(username='applicant', type=UserTypes.APPLICANT)
+        self.other = UserFactory(username='other', type=UserTypes.APPLICANT)
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+
+        ApplicationFactory(applicant=self.applicant, job=self.job)
+        ApplicationFactory(applicant=self.other, job=self.job)
+
+    def assertSameResponse(self, name, async_name, **kwargs) -> None:
+        response = self.client.get(reverse(name, **kwargs))
+        async_response = self.client.get(reverse(async_name, **kwargs))
+
+        self.assertEqual(async_response.status_code, response.status_code)
+        self.assertEqual(async_response.json(), response.json())
+        # ETags differ: they are derived from the request URL
+        self.assertEqual(async_response.get('Last-Modified'), response.get('Last-Modified'))
+
+    def test_views_are_coroutines(self) -> None:
+        for name in ['async-job-list', 'async-company-list', 'async-application-list']:
+            self.assertTrue(asyncio.iscoroutinefunction(resolve(reverse(name)).func.view_class.as_view()))
+
+    def test_async_views_respond_like_the_sync_views(self) -> None:
+        self.assertSameResponse('job-list', 'async-job-list')
+        self.assertSameResponse('job-detail', 'async-job-detail', kwargs={'pk': self.job.id})
+        self.assertSameResponse('company-list', 'async-company-list')
+        self.assertSameResponse('company-detail', 'async-company-detail', kwargs={'pk': self.company.id})
+
+        self.client.force_authenticate(user=self.manager)
+        self.assertSameResponse('application-list', 'async-application-list')
+
+    def test_pagination_and_filters(self) -> None:
+        response = self.client.get(reverse('async-job-list'), {'page_size': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+
+        response = self.client.get(response.data['next'])
+
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_missing_objects_return_404(self) -> None:
+        response = self.client.get(reverse('async-job-detail', kwargs={'pk': 0}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_conditional_requests_return_304(self) -> None:
+        url = reverse('async-job-detail', kwargs={'pk': self.job.id})
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unauthenticated_users_cannot_list_applications(self) -> None:
+        response = self.client.get(reverse('async-application-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_applicants_only_list_their_own_applications(self) -> None:
+        self.client.force_authenticate(user=self.applicant)
+
+        response = self.client.get(reverse('async-application-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['applicant'] for item in response.data['results']], [self.applicant.id])
+
+    def test_write_methods_are_not_allowed(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.post(reverse('async-job-list'), {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+
+class AsyncReadViewsJWTTest(APITestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create(username='manager', type=UserTypes.MANAGER)
+        self.user.set_password('secret_1234_56')
+        self.user.save()
+
+        ApplicationFactory(job=JobFactory(company=CompanyFactory(jobs=None), applications=None))
+
+    async def test_access_tokens_authenticate_async_requests(self) -> None:
+        client = AsyncClient()
+        response = await client.post(reverse('token-obtain-pair'), {
+            'username': 'manager',
+            'password': 'secret_1234_56'
+        })
+        token = response.json()['access']
+
+        response = await client.get(reverse('async-application-list'), headers={'Authorization': 'Bearer ' + token})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 1)
+
+    async def test_invalid_tokens_are_rejected(self) -> None:
+        response = await AsyncClient().get(reverse('async-application-list'), headers={'Authorization': 'Bearer invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,34 @@
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.urls import reverse
+from workflow.factories import CompanyFactory, JobFactory
+
+
+class CompanyJobListViewTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.company = CompanyFactory(jobs=None)
+        self.jobs = JobFactory.create_batch(3, company=self.company, applications=None)
+        self.url = reverse('company-job-list', kwargs={'pk': self.company.id})
+
+    def test_only_jobs_of_the_company_are_listed(self) -> None:
+        JobFactory(company=CompanyFactory(jobs=None), applications=None)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(job['id'] for job in response.data['results']),
+            sorted(job.id for job in self.jobs)
+        )
+
+    def test_jobs_are_paginated(self) -> None:
+        response = self.client.get(self.url + '?page_size=2')
+
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_unknown_companies_are_not_found(self) -> None:
+        response = self.client.get(reverse('company-job-list', kwargs={'pk': self.company.id + 1}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,12 +1,18 @@
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 from django.urls import reverse
+from django.test import override_settings
+from django.utils import timezone
 from workflow.models import Company
+from workflow.factories import CompanyFactory, JobFactory
 from authentication.contracts import UserTypes
 from authentication.factories import UserFactory
+from workflow.test.budgets import QueryBudgetMixin
 
 
-class CompanyListViewTest(APITestCase):
+class CompanyListViewTest(QueryBudgetMixin, APITestCase):
+    query_budgets = {'GET company-list': 3, 'POST company-list': 3}
+
     def setUp(self) -> None:
         self.client = APIClient()
         self.url = reverse('company-list')
@@ -37,4 +43,45 @@ class CompanyListViewTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Company.objects.count(), 1)
-        self.assertEqual(Company.objects.get().name, 'Company')
\ No newline at end of file
+        self.assertEqual(Company.objects.get().name, 'Company')
+
+
+class CompanyListQueriesTest(QueryBudgetMixin, APITestCase):
+    query_budgets = {'GET company-list': 3, 'POST company-list': 3}
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('company-list')
+
+    def create_companies(self, count) -> None:
+        for _ in range(count):
+            company = CompanyFactory(jobs=None)
+            JobFactory.create_batch(3, company=company, applications=None, published_at=timezone.now())
+
+    def test_listing_companies_uses_a_constant_number_of_queries(self) -> None:
+        self.create_companies(2)
+
+        # Validators aggregate, companies, then the prefetched jobs
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['results']), 2)
+
+        self.create_companies(8)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_embedded_jobs_are_capped_to_recent_open_jobs(self) -> None:
+        company = CompanyFactory(jobs=None)
+        JobFactory.create_batch(3, company=company, applications=None, published_at=timezone.now())
+        JobFactory(company=company, applications=None, published_at=None)
+        JobFactory(company=company, applications=None, published_at=timezone.now(), closed_at=timezone.now())
+
+        with override_settings(COMPANY_EMBEDDED_JOBS=2):
+            response = self.client.get(self.url)
+
+        data = response.data['results'][0]
+        self.assertEqual(len(data['jobs']), 2)
+        self.assertEqual(data['jobs_count'], 5)
+        self.assertTrue(data['jobs_url'].endswith(reverse('company-job-list', kwargs={'pk': company.id})))
@@ -0,0 +1,83 @@
+import datetime
+import io
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from workflow.models import ApplicationRollup, ApplicationStatusChange
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from workflow.contracts import ApplicationStatuses
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class CompanyStatsViewTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+
+        self.company = CompanyFactory(jobs=None)
+        self.job = JobFactory(company=self.company, applications=None)
+        self.url = reverse('company-stats', kwargs={'pk': self.company.id})
+
+        self.applications = [ApplicationFactory(job=self.job) for _ in range(4)]
+        self.move(self.applications[:2], ApplicationStatuses.IN_REVIEW)
+        self.move(self.applications[:1], ApplicationStatuses.WAITING_FOR_ITW)
+        self.move(self.applications[:1], ApplicationStatuses.OFFER)
+        self.move(self.applications[3:], ApplicationStatuses.DISQUALIFIED)
+
+        # Another company's applications are not counted
+        ApplicationFactory(job=JobFactory(company=CompanyFactory(jobs=None), applications=None))
+
+    def move(self, applications, status) -> None:
+        self.client.post(reverse('application-transition'), {
+            'status': status,
+            'ids': [application.id for application in applications],
+        }, format='json')
+
+    def test_applicants_cannot_read_company_stats(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='applicant', type=UserTypes.APPLICANT))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_stats_are_answered_from_the_rollups(self) -> None:
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['applications_per_day']), 30)
+        self.assertEqual(response.data['applications_per_day'][-1], {'day': timezone.localdate(), 'applications': 4})
+        self.assertEqual(
+            [(stage['status'], stage['count'], stage['conversion']) for stage in response.data['funnel']],
+            [('applied', 4, None), ('in_review', 2, 0.5), ('waiting', 1, 0.5), ('offer', 1, 1.0)]
+        )
+        self.assertEqual(response.data['disqualified'], 1)
+        self.assertEqual(response.data['time_to_offer'][0]['job'], self.job.id)
+        self.assertEqual(response.data['time_to_offer'][0]['offers'], 1)
+
+    def test_stats_can_be_restricted_to_a_period(self) -> None:
+        yesterday = timezone.localdate() - datetime.timedelta(days=1)
+
+        response = self.client.get(self.url, {'since': yesterday - datetime.timedelta(days=6), 'until': yesterday})
+
+        self.assertEqual(len(response.data['applications_per_day']), 7)
+        self.assertEqual(response.data['funnel'][0]['count'], 0)
+
+    def test_invalid_periods_are_rejected(self) -> None:
+        for params in ({'since': 'yesterday'}, {'since': '2024-02-01', 'until': '2024-01-01'},
+                       {'since': '2020-01-01', 'until': '2024-01-01'}):
+            response = self.client.get(self.url, params)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rollups_can_be_rebuilt_from_the_status_changes(self) -> None:
+        expected = set(ApplicationRollup.objects.values_list('job', 'day', 'status', 'created', 'entered'))
+        ApplicationRollup.objects.update(entered=0)
+
+        call_command('rebuild_rollups', since=str(timezone.localdate()), stdout=io.StringIO())
+
+        self.assertEqual(set(ApplicationRollup.objects.values_list('job', 'day', 'status', 'created', 'entered')), expected)
+        self.assertEqual(ApplicationStatusChange.objects.count(), 5 + 5)
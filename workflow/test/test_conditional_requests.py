@@ -0,0 +1,123 @@
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class ConditionalRequestsTest(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+        self.client = APIClient()
+        self.company = CompanyFactory(jobs=None)
+        self.job = JobFactory(company=self.company, applications=None, published_at=timezone.now())
+        self.applicant = UserFactory(username='applicant', type=UserTypes.APPLICANT)
+        self.application = ApplicationFactory(applicant=self.applicant, job=self.job)
+
+    def test_responses_carry_validators(self) -> None:
+        for url in (reverse('job-list'), reverse('job-detail', kwargs={'pk': self.job.id}),
+                    reverse('company-list'), reverse('company-detail', kwargs={'pk': self.company.id})):
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn('ETag', response)
+            self.assertIn('Authorization', response['Vary'])
+
+        # Only representations of a single row can tell their last modification
+        self.assertIn('Last-Modified', self.client.get(reverse('job-detail', kwargs={'pk': self.job.id})))
+        self.assertNotIn('Last-Modified', self.client.get(reverse('job-list')))
+        self.assertNotIn('Last-Modified', self.client.get(reverse('company-detail', kwargs={'pk': self.company.id})))
+
+    def test_matching_etags_are_not_modified(self) -> None:
+        url = reverse('company-list')
+        etag = self.client.get(url)['ETag']
+
+        # Only the validators aggregate runs, nothing is serialized
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_cached_responses_are_revalidated_without_queries(self) -> None:
+        url = reverse('job-detail', kwargs={'pk': self.job.id})
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_modified_since_is_honoured(self) -> None:
+        url = reverse('job-detail', kwargs={'pk': self.job.id})
+        last_modified = self.client.get(url)['Last-Modified']
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etags_change_when_embedded_jobs_change(self) -> None:
+        url = reverse('company-detail', kwargs={'pk': self.company.id})
+        etag = self.client.get(url)['ETag']
+
+        self.job.title = 'Renamed'
+        self.job.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etags_change_when_a_row_leaves_the_page(self) -> None:
+        other = JobFactory(company=self.company, applications=None)
+        url = reverse('job-list')
+        etag = self.client.get(url)['ETag']
+
+        other.delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deleted_rows_are_not_hidden_from_modified_since(self) -> None:
+        other = JobFactory(company=self.company, applications=None)
+        url = reverse('job-list')
+        self.client.get(url)
+
+        other.delete()
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_etags_differ_between_managers_and_other_users(self) -> None:
+        url = reverse('job-detail', kwargs={'pk': self.job.id})
+
+        self.client.force_authenticate(user=self.applicant)
+        etag = self.client.get(url)['ETag']
+
+        self.client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('applications_count', response.data)
+
+    def test_applications_are_not_confirmed_to_other_applicants(self) -> None:
+        url = reverse('application-detail', kwargs={'pk': self.application.id})
+
+        self.client.force_authenticate(user=self.applicant)
+        etag = self.client.get(url)['ETag']
+
+        self.client.force_authenticate(user=UserFactory(username='other'))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_updated_at_is_maintained(self) -> None:
+        updated_at = self.job.updated_at
+
+        self.job.title = 'Renamed'
+        self.job.save()
+
+        self.assertGreater(self.job.updated_at, updated_at)
@@ -0,0 +1,55 @@
+from unittest import mock
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.db import connections
+from django.test import override_settings
+from django.urls import reverse
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class FakePool:
+    def get_stats(self):
+        return {
+            'pool_min': 2, 'pool_max': 10, 'pool_size': 4, 'pool_available': 1, 'requests_waiting': 0,
+            'connections_num': 4,
+        }
+
+
+class DatabaseStatsViewTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('monitoring-db')
+
+    def test_managers_can_read_the_connection_statistics(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        database = response.data['databases']['default']
+        self.assertEqual(database['conn_max_age'], connections['default'].settings_dict['CONN_MAX_AGE'])
+        self.assertIn('connections_opened', database)
+        self.assertIsNone(database['pool'])
+
+    @override_settings(DB_POOLING='pool')
+    def test_pool_utilization_is_reported(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+
+        with mock.patch.object(type(connections['default']), 'pool', FakePool(), create=True):
+            response = self.client.get(self.url)
+
+        database = response.data['databases']['default']
+        pool = database['pool']
+        self.assertEqual(response.data['pooling'], 'pool')
+        # Connections opened by the pool, not checkouts
+        self.assertEqual(database['connections_opened'], 4)
+        self.assertEqual(pool['pool_available'], 1)
+        self.assertEqual(pool['utilization'], 0.3)
+
+    def test_applicants_cannot_read_the_connection_statistics(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='applicant'))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,101 @@
+import io
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from workflow.models import Application, Job
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from workflow.contracts import ApplicationStatuses
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class JobApplicationCountersTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+        self.job = JobFactory(company=CompanyFactory(jobs=None), applications=None)
+
+    def counters(self, job=None) -> tuple:
+        job = Job.objects.get(pk=(job or self.job).pk)
+
+        return job.applications_count, job.applications_applied_count, job.applications_in_review_count
+
+    def test_counters_follow_created_and_deleted_applications(self) -> None:
+        applications = [ApplicationFactory(job=self.job) for _ in range(3)]
+        self.assertEqual(self.counters(), (3, 3, 0))
+
+        applications[0].delete()
+        self.assertEqual(self.counters(), (2, 2, 0))
+
+    def test_deleting_a_job_does_not_update_its_counters(self) -> None:
+        for _ in range(3):
+            ApplicationFactory(job=self.job)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.job.delete()
+
+        self.assertFalse(any(query['sql'].startswith('UPDATE "workflow_job"') for query in queries.captured_queries))
+        self.assertFalse(Application.objects.exists())
+
+    def test_counters_follow_status_and_job_changes(self) -> None:
+        application = ApplicationFactory(job=self.job)
+
+        application.status = ApplicationStatuses.IN_REVIEW
+        application.save()
+        self.assertEqual(self.counters(), (1, 0, 1))
+
+        other_job = JobFactory(company=self.job.company, applications=None)
+        application.job = other_job
+        application.save()
+        self.assertEqual(self.counters(), (0, 0, 0))
+        self.assertEqual(self.counters(other_job), (1, 0, 1))
+
+    def test_saving_a_stale_job_keeps_its_counters(self) -> None:
+        job = Job.objects.get(pk=self.job.pk)
+        ApplicationFactory(job=self.job)
+
+        job.title = 'Renamed'
+        job.save()
+
+        self.assertEqual(self.counters(), (1, 1, 0))
+
+    def test_bulk_transitions_move_the_counters(self) -> None:
+        applications = [ApplicationFactory(job=self.job) for _ in range(3)]
+        self.client.force_authenticate(user=self.manager)
+
+        self.client.post(reverse('application-transition'), {
+            'status': ApplicationStatuses.IN_REVIEW,
+            'ids': [application.id for application in applications[:2]],
+        }, format='json')
+
+        self.assertEqual(self.counters(), (3, 1, 2))
+
+    def test_counters_are_only_shown_to_managers(self) -> None:
+        ApplicationFactory(job=self.job)
+        url = reverse('job-detail', kwargs={'pk': self.job.pk})
+
+        self.assertNotIn('applications_count', self.client.get(url).data)
+
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['applications_count'], 1)
+        self.assertEqual(response.data['application_counts'][ApplicationStatuses.APPLIED], 1)
+        self.assertEqual(response.data['application_counts'][ApplicationStatuses.OFFER], 0)
+
+    def test_the_command_repairs_drifted_counters(self) -> None:
+        ApplicationFactory(job=self.job)
+        untouched = JobFactory(company=self.job.company, applications=None)
+        Job.objects.filter(pk=self.job.pk).update(applications_count=7, applications_offer_count=2)
+
+        output = io.StringIO()
+        call_command('reconcile_job_counters', batch_size=1, stdout=output)
+
+        self.assertEqual(self.counters(), (1, 1, 0))
+        self.assertEqual(Job.objects.get(pk=self.job.pk).applications_offer_count, 0)
+        self.assertEqual(self.counters(untouched), (0, 0, 0))
+        self.assertIn('Repaired the counters of 1 jobs.', output.getvalue())
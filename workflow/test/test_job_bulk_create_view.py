@@ -0,0 +1,104 @@
+import json
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from workflow.models import Job
+from workflow.factories import CompanyFactory
+from workflow.contracts import JobContracts
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class JobBulkCreateViewTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('job-bulk')
+        self.company = CompanyFactory(jobs=None)
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+
+    def job(self, **kwargs) -> dict:
+        return {'company': self.company.id, 'title': 'Data Engineer', 'category': 'Engineering', **kwargs}
+
+    def test_applicants_cannot_create_jobs_in_bulk(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='applicant'))
+
+        response = self.client.post(self.url, [self.job()], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Job.objects.count(), 0)
+
+    def test_managers_can_create_jobs_from_a_json_array(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.post(self.url, [self.job(title='First'), self.job(title='Second')], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['errors'], [])
+        self.assertEqual(sorted(Job.objects.values_list('title', flat=True)), ['First', 'Second'])
+
+    def test_managers_can_create_jobs_from_ndjson(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+        body = '\n'.join(json.dumps(self.job(title=f'Job {n}')) for n in range(3)) + '\n'
+
+        response = self.client.post(self.url, body, content_type='application/x-ndjson')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Job.objects.count(), 3)
+
+    def test_invalid_items_are_reported_without_aborting_the_batch(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+        body = '\n'.join([
+            json.dumps(self.job(title='Valid')),
+            json.dumps(self.job(contract='freelance')),
+            '{not json',
+            json.dumps(self.job(company=self.company.id + 100)),
+            json.dumps({'title': 'Missing fields'}),
+        ])
+
+        response = self.client.post(self.url, body, content_type='application/x-ndjson')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual([error['index'] for error in response.data['errors']], [1, 2, 3, 4])
+        self.assertIn('contract', response.data['errors'][0]['errors'])
+        self.assertIn('company', response.data['errors'][2]['errors'])
+        self.assertEqual(Job.objects.get().title, 'Valid')
+
+    def test_nothing_valid_is_a_bad_request(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+
+        response = self.client.post(self.url, [self.job(contract='freelance')], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.url, {'title': 'Not a list'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(JOB_BULK_CHUNK_SIZE=2)
+    def test_jobs_are_validated_and_inserted_per_chunk(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+        jobs = [self.job(title=f'Job {n}', contract=JobContracts.FIXED) for n in range(5)]
+
+        # Three chunks of one company lookup and one insert, plus the savepoint
+        with self.assertNumQueries(3 * 2 + 2):
+            response = self.client.post(self.url, jobs, format='json')
+
+        self.assertEqual(response.data['created'], 5)
+        self.assertEqual(Job.objects.filter(contract=JobContracts.FIXED).count(), 5)
+
+    def test_created_jobs_are_visible_on_the_job_board(self) -> None:
+        cache.clear()
+        self.client.get(reverse('job-list'))
+        self.client.force_authenticate(user=self.manager)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, [self.job(title='Searchable Engineer')], format='json')
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse('job-list'), {'q': 'searchable'})
+        self.assertEqual(len(response.data['results']), 1)
+
+        response = self.client.get(reverse('job-list'))
+        self.assertEqual(len(response.data['results']), 1)
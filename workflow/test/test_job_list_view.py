@@ -1,14 +1,19 @@
+import datetime
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 from django.urls import reverse
+from django.utils import timezone
 from workflow.models import Job
-from workflow.factories import CompanyFactory
+from workflow.factories import CompanyFactory, JobFactory
 from workflow.contracts import JobTypes, JobContracts, JobModalities
 from authentication.contracts import UserTypes
 from authentication.factories import UserFactory
+from workflow.test.budgets import QueryBudgetMixin
 
 
-class JobListViewTest(APITestCase):
+class JobListViewTest(QueryBudgetMixin, APITestCase):
+    query_budgets = {'GET job-list': 2, 'POST job-list': 2}
+
     def setUp(self) -> None:
         self.client = APIClient()
         self.url = reverse('job-list')
@@ -45,4 +50,67 @@ class JobListViewTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Job.objects.count(), 1)
-        self.assertEqual(Job.objects.get().title, 'Data Engineer')
\ No newline at end of file
+        self.assertEqual(Job.objects.get().title, 'Data Engineer')
+
+
+class JobListFilteringTest(QueryBudgetMixin, APITestCase):
+    query_budgets = {'GET job-list': 2, 'POST job-list': 2}
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('job-list')
+        self.company = CompanyFactory(jobs=None)
+
+        self.draft = JobFactory(company=self.company, applications=None)
+        self.open = JobFactory(
+            company=self.company,
+            applications=None,
+            category='Sales',
+            contract=JobContracts.FIXED,
+            modalities=JobModalities.REMOTE,
+            published_at=timezone.now()
+        )
+        self.closed = JobFactory(
+            company=CompanyFactory(jobs=None),
+            applications=None,
+            type=JobTypes.PART_TIME,
+            published_at=timezone.now() - datetime.timedelta(days=10),
+            closed_at=timezone.now()
+        )
+
+    def get_ids(self, query) -> list:
+        response = self.client.get(self.url + query)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(job['id'] for job in response.data['results'])
+
+    def test_jobs_can_be_filtered_by_status(self) -> None:
+        self.assertEqual(self.get_ids('?status=open'), [self.open.id])
+        self.assertEqual(self.get_ids('?status=published'), [self.open.id, self.closed.id])
+        self.assertEqual(self.get_ids('?status=closed'), [self.closed.id])
+
+    def test_jobs_can_be_filtered_by_contract_type_and_modalities(self) -> None:
+        self.assertEqual(self.get_ids('?contract=fixed'), [self.open.id])
+        self.assertEqual(self.get_ids('?contract=fixed,permanent'), [self.draft.id, self.open.id, self.closed.id])
+        self.assertEqual(self.get_ids('?type=part_time'), [self.closed.id])
+        self.assertEqual(self.get_ids('?modalities=remote'), [self.open.id])
+
+    def test_jobs_can_be_filtered_by_category_and_company(self) -> None:
+        self.assertEqual(self.get_ids('?category=Sales'), [self.open.id])
+        self.assertEqual(self.get_ids('?company=%d' % self.company.id), [self.draft.id, self.open.id])
+
+    def test_jobs_can_be_filtered_by_date_range(self) -> None:
+        yesterday = (timezone.now() - datetime.timedelta(days=1)).date().isoformat()
+
+        self.assertEqual(self.get_ids('?published_after=' + yesterday), [self.open.id])
+        self.assertEqual(self.get_ids('?published_before=' + yesterday), [self.closed.id])
+        self.assertEqual(self.get_ids('?created_before=' + yesterday), [])
+
+    def test_filters_can_be_combined(self) -> None:
+        self.assertEqual(self.get_ids('?status=published&contract=permanent'), [self.closed.id])
+
+    def test_invalid_filters_are_rejected(self) -> None:
+        response = self.client.get(self.url + '?status=archived&contract=freelance&company=abc&created_after=soon')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {'status', 'contract', 'company', 'created_after'})
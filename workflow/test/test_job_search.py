@@ -0,0 +1,73 @@
+from unittest import mock
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.urls import reverse
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.search import InvertedIndexJobSearch
+
+
+class JobSearchTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('job-list')
+        self.company = CompanyFactory(jobs=None)
+
+        self.title_match = JobFactory(
+            company=self.company, applications=None,
+            title='Python Developer', category='Engineering', description='Backend services'
+        )
+        self.description_match = JobFactory(
+            company=self.company, applications=None,
+            title='Data Analyst', category='Data', description='Some Python scripting is a plus'
+        )
+        self.no_match = JobFactory(
+            company=self.company, applications=None,
+            title='Account Manager', category='Sales', description='Grow our customer base'
+        )
+
+    def search(self, query) -> list:
+        response = self.client.get(self.url, {'q': query})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [job['id'] for job in response.data['results']]
+
+    def test_results_are_ranked_by_relevance(self) -> None:
+        self.assertEqual(self.search('python'), [self.title_match.id, self.description_match.id])
+
+    def test_every_term_must_match(self) -> None:
+        self.assertEqual(self.search('python backend'), [self.title_match.id])
+        self.assertEqual(self.search('python unknown'), [])
+
+    def test_the_index_follows_job_updates_and_deletions(self) -> None:
+        self.search('python')
+
+        self.no_match.title = 'Python Trainer'
+        self.no_match.save()
+        self.title_match.delete()
+
+        self.assertEqual(self.search('python'), [self.no_match.id, self.description_match.id])
+
+    def test_ranked_results_are_paginated(self) -> None:
+        response = self.client.get(self.url, {'q': 'python', 'page_size': 1})
+        self.assertEqual([job['id'] for job in response.data['results']], [self.title_match.id])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual([job['id'] for job in response.data['results']], [self.description_match.id])
+        self.assertIsNone(response.data['next'])
+
+    def test_search_can_be_combined_with_filters(self) -> None:
+        response = self.client.get(self.url, {'q': 'python', 'category': 'Data'})
+
+        self.assertEqual([job['id'] for job in response.data['results']], [self.description_match.id])
+
+    def test_searches_report_whether_matches_were_left_out(self) -> None:
+        response = self.client.get(self.url, {'q': 'python'})
+        self.assertFalse(response.data['truncated'])
+
+        with mock.patch.object(InvertedIndexJobSearch, 'max_results', 1):
+            # Another URL than the cached response above
+            response = self.client.get(self.url, {'q': 'python', 'page_size': 10})
+
+        self.assertTrue(response.data['truncated'])
+        self.assertEqual([job['id'] for job in response.data['results']], [self.title_match.id])
+        self.assertNotIn('truncated', self.client.get(self.url).data)
@@ -0,0 +1,92 @@
+import io
+import uuid
+import decimal
+import datetime
+from unittest import mock, skipIf
+from zoneinfo import ZoneInfo
+from rest_framework import parsers, renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient, APITestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.parsers import JSONParser, NDJSONParser
+from workflow.renderers import JSONRenderer, orjson
+
+
+class JSONRendererTest(APITestCase):
+    def setUp(self) -> None:
+        self.data = {
+            'id': 1,
+            'name': 'Café   société',
+            'created_at': datetime.datetime(2024, 3, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'published_at': datetime.datetime(2024, 3, 1, 9, 30, tzinfo=ZoneInfo('Europe/Paris')),
+            'day': datetime.date(2024, 3, 1),
+            'at': datetime.time(9, 30),
+            'elapsed': datetime.timedelta(hours=1),
+            'salary': decimal.Decimal('1234.50'),
+            'label': gettext_lazy('Permanent Contract'),
+            'token': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'jobs': [{'id': 2, 'closed_at': None, 'counts': {'applied': 1}}],
+            'empty': [],
+        }
+
+    def test_output_is_identical_to_the_stdlib_renderer(self) -> None:
+        self.assertEqual(JSONRenderer().render(self.data), renderers.JSONRenderer().render(self.data))
+
+    def test_the_stdlib_is_used_when_orjson_is_not_installed(self) -> None:
+        with mock.patch('workflow.renderers.orjson', None):
+            self.assertEqual(JSONRenderer().render(self.data), renderers.JSONRenderer().render(self.data))
+
+    def test_indented_output_is_identical_to_the_stdlib_renderer(self) -> None:
+        media_type = 'application/json; indent=4'
+
+        self.assertEqual(
+            JSONRenderer().render(self.data, media_type),
+            renderers.JSONRenderer().render(self.data, media_type)
+        )
+
+    def test_responses_are_rendered_like_before(self) -> None:
+        company = CompanyFactory(jobs=None)
+        JobFactory.create_batch(2, company=company, applications=None)
+
+        response = APIClient().get(reverse('company-list'))
+
+        self.assertEqual(response.content, renderers.JSONRenderer().render(response.data))
+
+
+class JSONParserTest(APITestCase):
+    def parse(self, parser, body, encoding='utf-8'):
+        return parser.parse(io.BytesIO(body), parser_context={'encoding': encoding})
+
+    def test_bodies_are_parsed_like_the_stdlib_parser(self) -> None:
+        body = b'{"title": "Caf\xc3\xa9", "ids": [1, 2.5, null, true, 9223372036854775807]}'
+
+        self.assertEqual(self.parse(JSONParser(), body), self.parse(parsers.JSONParser(), body))
+
+    def test_other_encodings_are_parsed_by_the_stdlib_parser(self) -> None:
+        body = '{"title": "Café"}'.encode('latin-1')
+
+        self.assertEqual(self.parse(JSONParser(), body, 'latin-1'), {'title': 'Café'})
+
+    def test_invalid_bodies_are_reported_like_the_stdlib_parser(self) -> None:
+        for body in (b'{"title": ', b'[NaN]', b''):
+            with self.assertRaises(ParseError) as expected:
+                self.parse(parsers.JSONParser(), body)
+
+            with self.assertRaises(ParseError) as actual:
+                self.parse(JSONParser(), body)
+
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_ndjson_lines_are_parsed_like_the_stdlib(self) -> None:
+        body = b'{"id": 1}\n\n{"id": NaN}\n'
+
+        self.assertEqual(self.parse(NDJSONParser(), body), [{'id': 1}, '{"id": NaN}'])
+
+    @skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson_is_used_when_installed(self) -> None:
+        with mock.patch('workflow.parsers.orjson.loads', wraps=orjson.loads) as loads:
+            self.assertEqual(self.parse(JSONParser(), b'{"id": 1}'), {'id': 1})
+
+        loads.assert_called_once()
@@ -0,0 +1,126 @@
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+from unittest import mock
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.metrics import render_metrics
+
+# Records requests as a worker process with a shared metrics directory
+WORKER = '''
+from workflow.metrics import REQUESTS_IN_FLIGHT, count_cache_lookup, observe_request
+observe_request('job-list', 'GET', 200, 0.02, 2, 0.001)
+count_cache_lookup(True)
+REQUESTS_IN_FLIGHT.inc()
+'''
+
+
+def sample_values(content, name):
+    return {
+        tuple(sorted(sample.labels.items())): sample.value
+        for family in text_string_to_metric_families(content.decode())
+        for sample in family.samples
+        if sample.name == name
+    }
+
+
+@override_settings(METRICS={'ENABLED': True, 'TOKEN': None})
+class MetricsViewTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('metrics')
+        JobFactory(company=CompanyFactory(jobs=None), applications=None, published_at=timezone.now())
+
+    def scrape(self, **kwargs):
+        response = self.client.get(self.url, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response.content
+
+    def test_requests_are_counted_by_route_and_status(self) -> None:
+        labels = (('method', 'GET'), ('route', 'job-list'), ('status', '200'))
+        before = sample_values(self.scrape(), 'workflow_http_requests_total').get(labels, 0)
+
+        self.client.get(reverse('job-list'))
+        self.client.get(reverse('job-list'))
+
+        content = self.scrape()
+        self.assertEqual(sample_values(content, 'workflow_http_requests_total')[labels], before + 2)
+        self.assertIn(
+            (('le', '+Inf'), ('method', 'GET'), ('route', 'job-list')),
+            sample_values(content, 'workflow_http_request_duration_seconds_bucket')
+        )
+        self.assertIn((('le', '2.0'), ('route', 'job-list')), sample_values(content, 'workflow_db_queries_per_request_bucket'))
+
+    def test_response_cache_lookups_and_hit_ratio_are_exposed(self) -> None:
+        self.client.get(reverse('job-list'))
+        self.client.get(reverse('job-list'))
+
+        content = self.scrape()
+        lookups = sample_values(content, 'workflow_response_cache_lookups_total')
+        ratio = sample_values(content, 'workflow_response_cache_hit_ratio')[()]
+
+        self.assertEqual(ratio, lookups[(('result', 'hit'),)] / sum(lookups.values()))
+
+    def test_unknown_urls_share_a_single_route(self) -> None:
+        self.client.get('/unknown/123')
+
+        self.assertIn(
+            (('method', 'GET'), ('route', 'unmatched'), ('status', '404')),
+            sample_values(self.scrape(), 'workflow_http_requests_total')
+        )
+
+    def test_unknown_methods_share_a_single_label(self) -> None:
+        self.client.generic('PURGE', reverse('job-list'))
+        self.client.generic('BREW', reverse('job-list'))
+
+        content = self.scrape()
+        methods = {dict(labels)['method'] for labels in sample_values(content, 'workflow_http_requests_total')}
+        self.assertIn('other', methods)
+        self.assertNotIn('PURGE', methods)
+        self.assertNotIn('BREW', methods)
+
+    @override_settings(METRICS={'ENABLED': True, 'TOKEN': 'secret'})
+    def test_scrapes_require_the_token_when_configured(self) -> None:
+        response = self.client.get(self.url, HTTP_AUTHORIZATION='Bearer wrong')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.scrape(HTTP_AUTHORIZATION='Bearer secret')
+
+    @override_settings(METRICS={'ENABLED': False, 'TOKEN': None})
+    def test_metrics_can_be_disabled(self) -> None:
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class MultiProcessMetricsTest(APITestCase):
+    def setUp(self) -> None:
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    def run_worker(self):
+        environment = {**os.environ, 'PROMETHEUS_MULTIPROC_DIR': self.path}
+        process = subprocess.run([sys.executable, '-c', WORKER], cwd=settings.BASE_DIR, env=environment)
+        self.assertEqual(process.returncode, 0)
+
+    def test_metrics_of_the_workers_are_aggregated(self) -> None:
+        self.run_worker()
+        self.run_worker()
+
+        with mock.patch.dict(os.environ, {'PROMETHEUS_MULTIPROC_DIR': self.path}):
+            content = render_metrics()
+
+        labels = (('method', 'GET'), ('route', 'job-list'), ('status', '200'))
+        self.assertEqual(sample_values(content, 'workflow_http_requests_total')[labels], 2)
+        self.assertEqual(sample_values(content, 'workflow_response_cache_hit_ratio')[()], 1.0)
+        # One in-flight gauge per worker
+        self.assertEqual(len(sample_values(content, 'workflow_http_requests_in_flight')), 2)
@@ -0,0 +1,64 @@
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.urls import reverse
+from unittest import mock
+from workflow.models import Job
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.pagination import KeysetPagination
+
+
+class KeysetPaginationTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse('job-list')
+        self.company = CompanyFactory(jobs=None)
+        self.jobs = [
+            JobFactory(company=self.company, applications=None) for _ in range(5)
+        ]
+
+    def collect(self, url, link='next'):
+        ids = []
+
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(job['id'] for job in response.data['results'])
+            url = response.data[link]
+
+        return ids
+
+    def test_pages_are_ordered_by_most_recent_first(self):
+        ids = self.collect(self.url + '?page_size=2')
+
+        expected = list(Job.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_previous_links_walk_back_to_the_first_page(self):
+        response = self.client.get(self.url + '?page_size=2')
+        first_page = [job['id'] for job in response.data['results']]
+        self.assertIsNone(response.data['previous'])
+
+        response = self.client.get(response.data['next'])
+        response = self.client.get(response.data['previous'])
+
+        self.assertEqual([job['id'] for job in response.data['results']], first_page)
+        self.assertIsNone(response.data['previous'])
+
+    def test_rows_with_identical_timestamps_are_not_skipped(self):
+        Job.objects.update(created_at=self.jobs[0].created_at)
+
+        ids = self.collect(self.url + '?page_size=2')
+
+        self.assertEqual(ids, sorted((job.id for job in self.jobs), reverse=True))
+
+    def test_page_size_is_capped(self):
+        with mock.patch.object(KeysetPagination, 'max_page_size', 3):
+            response = self.client.get(self.url + '?page_size=50')
+
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_invalid_cursors_are_rejected(self):
+        response = self.client.get(self.url + '?cursor=not-a-cursor')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
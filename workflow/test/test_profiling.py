@@ -0,0 +1,105 @@
+import os
+import time
+import shutil
+import tempfile
+from unittest import mock
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from django.conf import settings
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.views import JobList
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+PROFILING = {**settings.PROFILING, 'ENABLED': True, 'SAMPLE_RATE': 0, 'INTERVAL_MS': 0.5, 'MAX_FILES': 10}
+list_jobs = JobList.list
+
+
+# Long enough to be sampled, even while holding the GIL
+def slow_list(self, request, *args, **kwargs):
+    time.sleep(0.05)
+    return list_jobs(self, request, *args, **kwargs)
+
+
+@mock.patch.object(JobList, 'list', slow_list)
+class ProfilingMiddlewareTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.settings = override_settings(PROFILING={**PROFILING, 'DIRECTORY': self.directory})
+        self.settings.enable()
+        self.addCleanup(self.settings.disable)
+
+        JobFactory(company=CompanyFactory(jobs=None), applications=None, published_at=timezone.now())
+
+    def profiles(self):
+        return sorted(os.listdir(self.directory))
+
+    def get_token(self, user):
+        self.client.force_authenticate(user=user)
+        response = self.client.post(reverse('monitoring-profile-token'))
+        self.client.force_authenticate(user=None)
+
+        return response
+
+    def test_requests_are_not_profiled_by_default(self) -> None:
+        self.client.get(reverse('job-list'))
+
+        self.assertEqual(self.profiles(), [])
+
+    def test_sampled_requests_are_written_as_collapsed_stacks(self) -> None:
+        with override_settings(PROFILING={**PROFILING, 'DIRECTORY': self.directory, 'SAMPLE_RATE': 1}):
+            response = self.client.get(reverse('job-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [name] = self.profiles()
+        self.assertTrue(name.startswith('job-list.') and name.endswith('.folded'))
+
+        with open(os.path.join(self.directory, name)) as file:
+            lines = file.read().splitlines()
+
+        stack, count = lines[0].rsplit(' ', 1)
+        self.assertGreater(int(count), 0)
+        self.assertIn(';slow_list (workflow/test/test_profiling.py:', stack)
+        self.assertIn('APIView.dispatch (rest_framework/views.py:', stack)
+
+    async def test_sync_views_are_sampled_in_their_thread_under_asgi(self) -> None:
+        with override_settings(PROFILING={**PROFILING, 'DIRECTORY': self.directory, 'SAMPLE_RATE': 1}):
+            response = await AsyncClient().get(reverse('job-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [name] = self.profiles()
+        with open(os.path.join(self.directory, name)) as file:
+            stacks = file.read()
+
+        self.assertIn(';slow_list (workflow/test/test_profiling.py:', stacks)
+
+    def test_requests_with_a_manager_token_are_profiled(self) -> None:
+        response = self.get_token(UserFactory(username='manager', type=UserTypes.MANAGER))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['header'], 'X-Profile')
+
+        self.client.get(reverse('job-list'), HTTP_X_PROFILE=response.data['token'])
+        self.client.get(reverse('job-list'), HTTP_X_PROFILE=response.data['token'] + 'x')
+
+        self.assertEqual(len(self.profiles()), 1)
+
+    def test_applicants_cannot_get_a_token(self) -> None:
+        response = self.get_token(UserFactory(username='applicant', type=UserTypes.APPLICANT))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_only_the_latest_profiles_are_kept(self) -> None:
+        with override_settings(PROFILING={**PROFILING, 'DIRECTORY': self.directory, 'SAMPLE_RATE': 1, 'MAX_FILES': 2}):
+            for _ in range(3):
+                self.client.get(reverse('job-list'))
+            self.client.get('/unknown')
+
+        profiles = self.profiles()
+        self.assertEqual(len(profiles), 2)
+        self.assertEqual(sum(name.startswith('unmatched.') for name in profiles), 1)
@@ -0,0 +1,76 @@
+from rest_framework.test import APIClient, APITestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class QueryIndexesTest(APITestCase):
+    """
+    Runs each list view, then EXPLAINs its main query to make sure the
+    database can answer it from an index instead of a full table scan.
+    """
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.company = CompanyFactory(jobs=None)
+        self.job = JobFactory(company=self.company, applications=None, published_at=timezone.now())
+        self.applicant = UserFactory(username='applicant', type=UserTypes.APPLICANT)
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+        ApplicationFactory(applicant=self.applicant, job=self.job)
+
+    def explain(self, sql) -> str:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # Tiny test tables are always cheaper to scan sequentially
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('EXPLAIN ' + sql)
+            else:
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+
+            return '\n'.join(str(row[-1]) for row in cursor.fetchall())
+
+    def assertMainQueryUsesIndex(self, url, table, index) -> None:
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+
+        main_query = next(
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT "%s"."id"' % table)
+        )
+
+        self.assertIn(index, self.explain(main_query))
+
+    def test_job_list_uses_the_created_at_index(self) -> None:
+        self.assertMainQueryUsesIndex(reverse('job-list'), 'workflow_job', 'job_created_idx')
+
+    def test_company_list_uses_the_created_at_index(self) -> None:
+        self.assertMainQueryUsesIndex(reverse('company-list'), 'workflow_company', 'company_created_idx')
+
+    def test_company_job_list_uses_the_company_index(self) -> None:
+        url = reverse('company-job-list', kwargs={'pk': self.company.id})
+
+        self.assertMainQueryUsesIndex(url, 'workflow_job', 'job_company_created_idx')
+
+    def test_application_list_of_an_applicant_uses_the_applicant_index(self) -> None:
+        self.client.force_authenticate(user=self.applicant)
+
+        self.assertMainQueryUsesIndex(reverse('application-list'), 'workflow_application', 'application_applicant_idx')
+
+    def test_application_list_of_a_manager_uses_the_created_at_index(self) -> None:
+        self.client.force_authenticate(user=self.manager)
+
+        self.assertMainQueryUsesIndex(reverse('application-list'), 'workflow_application', 'application_created_idx')
+
+    def test_filtered_job_list_uses_the_filter_index(self) -> None:
+        url = reverse('job-list') + '?category=Engineering'
+
+        self.assertMainQueryUsesIndex(url, 'workflow_job', 'job_category_idx')
+
+    def test_open_job_list_uses_the_partial_index(self) -> None:
+        url = reverse('job-list') + '?status=open'
+
+        self.assertMainQueryUsesIndex(url, 'workflow_job', 'job_open_created_idx')
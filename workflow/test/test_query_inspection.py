@@ -0,0 +1,100 @@
+import os
+import json
+import tempfile
+from unittest import mock
+from rest_framework.test import APIClient, APITestCase
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.inspection import NPlusOneQueries, NPlusOneWarning, QueryInspector, normalize_sql
+from workflow.models import Company
+from workflow.views import CompanyList
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+INSPECTED = {**settings.QUERY_INSPECTION, 'ENABLED': True, 'ACTION': 'raise', 'N_PLUS_ONE_THRESHOLD': 5}
+
+
+class NormalizeSQLTest(APITestCase):
+    def test_queries_differing_by_their_values_share_a_template(self) -> None:
+        self.assertEqual(
+            normalize_sql('SELECT * FROM "job" WHERE "job"."id" IN (%s, %s, %s) LIMIT 21'),
+            normalize_sql('SELECT *  FROM "job"\nWHERE "job"."id" IN (%s) LIMIT 5'),
+        )
+        self.assertEqual(normalize_sql("SELECT 'it''s' FROM \"job2\""), 'SELECT ? FROM "job2"')
+
+
+@override_settings(QUERY_INSPECTION=INSPECTED)
+class QueryInspectionTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        for company in CompanyFactory.create_batch(6, jobs=None):
+            JobFactory(company=company, applications=None, published_at=timezone.now())
+
+    def get_companies_without_prefetch(self):
+        # Embedded jobs queried once per company
+        with mock.patch.object(CompanyList, 'get_queryset', lambda view: Company.objects.order_by('id')):
+            return self.client.get(reverse('company-list'))
+
+    def test_repeated_queries_raise_with_their_origin(self) -> None:
+        with self.assertRaises(NPlusOneQueries) as raised:
+            self.get_companies_without_prefetch()
+
+        message = str(raised.exception)
+        self.assertIn('GET /companies repeated queries (more than 5 times):', message)
+        self.assertIn('6x SELECT', message)
+        self.assertIn('field CompanySerializer.jobs, view CompanyList, workflow/serializers.py:', message)
+
+    @override_settings(QUERY_INSPECTION={**INSPECTED, 'ACTION': 'warn'})
+    def test_repeated_queries_can_warn_instead(self) -> None:
+        with self.assertWarns(NPlusOneWarning), self.assertLogs('workflow.inspection', 'WARNING'):
+            response = self.get_companies_without_prefetch()
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_prefetched_lists_pass(self) -> None:
+        response = self.client.get(reverse('company-list'))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_plans_of_slow_queries_are_reported(self) -> None:
+        descriptor, path = tempfile.mkstemp(suffix='.jsonl')
+        os.close(descriptor)
+        self.addCleanup(os.remove, path)
+
+        instrumented = {**settings.REQUEST_INSTRUMENTATION, 'ENABLED': True, 'LOG': False}
+        with override_settings(
+            QUERY_INSPECTION={**INSPECTED, 'SLOW_QUERY_MS': 0, 'REPORT': path},
+            REQUEST_INSTRUMENTATION=instrumented
+        ):
+            response = self.client.get(reverse('job-list'))
+
+        with open(path) as file:
+            entries = [json.loads(line) for line in file]
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual({entry['path'] for entry in entries}, {'/jobs'})
+        self.assertTrue(all(entry['sql'].startswith('SELECT') and entry['plan'] for entry in entries))
+        # Plans are not counted as queries of the request
+        self.assertIn('db;desc="2 queries"', response['Server-Timing'])
+
+    def test_batched_writes_are_not_repeated_queries(self) -> None:
+        inspector = QueryInspector(mock.Mock(method='POST', path='/jobs/bulk'))
+        for _ in range(6):
+            inspector.record('INSERT INTO "job" ("title") VALUES (%s)', ('Data Engineer',), False, 0, {})
+            inspector.record('UPDATE "job" SET "title" = %s', [('Data Engineer',)], True, 0, {})
+
+        inspector.check()
+        self.assertEqual(inspector.templates, {})
+
+    @override_settings(JOB_BULK_CHUNK_SIZE=1)
+    def test_views_processing_chunks_opt_out(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+        company = Company.objects.first()
+        jobs = [{'company': company.id, 'title': f'Job {index}', 'category': 'Engineering'} for index in range(7)]
+
+        response = self.client.post(reverse('job-bulk'), jobs, format='json')
+
+        self.assertEqual(response.status_code, 201)
@@ -0,0 +1,93 @@
+import re
+from rest_framework.test import APIClient, APITestCase
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.test.budgets import QueryBudgetMixin
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+INSTRUMENTED = {**settings.REQUEST_INSTRUMENTATION, 'ENABLED': True, 'LOG': False}
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for entry in header.split(', '):
+        name, *params = entry.split(';')
+        metrics[name] = dict(param.split('=', 1) for param in params)
+
+    return metrics
+
+
+@override_settings(REQUEST_INSTRUMENTATION=INSTRUMENTED)
+class RequestInstrumentationTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+        self.client.force_authenticate(user=self.manager)
+
+        company = CompanyFactory(jobs=None)
+        JobFactory.create_batch(3, company=company, applications=None, published_at=timezone.now())
+
+    def test_responses_carry_a_server_timing_header(self) -> None:
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('job-list'))
+
+        metrics = parse_server_timing(response['Server-Timing'])
+
+        self.assertEqual(list(metrics), ['db', 'serializer', 'view', 'total'])
+        self.assertEqual(metrics['db']['desc'], '"2 queries"')
+        self.assertGreater(float(metrics['serializer']['dur']), 0)
+        self.assertLessEqual(float(metrics['view']['dur']), float(metrics['total']['dur']))
+
+    @override_settings(REQUEST_INSTRUMENTATION={**INSTRUMENTED, 'LOG': True})
+    def test_requests_are_logged(self) -> None:
+        with self.assertLogs('workflow.instrumentation', 'INFO') as logs:
+            self.client.get(reverse('job-list'))
+
+        self.assertRegex(logs.output[0], r'method=GET path=/jobs route=job-list status=200 queries=2 db_ms=')
+        self.assertEqual(logs.records[0].request_metrics['queries'], 2)
+
+    def test_nested_serializers_are_timed_once(self) -> None:
+        response = self.client.get(reverse('company-list'))
+        metrics = parse_server_timing(response['Server-Timing'])
+
+        self.assertLess(float(metrics['serializer']['dur']), float(metrics['view']['dur']))
+
+    @override_settings(REQUEST_INSTRUMENTATION={**INSTRUMENTED, 'SERVER_TIMING': False})
+    def test_the_header_can_be_disabled(self) -> None:
+        response = self.client.get(reverse('job-list'))
+
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(REQUEST_INSTRUMENTATION={**INSTRUMENTED, 'ENABLED': False})
+    def test_requests_are_not_instrumented_when_disabled(self) -> None:
+        response = self.client.get(reverse('job-list'))
+
+        self.assertNotIn('Server-Timing', response)
+
+    async def test_async_views_are_instrumented(self) -> None:
+        response = await self.async_client.get(reverse('async-company-list'))
+        metrics = parse_server_timing(response['Server-Timing'])
+
+        self.assertRegex(metrics['db']['desc'], re.compile(r'"[1-9]\d* queries"'))
+        self.assertGreater(float(metrics['view']['dur']), 0)
+
+
+class QueryBudgetTest(QueryBudgetMixin, APITestCase):
+    query_budgets = {'GET job-list': 1}
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        JobFactory(company=CompanyFactory(jobs=None), applications=None, published_at=timezone.now())
+
+    def test_requests_over_budget_fail_the_test(self) -> None:
+        with self.assertRaisesMessage(self.failureException, 'GET job-list ran 2 queries, over its budget of 1.'):
+            self.client.get(reverse('job-list'))
+
+    def test_endpoints_without_budget_are_not_checked(self) -> None:
+        response = self.client.get(reverse('company-list'))
+
+        self.assertEqual(response.status_code, 200)
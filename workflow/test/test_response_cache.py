@@ -0,0 +1,109 @@
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from workflow.factories import CompanyFactory, JobFactory
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+class ResponseCacheTest(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+        self.client = APIClient()
+        self.company = CompanyFactory(jobs=None)
+        self.job = JobFactory(company=self.company, applications=None, published_at=timezone.now())
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+
+        self.list_url = reverse('job-list')
+        self.detail_url = reverse('job-detail', kwargs={'pk': self.job.id})
+        self.company_url = reverse('company-detail', kwargs={'pk': self.company.id})
+
+    def as_manager(self, method, url, data=None):
+        client = APIClient()
+        client.force_authenticate(user=self.manager)
+
+        return getattr(client, method)(url, data, format='json')
+
+    def test_anonymous_reads_are_served_from_the_cache(self) -> None:
+        for url in (self.list_url, self.detail_url, self.company_url):
+            first = self.client.get(url)
+
+            with self.assertNumQueries(0):
+                second = self.client.get(url)
+
+            self.assertEqual(second.status_code, status.HTTP_200_OK)
+            self.assertEqual(second.data, first.data)
+
+    def test_authenticated_reads_bypass_the_cache(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='applicant'))
+        self.client.get(self.detail_url)
+
+        # Validators aggregate, then the job itself
+        with self.assertNumQueries(2):
+            self.client.get(self.detail_url)
+
+    def test_unpublishing_a_job_invalidates_its_representations(self) -> None:
+        self.client.get(self.list_url)
+        self.client.get(self.detail_url)
+        self.client.get(self.company_url)
+
+        self.as_manager('patch', self.detail_url)
+
+        self.assertIsNone(self.client.get(self.list_url).data['results'][0]['published_at'])
+        self.assertIsNone(self.client.get(self.detail_url).data['published_at'])
+        self.assertEqual(self.client.get(self.company_url).data['jobs'], [])
+
+    def test_closing_a_job_invalidates_its_representations(self) -> None:
+        self.client.get(self.detail_url)
+        self.client.get(self.company_url)
+
+        self.as_manager('patch', reverse('job-close', kwargs={'pk': self.job.id}))
+
+        self.assertIsNotNone(self.client.get(self.detail_url).data['closed_at'])
+        self.assertEqual(self.client.get(self.company_url).data['jobs'], [])
+
+    def test_creating_and_deleting_jobs_invalidates_the_list(self) -> None:
+        self.client.get(self.list_url)
+
+        job = JobFactory(company=self.company, applications=None)
+        self.assertEqual(len(self.client.get(self.list_url).data['results']), 2)
+
+        job.delete()
+        self.assertEqual(len(self.client.get(self.list_url).data['results']), 1)
+
+    def test_updating_a_company_invalidates_it(self) -> None:
+        self.client.get(self.company_url)
+
+        self.as_manager('put', self.company_url, {'name': 'Renamed'})
+
+        self.assertEqual(self.client.get(self.company_url).data['name'], 'Renamed')
+
+    def test_other_entries_are_kept(self) -> None:
+        other = JobFactory(company=CompanyFactory(jobs=None), applications=None)
+        other_url = reverse('job-detail', kwargs={'pk': other.id})
+        self.client.get(other_url)
+
+        self.as_manager('patch', self.detail_url)
+
+        with self.assertNumQueries(0):
+            self.client.get(other_url)
+
+    def test_managers_can_read_the_cache_statistics(self) -> None:
+        self.client.get(self.detail_url)
+        self.client.get(self.detail_url)
+
+        response = self.as_manager('get', reverse('monitoring-cache'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['hits'], response.data['misses']), (1, 1))
+        self.assertEqual(response.data['hit_ratio'], 0.5)
+
+    def test_applicants_cannot_read_the_cache_statistics(self) -> None:
+        self.client.force_authenticate(user=UserFactory(username='applicant'))
+
+        response = self.client.get(reverse('monitoring-cache'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
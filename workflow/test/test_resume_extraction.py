@@ -0,0 +1,132 @@
+import io
+import unittest
+import shutil
+import tempfile
+import zipfile
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from workflow.contracts import ExtractionStatuses
+from workflow.extraction import create_process_pool, extract_resumes
+from workflow.extractors import pypdf
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from workflow.models import ResumeBlob, ResumeToken
+from workflow.resumes import acquire_resume
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+def docx(*paragraphs) -> bytes:
+    body = ''.join(f'<w:p><w:r><w:t>{paragraph}</w:t></w:r></w:p>' for paragraph in paragraphs)
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{body}</w:body></w:document>'
+    )
+
+    content = io.BytesIO()
+    with zipfile.ZipFile(content, 'w') as archive:
+        archive.writestr('word/document.xml', document)
+
+    return content.getvalue()
+
+
+@override_settings(RESUME_EXTRACTION={'WORKERS': 0, 'MAX_ATTEMPTS': 2})
+class ResumeExtractionTest(APITestCase):
+    def setUp(self) -> None:
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.job = JobFactory(company=CompanyFactory(jobs=None), applications=None)
+
+    def resume(self, name, content) -> ResumeBlob:
+        blob = acquire_resume(SimpleUploadedFile(name, content))
+        ApplicationFactory(job=self.job, resume=blob)
+
+        return blob
+
+    def test_text_resumes_are_normalized_and_indexed(self) -> None:
+        blob = self.resume('resume.txt', 'Senior  Python developer\n\n\nDjango and PostgreSQL'.encode())
+
+        self.assertEqual(extract_resumes([blob.pk]), (1, 0))
+
+        blob.refresh_from_db()
+        self.assertEqual(blob.extraction_status, ExtractionStatuses.DONE)
+        self.assertEqual(blob.text, 'Senior Python developer\nDjango and PostgreSQL')
+        self.assertEqual(
+            set(ResumeToken.objects.filter(blob=blob).values_list('token', flat=True)),
+            {'senior', 'python', 'developer', 'django', 'postgresql'}
+        )
+
+    def test_docx_resumes_are_extracted(self) -> None:
+        blob = self.resume('resume.docx', docx('Data engineer', 'Spark &amp; Kafka'))
+
+        extract_resumes([blob.pk])
+
+        blob.refresh_from_db()
+        self.assertEqual(blob.text, 'Data engineer\nSpark & Kafka')
+
+    def test_failures_are_recorded(self) -> None:
+        blob = self.resume('resume.docx', b'PK\x03\x04 not really a zip archive')
+
+        self.assertEqual(extract_resumes([blob.pk]), (1, 1))
+
+        blob.refresh_from_db()
+        self.assertEqual(blob.extraction_status, ExtractionStatuses.FAILED)
+        self.assertEqual(blob.extraction_attempts, 1)
+        self.assertIn('Not a DOCX file', blob.extraction_error)
+
+    @unittest.skipIf(pypdf is not None, 'pypdf is installed')
+    def test_pdf_extraction_requires_pypdf(self) -> None:
+        blob = self.resume('resume.pdf', b'%PDF-1.4\n%%EOF')
+
+        extract_resumes([blob.pk])
+
+        blob.refresh_from_db()
+        self.assertEqual(blob.extraction_status, ExtractionStatuses.FAILED)
+        self.assertIn('pypdf', blob.extraction_error)
+
+    def test_extraction_runs_in_worker_processes(self) -> None:
+        blobs = [self.resume(f'resume-{n}.txt', f'Resume number {n}'.encode()) for n in range(3)]
+
+        with create_process_pool(2) as executor:
+            self.assertEqual(extract_resumes([blob.pk for blob in blobs], executor), (3, 0))
+
+        self.assertEqual(ResumeToken.objects.filter(token='resume').count(), 3)
+
+    def test_the_command_processes_pending_and_failed_resumes(self) -> None:
+        pending = self.resume('pending.txt', b'Pending resume')
+        failed = self.resume('failed.docx', b'PK\x03\x04 broken')
+        done = self.resume('done.txt', b'Done resume')
+        extract_resumes([failed.pk, done.pk])
+
+        call_command('extract_resumes', workers=0, stdout=io.StringIO())
+
+        statuses = dict(ResumeBlob.objects.values_list('pk', 'extraction_status'))
+        attempts = dict(ResumeBlob.objects.values_list('pk', 'extraction_attempts'))
+        self.assertEqual(statuses[pending.pk], ExtractionStatuses.DONE)
+        self.assertEqual(attempts[failed.pk], 2)
+        self.assertEqual(attempts[done.pk], 1)
+
+        # Out of attempts
+        call_command('extract_resumes', workers=0, stdout=io.StringIO())
+        self.assertEqual(ResumeBlob.objects.get(pk=failed.pk).extraction_attempts, 2)
+
+    def test_managers_can_search_applications_by_resume_content(self) -> None:
+        python = self.resume('python.txt', b'Python and Django developer')
+        self.resume('java.txt', b'Java developer')
+        extract_resumes(ResumeBlob.objects.values_list('pk', flat=True))
+
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(username='manager', type=UserTypes.MANAGER))
+
+        response = client.get(reverse('application-list'), {'q': 'django developer'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([application['id'] for application in response.data['results']],
+                         list(python.applications.values_list('id', flat=True)))
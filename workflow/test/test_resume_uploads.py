@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from workflow.models import Application, ResumeBlob
+from workflow.factories import CompanyFactory, JobFactory
+from workflow.contracts import ApplicationStatuses
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+PDF = b'%PDF-1.4\n' + b'resume content\n' * 100
+
+
+class ResumeUploadTest(APITestCase):
+    def setUp(self) -> None:
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.client = APIClient()
+        self.url = reverse('application-list')
+        self.job = JobFactory(company=CompanyFactory(jobs=None), applications=None, published_at=timezone.now())
+
+    def apply(self, content, name='resume.pdf', username='applicant'):
+        applicant = UserFactory(username=username, type=UserTypes.APPLICANT)
+        self.client.force_authenticate(user=applicant)
+
+        return self.client.post(self.url, {
+            'job': self.job.id,
+            'applicant': applicant.id,
+            'status': ApplicationStatuses.APPLIED,
+            'resume': SimpleUploadedFile(name, content, content_type='application/pdf'),
+        }, format='multipart')
+
+    def test_resumes_are_stored_under_their_content_address(self) -> None:
+        response = self.apply(PDF)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        blob = ResumeBlob.objects.get()
+        self.assertEqual(blob.content_type, 'application/pdf')
+        self.assertEqual(blob.size, len(PDF))
+        self.assertEqual(blob.file.name, f'resumes/{blob.sha256[:2]}/{blob.sha256[2:4]}/{blob.sha256}.pdf')
+        self.assertTrue(response.data['resume'].endswith(f'/applications/{response.data["id"]}/resume'))
+
+        with blob.file.open() as file:
+            self.assertEqual(file.read(), PDF)
+
+    def test_identical_resumes_are_stored_once(self) -> None:
+        self.apply(PDF, username='first')
+        self.apply(PDF, name='other-name.pdf', username='second')
+
+        blob = ResumeBlob.objects.get()
+        self.assertEqual(blob.references, 2)
+        self.assertEqual(Application.objects.filter(resume=blob).count(), 2)
+        self.assertEqual(len(os.listdir(os.path.dirname(blob.file.path))), 1)
+
+    def test_resumes_are_deleted_with_their_last_application(self) -> None:
+        self.apply(PDF, username='first')
+        self.apply(PDF, username='second')
+        path = ResumeBlob.objects.get().file.path
+
+        first, second = Application.objects.order_by('id')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(ResumeBlob.objects.get().references, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(ResumeBlob.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+    @override_settings(RESUME_UPLOAD={'MAX_SIZE': 1024, 'CONTENT_TYPES': ['application/pdf']})
+    def test_oversized_resumes_are_rejected(self) -> None:
+        response = self.apply(PDF + b'x' * 1024)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Application.objects.exists())
+        self.assertFalse(ResumeBlob.objects.exists())
+
+    def test_resumes_are_typed_by_their_content(self) -> None:
+        response = self.apply(b'\x89PNG\r\n\x1a\n\x00\x00', name='resume.pdf')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ResumeBlob.objects.exists())
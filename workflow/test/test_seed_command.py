@@ -0,0 +1,74 @@
+import io
+from django.core.management import CommandError, call_command
+from django.db.models import F, Sum
+from rest_framework.test import APITestCase
+from authentication.models import User
+from workflow.counters import reconcile_job_counters
+from workflow.models import Application, ApplicationRollup, ApplicationStatusChange, Company, Job
+
+VOLUMES = {'companies': 3, 'jobs': 40, 'managers': 1, 'applicants': 10, 'applications': 300}
+
+
+def seed(**options):
+    call_command('seed', until='2026-10-01', stdout=io.StringIO(), stderr=io.StringIO(), **{**VOLUMES, **options})
+
+
+def snapshot():
+    return (
+        list(Company.objects.order_by('pk').values_list('pk', 'name', 'address', 'created_at')),
+        list(User.objects.order_by('pk').values_list('pk', 'username', 'type', 'first_name', 'date_joined')),
+        list(Job.objects.order_by('pk').values_list('pk', 'company', 'title', 'published_at', 'closed_at', 'applications_count')),
+        list(Application.objects.order_by('pk').values_list('pk', 'job', 'applicant', 'status', 'created_at')),
+        list(ApplicationStatusChange.objects.order_by('changed_at', 'status').values_list('application', 'status', 'changed_at')),
+    )
+
+
+class SeedCommandTest(APITestCase):
+    def setUp(self) -> None:
+        seed(seed=1)
+
+    def test_the_same_seed_generates_the_same_data(self) -> None:
+        seeded = snapshot()
+        for model in (ApplicationRollup, ApplicationStatusChange, Application, Job, Company, User):
+            model.objects.all().delete()
+
+        seed(seed=1)
+        self.assertEqual(snapshot(), seeded)
+
+        Application.objects.all().delete()
+        User.objects.all().delete()
+        seed(seed=2)
+        self.assertNotEqual(snapshot()[3], seeded[3])
+
+    def test_volumes_are_seeded_with_consistent_counters_and_rollups(self) -> None:
+        self.assertEqual(Company.objects.count(), 3)
+        self.assertEqual(Job.objects.count(), 40)
+        self.assertEqual(User.objects.filter(username__startswith='seed-applicant-').count(), 10)
+        self.assertEqual(Application.objects.count(), 300)
+
+        self.assertEqual(reconcile_job_counters(Job.objects.values_list('pk', flat=True)), [])
+        totals = ApplicationRollup.objects.aggregate(created=Sum('created'), entered=Sum('entered'))
+        self.assertEqual(totals, {'created': 300, 'entered': ApplicationStatusChange.objects.count()})
+
+    def test_applications_are_made_while_their_job_is_open(self) -> None:
+        applications = Application.objects.all()
+
+        self.assertFalse(applications.filter(job__published_at__isnull=True).exists())
+        self.assertFalse(applications.filter(created_at__lt=F('job__published_at')).exists())
+        self.assertFalse(applications.filter(created_at__gt=F('job__closed_at')).exists())
+
+    def test_statuses_follow_the_given_weights_and_the_funnel(self) -> None:
+        seed(prefix='offers', statuses='offer=1')
+        offers = Application.objects.filter(applicant__username__startswith='offers-')
+
+        self.assertEqual(set(offers.values_list('status', flat=True)), {'offer'})
+        self.assertEqual(
+            list(ApplicationStatusChange.objects.filter(application=offers[0]).order_by('changed_at').values_list('status', flat=True)),
+            ['applied', 'in_review', 'waiting', 'offer']
+        )
+
+    def test_invalid_options_are_rejected(self) -> None:
+        with self.assertRaisesMessage(CommandError, 'Users prefixed with "seed-" exist already'):
+            seed()
+        with self.assertRaisesMessage(CommandError, 'Unknown status "hired"'):
+            seed(prefix='other', statuses='applied=1,hired=2')
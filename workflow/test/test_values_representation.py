@@ -0,0 +1,101 @@
+import datetime
+import json
+from zoneinfo import ZoneInfo
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
+from django.urls import reverse
+from django.utils import timezone
+from workflow.factories import ApplicationFactory, CompanyFactory, JobFactory
+from workflow.models import Application, Job, ResumeBlob
+from workflow.representations import ValuesRepresentation
+from workflow.serializers import ApplicationSerializer, JobSerializer
+from workflow.contracts import ApplicationStatuses, JobContracts
+from authentication.contracts import UserTypes
+from authentication.factories import UserFactory
+
+
+def render(data):
+    return json.loads(JSONRenderer().render(data))
+
+
+class ValuesRepresentationTest(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.company = CompanyFactory(jobs=None)
+        self.manager = UserFactory(username='manager', type=UserTypes.MANAGER)
+        self.applicant = UserFactory(username='applicant', type=UserTypes.APPLICANT)
+
+        self.job = JobFactory(
+            company=self.company,
+            applications=None,
+            contract=JobContracts.FIXED,
+            description=None,
+            published_at=datetime.datetime(2024, 3, 1, 9, 30, 15, 123456, tzinfo=ZoneInfo('Europe/Paris'))
+        )
+        JobFactory(company=self.company, applications=None, published_at=timezone.now(), closed_at=timezone.now())
+
+        blob = ResumeBlob.objects.create(
+            sha256='a' * 64,
+            file='resumes/resume.txt',
+            size=5,
+            content_type='text/plain',
+            references=1
+        )
+
+        ApplicationFactory(applicant=self.applicant, job=self.job, resume=blob)
+        ApplicationFactory(applicant=self.applicant, job=self.job, status=ApplicationStatuses.IN_REVIEW)
+
+    def make_request(self, user):
+        request = Request(APIRequestFactory().get('/'))
+        request.user = user
+        return request
+
+    def assertSameRepresentation(self, serializer_class, queryset, user) -> None:
+        context = {'request': self.make_request(user)}
+        representation = ValuesRepresentation(serializer_class(context=context))
+
+        expected = render(serializer_class(queryset.order_by('id'), many=True, context=context).data)
+        actual = render([
+            representation.to_representation(row)
+            for row in queryset.order_by('id').values(*representation.columns)
+        ])
+
+        self.assertEqual(actual, expected)
+        # Same keys, in the same order
+        self.assertEqual([list(item) for item in actual], [list(item) for item in expected])
+
+    def test_jobs_are_represented_like_the_model_serializer(self) -> None:
+        for user in (self.manager, self.applicant):
+            self.assertSameRepresentation(JobSerializer, Job.objects.all(), user)
+
+    def test_applications_are_represented_like_the_model_serializer(self) -> None:
+        self.assertSameRepresentation(ApplicationSerializer, Application.objects.all(), self.manager)
+
+    def test_list_endpoints_are_represented_like_the_model_serializer(self) -> None:
+        for name, serializer_class, model in (
+            ('job-list', JobSerializer, Job),
+            ('application-list', ApplicationSerializer, Application),
+        ):
+            self.client.force_authenticate(user=self.manager)
+            response = self.client.get(reverse(name))
+
+            ids = [item['id'] for item in response.json()['results']]
+            instances = sorted(model.objects.filter(pk__in=ids), key=lambda instance: ids.index(instance.pk))
+            expected = render(serializer_class(instances, many=True, context={'request': response.wsgi_request}).data)
+
+            self.assertEqual(response.json()['results'], expected)
+
+    def test_values_rows_do_not_load_the_search_vector(self) -> None:
+        representation = ValuesRepresentation(JobSerializer(context={'request': self.make_request(self.manager)}))
+
+        self.assertNotIn('search_vector', representation.columns)
+
+    def test_searches_paginate_over_values_rows(self) -> None:
+        JobFactory.create_batch(3, company=self.company, applications=None, title='Python developer')
+
+        response = self.client.get(reverse('job-list'), {'q': 'python', 'page_size': 2})
+        following = self.client.get(response.json()['next'])
+
+        ids = [item['id'] for item in response.json()['results'] + following.json()['results']]
+        self.assertEqual(len(set(ids)), 3)
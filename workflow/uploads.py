@@ -0,0 +1,63 @@
+import hashlib
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from django.http.multipartparser import MultiPartParserError
+from workflow.resumes import InvalidResume, check_content_type, check_size, detect_content_type
+
+
+class ResumeUploadHandler(FileUploadHandler):
+    """
+    Streams `resume` uploads to a temporary file in chunks, hashing them on
+    the way. The type is checked on the first chunk and the size on every
+    chunk, so an invalid upload is rejected before the rest of the body is
+    read. Files of other fields go to the next handlers.
+    """
+    field_name = 'resume'
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+
+        self.active = field_name == self.field_name
+        if not self.active:
+            return
+
+        self.file = TemporaryUploadedFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+        self.digest = hashlib.sha256()
+        self.detected_type = None
+
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.active:
+            return raw_data
+
+        try:
+            if start == 0:
+                self.detected_type = detect_content_type(raw_data)
+                check_content_type(self.detected_type)
+            check_size(start + len(raw_data))
+        except InvalidResume as exc:
+            self.file.close()
+            raise MultiPartParserError(str(exc))
+
+        self.digest.update(raw_data)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        if not self.active:
+            return None
+
+        if not file_size:
+            self.file.close()
+            raise MultiPartParserError('The submitted file is empty.')
+
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.digest.hexdigest()
+        self.file.content_type = self.detected_type
+
+        return self.file
+
+    def upload_interrupted(self):
+        if getattr(self, 'active', False) and not self.file.closed:
+            self.file.close()
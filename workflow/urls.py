@@ -1,15 +1,29 @@
 from django.urls import path
 from rest_framework.urlpatterns import format_suffix_patterns
-from workflow import views
+from workflow import async_views, views
 
 urlpatterns = [
     path('companies', views.CompanyList.as_view(), name='company-list'),
     path('companies/<int:pk>', views.CompanyDetail.as_view(), name='company-detail'),
+    path('companies/<int:pk>/stats', views.CompanyStats.as_view(), name='company-stats'),
+    path('companies/<int:pk>/jobs', views.CompanyJobList.as_view(), name='company-job-list'),
     path('jobs', views.JobList.as_view(), name='job-list'),
+    path('jobs/bulk', views.JobBulkCreate.as_view(), name='job-bulk'),
     path('jobs/<int:pk>', views.JobDetail.as_view(), name='job-detail'),
     path('jobs/<int:pk>/close', views.JobCloseApplications.as_view(), name='job-close'),
     path('applications', views.ApplicationList.as_view(), name='application-list'),
+    path('applications/transitions', views.ApplicationTransition.as_view(), name='application-transition'),
     path('applications/<int:pk>', views.ApplicationDetail.as_view(), name='application-detail'),
+    path('applications/<int:pk>/resume', views.ApplicationResume.as_view(), name='application-resume'),
+    path('monitoring/cache', views.CacheStats.as_view(), name='monitoring-cache'),
+    path('monitoring/db', views.DatabaseStats.as_view(), name='monitoring-db'),
+    path('monitoring/profile-token', views.ProfileToken.as_view(), name='monitoring-profile-token'),
+    path('metrics', views.Metrics.as_view(), name='metrics'),
+    path('async/companies', async_views.AsyncCompanyList.as_view(), name='async-company-list'),
+    path('async/companies/<int:pk>', async_views.AsyncCompanyDetail.as_view(), name='async-company-detail'),
+    path('async/jobs', async_views.AsyncJobList.as_view(), name='async-job-list'),
+    path('async/jobs/<int:pk>', async_views.AsyncJobDetail.as_view(), name='async-job-detail'),
+    path('async/applications', async_views.AsyncApplicationList.as_view(), name='async-application-list'),
 ]
 
 urlpatterns = format_suffix_patterns(urlpatterns)
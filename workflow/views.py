@@ -1,40 +1,160 @@
+import hmac
+import datetime
 from workflow.models import Application, Company, Job
-from workflow.serializers import ApplicationSerializer, CompanySerializer, JobSerializer
-from workflow.permissions import IsManagerOrReadOnly, IsManagerOrOwnerOfApplication, CanApplyToJobs
+from workflow.serializers import ApplicationSerializer, ApplicationTransitionSerializer, CompanySerializer, JobSerializer
+from workflow.bulk import create_jobs, transition_applications
+from workflow.cache import CachedResponseMixin, response_cache
+from workflow.conditional import ConditionalGetMixin
+from workflow.connections import database_stats
+from workflow.downloads import serve_file
+from workflow.filters import JobFilter, JobSearchFilter, ResumeSearchFilter
+from workflow.metrics import CONTENT_TYPE, render_metrics
+from workflow.parsers import JSONParser, NDJSONParser
+from workflow.representations import ValuesListMixin
+from workflow.resumes import EXTENSIONS
+from workflow.rollups import company_stats
+from workflow.profiling import HEADER as PROFILE_HEADER, make_profile_token
+from workflow.permissions import IsManager, IsManagerOrReadOnly, IsManagerOrOwnerOfApplication, CanApplyToJobs
 from authentication.contracts import UserTypes
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.views import View
 
 
-class CompanyList(generics.ListCreateAPIView):
-    queryset = Company.objects.all()
+class CompanyList(ConditionalGetMixin, generics.ListCreateAPIView):
     serializer_class = CompanySerializer
     permission_classes = [
         permissions.IsAuthenticatedOrReadOnly,
         IsManagerOrReadOnly
     ]
 
+    conditional_related = ('jobs',)
 
-class CompanyDetail(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Company.objects.all()
+    def get_queryset(self):
+        return Company.objects.with_jobs_summary()
+
+
+class CompanyDetail(CachedResponseMixin, ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = CompanySerializer
     permission_classes = [
         permissions.IsAuthenticatedOrReadOnly,
         IsManagerOrReadOnly
     ]
 
+    def get_cache_scopes(self):
+        return [f'company:{self.kwargs["pk"]}']
+
+    conditional_related = ('jobs',)
+
+    def get_queryset(self):
+        return Company.objects.with_jobs_summary()
+
+
+class CompanyJobList(ConditionalGetMixin, ValuesListMixin, generics.ListAPIView):
+    serializer_class = JobSerializer
+    filter_backends = [JobFilter, JobSearchFilter]
+    permission_classes = [
+        permissions.IsAuthenticatedOrReadOnly
+    ]
+
+    def get_queryset(self):
+        company = get_object_or_404(Company.objects.only('pk'), pk=self.kwargs['pk'])
+
+        return Job.objects.filter(company=company)
+
+
+class CompanyStats(generics.GenericAPIView):
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsManager
+    ]
+
+    default_days = 30
+    max_days = 366
+
+    def get(self, request, *args, **kwargs):
+        company = get_object_or_404(Company.objects.only('pk'), pk=self.kwargs['pk'])
+        since, until = self.get_period()
+
+        return Response(company_stats(company.pk, since, until), status=status.HTTP_200_OK)
+
+    def get_period(self):
+        errors = {}
+
+        until = self.parse_day('until', errors) or timezone.localdate()
+        since = self.parse_day('since', errors) or until - datetime.timedelta(days=self.default_days - 1)
+
+        if not errors and not 0 <= (until - since).days < self.max_days:
+            errors['since'] = [f'Must be before until, and at most {self.max_days} days before it.']
 
-class JobList(generics.ListCreateAPIView):
+        if errors:
+            raise ValidationError(errors)
+
+        return since, until
+
+    def parse_day(self, name, errors):
+        if name not in self.request.query_params:
+            return None
+
+        try:
+            return datetime.date.fromisoformat(self.request.query_params[name])
+        except ValueError:
+            errors[name] = ['Must be an ISO 8601 date.']
+
+
+class JobList(CachedResponseMixin, ConditionalGetMixin, ValuesListMixin, generics.ListCreateAPIView):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
+    filter_backends = [JobFilter, JobSearchFilter]
     permission_classes = [
         permissions.IsAuthenticatedOrReadOnly,
         IsManagerOrReadOnly
     ]
 
+    def get_cache_scopes(self):
+        return ['jobs']
+
+
+class JobBulkCreate(generics.GenericAPIView):
+    serializer_class = JobSerializer
+    parser_classes = [JSONParser, NDJSONParser]
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsManager
+    ]
+
+    # The same queries run once per chunk, by design
+    query_inspection = False
+
+    def post(self, request, *args, **kwargs):
+        items = request.data
+
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'non_field_errors': ['Expected a non-empty list of jobs.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(items) > settings.JOB_BULK_MAX_ITEMS:
+            return Response(
+                {'non_field_errors': [f'At most {settings.JOB_BULK_MAX_ITEMS} jobs can be created at once.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        jobs, errors = create_jobs(items, settings.JOB_BULK_CHUNK_SIZE, self.get_serializer_context())
+
+        return Response(
+            {'created': len(jobs), 'ids': [job.id for job in jobs], 'errors': errors},
+            status=status.HTTP_201_CREATED if jobs else status.HTTP_400_BAD_REQUEST
+        )
 
-class JobDetail(generics.RetrieveUpdateDestroyAPIView):
+
+class JobDetail(CachedResponseMixin, ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
     permission_classes = [
@@ -42,6 +162,9 @@ class JobDetail(generics.RetrieveUpdateDestroyAPIView):
         IsManagerOrReadOnly
     ]
 
+    def get_cache_scopes(self):
+        return [f'job:{self.kwargs["pk"]}']
+
     def patch(self, request, *args, **kwargs):
         job = self.get_object()
 
@@ -76,28 +199,149 @@ class JobCloseApplications(generics.UpdateAPIView):
         return Response({}, status=status.HTTP_200_OK)
 
 
-class ApplicationList(generics.ListCreateAPIView):
+class ApplicationList(ConditionalGetMixin, ValuesListMixin, generics.ListCreateAPIView):
     queryset = Application.objects.all()
     serializer_class = ApplicationSerializer
+    filter_backends = [ResumeSearchFilter]
     permission_classes = [
         permissions.IsAuthenticated,
         CanApplyToJobs
     ]
 
-    def list(self, request, *args, **kwargs):
-        queryset = Application.objects.filter(applicant_id=request.user.id)
+    def get_queryset(self):
+        queryset = super().get_queryset()
 
-        if request.user.type == UserTypes.MANAGER:
-            queryset = self.get_queryset()
+        if self.request.user.type != UserTypes.MANAGER:
+            queryset = queryset.filter(applicant_id=self.request.user.id)
 
-        serializer = ApplicationSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return queryset
 
 
-class ApplicationDetail(generics.RetrieveUpdateDestroyAPIView):
+class ApplicationDetail(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Application.objects.all()
     serializer_class = ApplicationSerializer
     permission_classes = [
         permissions.IsAuthenticated,
         IsManagerOrOwnerOfApplication
     ]
+
+    def get_conditional_queryset(self):
+        queryset = super().get_conditional_queryset()
+
+        # Never confirm an application to someone who may not read it
+        if self.request.user.type != UserTypes.MANAGER:
+            queryset = queryset.filter(applicant_id=self.request.user.id)
+
+        return queryset
+
+
+class ApplicationResume(generics.RetrieveAPIView):
+    queryset = Application.objects.select_related('resume')
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsManagerOrOwnerOfApplication
+    ]
+
+    def get(self, request, *args, **kwargs):
+        application = self.get_object()
+        blob = application.resume
+
+        if blob is None:
+            raise Http404
+
+        # Blobs are content-addressed, so the digest is a strong validator
+        return serve_file(
+            request,
+            blob.file,
+            content_type=blob.content_type,
+            etag=blob.sha256,
+            last_modified=int(blob.created_at.timestamp()),
+            filename=f'resume-{application.pk}.{EXTENSIONS.get(blob.content_type, "bin")}'
+        )
+
+
+class ApplicationTransition(generics.GenericAPIView):
+    queryset = Application.objects.all()
+    serializer_class = ApplicationTransitionSerializer
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsManager
+    ]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = self.get_queryset()
+        if 'job' in data:
+            queryset = queryset.filter(job=data['job'])
+        if 'from_status' in data:
+            queryset = queryset.filter(status=data['from_status'])
+
+        # Explicit ids are capped by the serializer, the applications of a job per call
+        limit = None if 'ids' in data else settings.APPLICATION_TRANSITION_MAX_ITEMS
+        updated, rejected, has_more = transition_applications(queryset, data['status'], data.get('ids'), limit)
+
+        return Response(
+            {'status': data['status'], 'updated': updated, 'rejected': rejected, 'has_more': has_more},
+            status=status.HTTP_200_OK
+        )
+
+
+class CacheStats(generics.GenericAPIView):
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsManager
+    ]
+
+    def get(self, request, *args, **kwargs):
+        return Response(response_cache.stats(), status=status.HTTP_200_OK)
+
+
+class DatabaseStats(generics.GenericAPIView):
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsManager
+    ]
+
+    def get(self, request, *args, **kwargs):
+        return Response(database_stats(), status=status.HTTP_200_OK)
+
+
+class ProfileToken(generics.GenericAPIView):
+    """
+    Signed token that gets the requests carrying it profiled, see
+    `workflow.profiling.ProfilingMiddleware`.
+    """
+    permission_classes = [
+        permissions.IsAuthenticated,
+        IsManager
+    ]
+
+    def post(self, request, *args, **kwargs):
+        if not settings.PROFILING['ENABLED']:
+            raise Http404
+
+        return Response({
+            'header': PROFILE_HEADER,
+            'token': make_profile_token(request.user),
+            'expires_in': settings.PROFILING['TOKEN_MAX_AGE'],
+        }, status=status.HTTP_201_CREATED)
+
+
+class Metrics(View):
+    """
+    Prometheus scrape endpoint, outside of the REST framework: scrapers
+    negotiate their own text formats.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if not settings.METRICS['ENABLED']:
+            raise Http404
+
+        token = settings.METRICS['TOKEN']
+        if token is not None and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return HttpResponse(status=status.HTTP_401_UNAUTHORIZED, headers={'WWW-Authenticate': 'Bearer'})
+
+        return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
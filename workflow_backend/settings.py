@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.0/ref/settings/
 """
 
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
 from datetime import timedelta
 import os
 
@@ -46,6 +47,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'workflow.instrumentation.InstrumentationMiddleware',
+    'workflow.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -86,8 +89,49 @@ DATABASES = {
         'USER': os.environ.get('DB_USER'),
         'NAME': os.environ.get('DB_DATABASE'),
         'PASSWORD': os.environ.get('DB_PASSWORD'),
-        'HOST': 'postgres',
-        'PORT': '5432'
+        'HOST': os.environ.get('DB_HOST', 'postgres'),
+        'PORT': os.environ.get('DB_PORT', '5432'),
+        # Seconds a connection is kept open for the next requests of the
+        # same worker thread, checked before being reused. Must stay 0 under
+        # ASGI (connections are per thread, and sync views run in changing
+        # threads): pool with DB_POOLING=pool there instead.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 0)),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', '1') == '1',
+        'OPTIONS': {
+            'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
+        },
+    }
+}
+
+# Connection pooling: '' (persistent connections only), 'pool' (a psycopg 3
+# pool in each worker process) or 'pgbouncer' (PgBouncer in transaction
+# pooling mode, which cannot keep server-side cursors and prepared
+# statements across transactions).
+
+DB_POOLING = os.environ.get('DB_POOLING', '')
+
+if DB_POOLING == 'pool':
+    # Connections are returned to the pool after each request instead
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+        'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    }
+elif DB_POOLING == 'pgbouncer':
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    DATABASES['default']['OPTIONS']['prepare_threshold'] = None
+elif DB_POOLING:
+    raise ImproperlyConfigured(f'Unknown DB_POOLING mode: {DB_POOLING}')
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
     }
 }
 
@@ -129,6 +173,18 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded files
+
+MEDIA_URL = 'media/'
+MEDIA_ROOT = os.environ.get('MEDIA_ROOT', BASE_DIR / 'media')
+
+# `resume` uploads are hashed and checked while they are streamed to disk
+FILE_UPLOAD_HANDLERS = [
+    'workflow.uploads.ResumeUploadHandler',
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
@@ -138,8 +194,154 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'rest_framework_simplejwt.authentication.JWTStatelessUserAuthentication',
+    ],
+    # orjson-based when installed, with the stdlib behaviour otherwise
+    'DEFAULT_RENDERER_CLASSES': [
+        'workflow.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    'DEFAULT_PARSER_CLASSES': [
+        'workflow.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'workflow.pagination.KeysetPagination',
+    'PAGE_SIZE': int(os.environ.get('PAGINATION_PAGE_SIZE', 25)),
+}
+
+# Pagination
+
+PAGINATION_MAX_PAGE_SIZE = int(os.environ.get('PAGINATION_MAX_PAGE_SIZE', 100))
+
+# Response cache for anonymous reads of jobs and companies
+
+RESPONSE_CACHE = {
+    'ENABLED': os.environ.get('RESPONSE_CACHE_ENABLED', '1') == '1',
+    'ALIAS': 'default',
+    'TIMEOUT': int(os.environ.get('RESPONSE_CACHE_TIMEOUT', 300)),
+}
+
+# Bulk job ingestion (POST /jobs/bulk)
+
+JOB_BULK_CHUNK_SIZE = int(os.environ.get('JOB_BULK_CHUNK_SIZE', 1000))
+JOB_BULK_MAX_ITEMS = int(os.environ.get('JOB_BULK_MAX_ITEMS', 50000))
+
+# Bulk application status transitions (POST /applications/transitions):
+# explicit ids per request, and applications of a job moved per request
+
+APPLICATION_TRANSITION_MAX_ITEMS = int(os.environ.get('APPLICATION_TRANSITION_MAX_ITEMS', 10000))
+
+# Resume uploads
+
+RESUME_UPLOAD = {
+    'MAX_SIZE': int(os.environ.get('RESUME_MAX_SIZE', 5 * 1024 * 1024)),
+    'CONTENT_TYPES': [
+        'application/pdf',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'text/plain',
+    ],
+}
+
+# Resume text extraction: number of worker processes (0 extracts in the
+# current process) and attempts before `extract_resumes` gives up on a
+# resume. PDF extraction requires pypdf.
+
+RESUME_EXTRACTION = {
+    'WORKERS': int(os.environ.get('RESUME_EXTRACTION_WORKERS', 2)),
+    'MAX_ATTEMPTS': int(os.environ.get('RESUME_EXTRACTION_MAX_ATTEMPTS', 3)),
+}
+
+# Resume downloads (GET /applications/<pk>/resume): None to stream files
+# from Python, or 'x-accel-redirect' (nginx) / 'x-sendfile' (Apache,
+# lighttpd) to let the front proxy send them. For nginx, the prefix must
+# be an `internal` location aliasing MEDIA_ROOT.
+
+FILE_DOWNLOAD = {
+    'OFFLOAD': os.environ.get('FILE_DOWNLOAD_OFFLOAD') or None,
+    'ACCEL_REDIRECT_PREFIX': os.environ.get('FILE_DOWNLOAD_ACCEL_REDIRECT_PREFIX', '/protected/'),
+}
+
+if FILE_DOWNLOAD['OFFLOAD'] not in (None, 'x-accel-redirect', 'x-sendfile'):
+    raise ImproperlyConfigured('FILE_DOWNLOAD_OFFLOAD must be "x-accel-redirect" or "x-sendfile".')
+
+# Number of recent open jobs embedded in company representations
+
+COMPANY_EMBEDDED_JOBS = int(os.environ.get('COMPANY_EMBEDDED_JOBS', 5))
+
+# Request instrumentation: SQL query count and time, serializer, view and
+# total time of every request, logged by `workflow.instrumentation` and
+# optionally returned in a `Server-Timing` header (visible to clients).
+
+REQUEST_INSTRUMENTATION = {
+    'ENABLED': os.environ.get('REQUEST_INSTRUMENTATION_ENABLED', '0') == '1',
+    'SERVER_TIMING': os.environ.get('REQUEST_INSTRUMENTATION_SERVER_TIMING', '1') == '1',
+    'LOG': os.environ.get('REQUEST_INSTRUMENTATION_LOG', '1') == '1',
+}
+
+# Prometheus metrics (GET /metrics): request latency and status codes by
+# route, SQL queries per request, response cache lookups and requests in
+# flight. With several worker processes, PROMETHEUS_MULTIPROC_DIR must name
+# an empty directory shared by the workers (see `gunicorn.conf.py`).
+# Enabled by setting METRICS_TOKEN, which scrapes must then send as a bearer
+# token. METRICS_ENABLED=1 without a token exposes them to anyone, e.g. on a
+# private network only.
+
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN') or None
+
+METRICS = {
+    'ENABLED': os.environ.get('METRICS_ENABLED', '1' if METRICS_TOKEN else '0') == '1',
+    'TOKEN': METRICS_TOKEN,
+}
+
+# Query inspection, for development and tests: requests running the same
+# SQL template more than N_PLUS_ONE_THRESHOLD times warn (ACTION 'warn') or
+# raise `NPlusOneQueries` ('raise'), naming the serializer field or view at
+# fault. Plans of SELECT queries slower than SLOW_QUERY_MS are appended to
+# the REPORT file (JSON lines). Off unless QUERY_INSPECTION_ENABLED=1; the
+# test runner turns it on, raising (see `workflow.test.runner`).
+
+QUERY_INSPECTION = {
+    'ENABLED': os.environ.get('QUERY_INSPECTION_ENABLED', '0') == '1',
+    'ACTION': os.environ.get('QUERY_INSPECTION_ACTION', 'warn'),
+    'N_PLUS_ONE_THRESHOLD': int(os.environ.get('QUERY_INSPECTION_N_PLUS_ONE_THRESHOLD', 5)),
+    'SLOW_QUERY_MS': float(os.environ.get('QUERY_INSPECTION_SLOW_QUERY_MS', 100)),
+    'REPORT': os.environ.get('QUERY_INSPECTION_REPORT', BASE_DIR / 'slow_queries.jsonl'),
+}
+
+if QUERY_INSPECTION['ACTION'] not in ('raise', 'warn'):
+    raise ImproperlyConfigured('QUERY_INSPECTION_ACTION must be "raise" or "warn".')
+
+TEST_RUNNER = 'workflow.test.runner.TestRunner'
+
+# Sampling profiler for live requests: a share of the requests
+# (SAMPLE_RATE, 0 to 1) and requests with an `X-Profile` token from
+# POST /monitoring/profile-token (managers only, valid TOKEN_MAX_AGE
+# seconds) are profiled; collapsed stacks are written to DIRECTORY, which
+# keeps the latest MAX_FILES profiles.
+
+PROFILING = {
+    'ENABLED': os.environ.get('PROFILING_ENABLED', '0') == '1',
+    'SAMPLE_RATE': float(os.environ.get('PROFILING_SAMPLE_RATE', 0)),
+    'INTERVAL_MS': float(os.environ.get('PROFILING_INTERVAL_MS', 1)),
+    'DIRECTORY': os.environ.get('PROFILING_DIRECTORY', BASE_DIR / 'profiles'),
+    'MAX_FILES': int(os.environ.get('PROFILING_MAX_FILES', 500)),
+    'TOKEN_MAX_AGE': int(os.environ.get('PROFILING_TOKEN_MAX_AGE', 600)),
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'workflow.instrumentation': {
+            'handlers': ['console'],
+            'level': os.environ.get('REQUEST_INSTRUMENTATION_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
 }
 
 # Simple JWT Configuration
@@ -147,6 +349,7 @@ REST_FRAMEWORK = {
 SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=15),
     'ROTATE_REFRESH_TOKENS': True,
+    'TOKEN_USER_CLASS': 'authentication.authentication.TokenUser',
 }
 
 # CORS Configuration